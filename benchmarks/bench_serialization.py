@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON serialization of a large CollectionResult.
+
+Compares the original json.dumps(result.to_dict()) path with the streaming
+stdlib and orjson serializers in collector.models.
+
+Usage:
+    python benchmarks/bench_serialization.py [--items N] [--repeat R]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from collector.models import CollectionResult, NewsItem, get_serializer, orjson
+
+
+def build_result(total_items: int, sources: int = 6) -> CollectionResult:
+    """Build a result with total_items spread over several sources."""
+    result = CollectionResult(
+        date="2025-10-19",
+        last_updated="2025-10-19T17:00:00+00:00",
+        collection_status={'total_sources': sources, 'total_items': total_items}
+    )
+    per_source = total_items // sources
+    
+    for s in range(sources):
+        source = f"source{s}"
+        result.add_source_items(source, [
+            NewsItem(
+                title=f"Researchers release model {i} for multilingual reasoning — résumé",
+                summary="A new open model improves reasoning benchmarks while cutting inference cost. " * 3,
+                link=f"https://example.com/{source}/articles/{i}",
+                published="2025-10-19T10:00:00+00:00",
+                source=source
+            )
+            for i in range(per_source)
+        ])
+    
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=6000, help='Total number of items (default: 6000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per variant (default: 5)')
+    args = parser.parse_args()
+    
+    result = build_result(args.items)
+    
+    variants = {
+        'json.dumps(to_dict())': lambda: json.dumps(result.to_dict(), indent=2, ensure_ascii=False),
+        'stdlib streaming': lambda: result.to_json(serializer=get_serializer('json')),
+    }
+    if orjson is not None:
+        variants['orjson streaming'] = lambda: result.to_json(serializer=get_serializer('orjson'))
+    else:
+        print("orjson is not installed; only the stdlib variants are measured")
+    
+    expected = variants['json.dumps(to_dict())']()
+    baseline = None
+    
+    print(f"{result.get_total_items()} items, best of {args.repeat} runs")
+    for name, run in variants.items():
+        assert run() == expected, f"{name} output differs from json.dumps"
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"  {name:<24} {best * 1000:8.1f} ms  {baseline / best:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
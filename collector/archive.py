@@ -0,0 +1,295 @@
+"""
+Long-term SQLite archive of collected news items.
+Items are appended per collection date and only rewritten to correct a
+publication time resolved later, so months of history fit in one
+indexed file while the web app keeps reading the short window of day
+files materialized from it.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import json
+import logging
+import sqlite3
+import threading
+
+from collector.dedup import ExactDuplicateIndex
+from collector.models import CollectionResult, NewsItem
+from collector.published import resolved_published
+from collector.seen import item_key
+from collector.urls import url_key
+
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    source TEXT NOT NULL,
+    run INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    link TEXT NOT NULL,
+    link_key TEXT NOT NULL,
+    published TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_by_date ON items (date, source, run, position);
+CREATE INDEX IF NOT EXISTS items_by_source ON items (source, date);
+CREATE INDEX IF NOT EXISTS items_by_link ON items (link_key);
+
+CREATE TABLE IF NOT EXISTS days (
+    date TEXT PRIMARY KEY,
+    last_updated TEXT NOT NULL,
+    collection_status TEXT NOT NULL,
+    sources TEXT NOT NULL,
+    runs INTEGER NOT NULL
+);
+"""
+
+# Newest run first, then the order the source returned the items in
+_ITEM_ORDER = "date DESC, run DESC, position"
+
+
+class NewsArchive:
+    """
+    Append-only item archive backed by SQLite.
+    
+    Each collection run for a date adds the items not already archived for
+    that date and source (by canonical link or normalized title), so the
+    archive holds exactly what merged day files would. Per-date metadata
+    (last_updated, collection_status, source order) is kept alongside, so
+    a day file can be rebuilt byte for byte. All methods are thread-safe.
+    """
+    
+    def __init__(self, path):
+        """
+        Initialize the archive.
+        
+        Args:
+            path: Location of the SQLite database file (created on first use)
+        """
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first access. Caller must hold the lock."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+    
+    def close(self) -> None:
+        """Close the database connection, if open."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def add_result(self, result: CollectionResult, date: Optional[str] = None) -> int:
+        """
+        Append the items of a collection run.
+        
+        New items rank before the ones archived by earlier runs for the same
+        date, like merged day files. Archived items take over publication
+        times the run resolved for them (see resolved_published).
+        last_updated is only advanced when the run added items, corrected a
+        publication time or changed the collection status, so rebuilding the
+        day file after an unchanged run yields identical content.
+        
+        Args:
+            result: Collected result
+            date: Collection date in YYYY-MM-DD format (default: result.date)
+        
+        Returns:
+            Number of items added
+        """
+        date = date or result.date
+        status = json.dumps(result.collection_status)
+        
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                day = connection.execute(
+                    "SELECT last_updated, collection_status, sources, runs FROM days WHERE date = ?",
+                    (date,)
+                ).fetchone()
+                run = day[3] + 1 if day else 1
+                sources = list(result.sources)
+                if day:
+                    sources += [source for source in json.loads(day[2]) if source not in result.sources]
+                
+                added = 0
+                corrected = 0
+                for source, items in result.sources.items():
+                    index = ExactDuplicateIndex()
+                    resolved = resolved_published(items, result.last_updated)
+                    updates = []
+                    for row_id, title, link, published in connection.execute(
+                        "SELECT id, title, link, published FROM items WHERE date = ? AND source = ?", (date, source)
+                    ):
+                        archived = NewsItem(title, '', link, published, source)
+                        index.add(archived)
+                        new_published = resolved.get(item_key(archived))
+                        if new_published and new_published != published:
+                            updates.append((new_published, row_id))
+                    connection.executemany("UPDATE items SET published = ? WHERE id = ?", updates)
+                    corrected += len(updates)
+                    
+                    rows = [
+                        (date, source, run, position, item.title, item.summary,
+                         item.link, url_key(item.link), item.published)
+                        for position, item in enumerate(index.unique(items))
+                    ]
+                    connection.executemany(
+                        "INSERT INTO items (date, source, run, position, title, summary, "
+                        "link, link_key, published) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+                    added += len(rows)
+                
+                changed = (day is None or added or corrected
+                           or _comparable_status(day[1]) != _comparable_status(status))
+                connection.execute(
+                    "INSERT OR REPLACE INTO days (date, last_updated, collection_status, sources, runs) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (date, result.last_updated if changed else day[0], status, json.dumps(sources), run)
+                )
+        
+        logger.info(f"Archived {added} new items for {date}")
+        return added
+    
+    def _items(self, where: str, params: Iterable, limit: Optional[int] = None) -> List[NewsItem]:
+        """Run an item query with the archive's standard ordering."""
+        query = f"SELECT title, summary, link, published, source FROM items WHERE {where} ORDER BY {_ITEM_ORDER}"
+        params = list(params)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self._lock:
+            rows = self._connect().execute(query, params).fetchall()
+        return [NewsItem(*row) for row in rows]
+    
+    def dates(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Get the archived collection dates.
+        
+        Args:
+            limit: Return at most this many dates
+        
+        Returns:
+            Dates in YYYY-MM-DD format, newest first
+        """
+        query = "SELECT date FROM days ORDER BY date DESC"
+        params = []
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self._lock:
+            return [row[0] for row in self._connect().execute(query, params)]
+    
+    def items_between(self, start: str, end: str,
+                      sources: Optional[Iterable[str]] = None) -> List[NewsItem]:
+        """
+        Get items collected within a date range.
+        
+        Args:
+            start: First date, inclusive (YYYY-MM-DD)
+            end: Last date, inclusive (YYYY-MM-DD)
+            sources: Restrict to these sources (default: all)
+        
+        Returns:
+            Items, newest date first
+        """
+        where = "date BETWEEN ? AND ?"
+        params = [start, end]
+        if sources is not None:
+            sources = list(sources)
+            where += f" AND source IN ({', '.join('?' * len(sources))})"
+            params += sources
+        return self._items(where, params)
+    
+    def items_for_source(self, source: str, limit: Optional[int] = None) -> List[NewsItem]:
+        """
+        Get the archived items of one source.
+        
+        Args:
+            source: Source name
+            limit: Return at most this many items
+        
+        Returns:
+            Items, newest first
+        """
+        return self._items("source = ?", [source], limit)
+    
+    def latest(self, limit: int) -> List[NewsItem]:
+        """
+        Get the most recently archived items across all sources.
+        
+        Args:
+            limit: Number of items
+        
+        Returns:
+            Items, newest first
+        """
+        return self._items("1", [], limit)
+    
+    def items_with_link(self, link: str) -> List[NewsItem]:
+        """
+        Find archived items pointing at the same article as link.
+        
+        Args:
+            link: URL in any form; compared by canonical key
+        
+        Returns:
+            Matching items, newest first
+        """
+        key = url_key(link)
+        if not key:
+            return []
+        return self._items("link_key = ?", [key])
+    
+    def result_for_date(self, date: str) -> Optional[CollectionResult]:
+        """
+        Rebuild the merged collection result of a date.
+        
+        Args:
+            date: Collection date in YYYY-MM-DD format
+        
+        Returns:
+            CollectionResult as the day file should contain it, or None if
+            the date is not archived
+        """
+        with self._lock:
+            day = self._connect().execute(
+                "SELECT last_updated, collection_status, sources FROM days WHERE date = ?", (date,)
+            ).fetchone()
+        if day is None:
+            return None
+        
+        sources: Dict[str, List[NewsItem]] = {source: [] for source in json.loads(day[2])}
+        for item in self._items("date = ?", [date]):
+            sources.setdefault(item.source, []).append(item)
+        
+        result = CollectionResult(
+            date=date,
+            last_updated=day[0],
+            collection_status=json.loads(day[1]),
+            sources=sources
+        )
+        result.refresh_status()
+        return result
+
+
+# Status keys recomputed from the merged sources by CollectionResult.refresh_status()
+_REFRESHED_STATUS_KEYS = {'total_sources', 'successful', 'failed', 'failed_sources', 'total_items'}
+
+
+def _comparable_status(status: str) -> dict:
+    """Stored collection status without the counts that are recomputed on rebuild."""
+    return {key: value for key, value in json.loads(status).items() if key not in _REFRESHED_STATUS_KEYS}
@@ -0,0 +1,127 @@
+"""
+Per-source circuit breaker persisted across collection runs.
+Sources that keep failing are skipped until a cooldown passes, then probed
+with a single cheap attempt before being trusted again.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+import logging
+
+from collector.state import JSONStateFile
+
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker(JSONStateFile):
+    """
+    Tracks consecutive failures per source in a small JSON state file.
+    
+    The file is loaded lazily and only written back, atomically, when a
+    source's health changed.
+    
+    States:
+        closed: source is healthy, fetch normally
+        open: source failed failure_threshold runs in a row, skip it
+        half_open: cooldown elapsed, allow one single-attempt probe
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    DESCRIPTION = 'circuit state'
+    
+    def __init__(self, path, failure_threshold: int = 3, cooldown_hours: float = 24):
+        """
+        Initialize the circuit breaker.
+        
+        Args:
+            path: Location of the JSON state file
+            failure_threshold: Consecutive failed runs before a source is skipped
+            cooldown_hours: Time an open circuit waits before the next probe
+        """
+        super().__init__(path)
+        self.failure_threshold = failure_threshold
+        self.cooldown = timedelta(hours=cooldown_hours)
+    
+    def _from_json(self, data) -> Dict[str, dict]:
+        """Per-source entries of the state file."""
+        return data.get('sources', {})
+    
+    def _to_json(self, entries: Dict[str, dict]) -> dict:
+        """State file document for the per-source entries."""
+        return {'sources': entries}
+    
+    def state(self, source_name: str, now: Optional[datetime] = None) -> str:
+        """
+        Get the current circuit state of a source.
+        
+        Args:
+            source_name: Source identifier
+            now: Current time (default: now, UTC)
+            
+        Returns:
+            One of CLOSED, OPEN or HALF_OPEN
+        """
+        with self._lock:
+            entry = self._load().get(source_name)
+        
+        if not entry or entry.get('consecutive_failures', 0) < self.failure_threshold:
+            return self.CLOSED
+        
+        now = now or datetime.now(timezone.utc)
+        opened_at = datetime.fromisoformat(entry['opened_at'])
+        
+        if now - opened_at >= self.cooldown:
+            return self.HALF_OPEN
+        return self.OPEN
+    
+    def record_success(self, source_name: str) -> None:
+        """
+        Close the circuit of a source after a successful fetch.
+        
+        A source that was already healthy is left as it is, so runs without
+        any failure do not rewrite the state file.
+        
+        Args:
+            source_name: Source identifier
+        """
+        with self._lock:
+            sources = self._load()
+            entry = sources.get(source_name)
+            
+            if entry and 'healthy_since' in entry and not entry.get('consecutive_failures', 0):
+                return
+            
+            if entry and entry.get('consecutive_failures', 0) >= self.failure_threshold:
+                logger.info(f"{source_name}: Circuit closed after successful fetch")
+            
+            sources[source_name] = {
+                'consecutive_failures': 0,
+                'healthy_since': datetime.now(timezone.utc).isoformat()
+            }
+            self._dirty = True
+    
+    def record_failure(self, source_name: str) -> None:
+        """
+        Count a failed fetch, opening (or re-opening) the circuit at the threshold.
+        
+        Args:
+            source_name: Source identifier
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        
+        with self._lock:
+            entry = self._load().setdefault(source_name, {'consecutive_failures': 0})
+            entry['consecutive_failures'] = entry.get('consecutive_failures', 0) + 1
+            entry['last_failure'] = now
+            
+            if entry['consecutive_failures'] >= self.failure_threshold:
+                if entry['consecutive_failures'] == self.failure_threshold:
+                    logger.warning(f"{source_name}: Circuit opened after {self.failure_threshold} consecutive failures")
+                # Restart the cooldown, including after a failed probe
+                entry['opened_at'] = now
+            
+            self._dirty = True
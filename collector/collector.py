@@ -5,13 +5,33 @@ Manages collection from multiple sources, deduplication, and JSON generation.
 
 import os
 import json
+import asyncio
+import hashlib
 import logging
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence, Union
 from pathlib import Path
 
-from collector.models import NewsItem, CollectionResult
-from collector.fetchers import SourceFetcher
+try:
+    import aiohttp
+except ImportError:  # Optional: only needed for asyncio-native fetchers
+    aiohttp = None
+
+from collector.models import NewsItem, CollectionResult, DEFAULT_SERIALIZER, item_dicts
+from collector.fetchers import SourceFetcher, AsyncSourceFetcher, SyncFetcherAdapter
+from collector.http_cache import HTTPValidatorCache
+from collector.circuit import CircuitBreaker
+from collector.writer import compressed_siblings, link_atomic, supported_encodings, write_atomic
+from collector.seen import SeenItemsStore, item_key
+from collector.archive import NewsArchive
+from collector.fingerprint import result_fingerprint, source_fingerprint
+from collector.published import fill_missing_published, resolved_published
+from collector.dedup import DuplicateCluster, ExactDuplicateIndex, NearDuplicateDetector
 
 
 logger = logging.getLogger(__name__)
@@ -23,36 +43,90 @@ class NewsCollector:
     Handles deduplication, aggregation, and output generation.
     """
     
-    def __init__(self, data_dir: str = "data"):
+    HTTP_CACHE_FILE = 'http_cache.json'
+    CIRCUIT_STATE_FILE = 'source_health.json'
+    SEEN_ITEMS_FILE = 'seen_items.json'
+    ARCHIVE_FILE = 'archive.sqlite3'
+    INDEX_SHARD_DIR = 'index'
+    SOURCE_HEADER_FILE = 'header.json'
+    TODAY_HEADER_FILE = 'today.header.json'
+    # index.json lists days inline up to this many dates, then moves them to monthly shards
+    INDEX_SHARD_THRESHOLD = 31
+    
+    def __init__(self, data_dir: str = "data", use_http_cache: bool = True,
+                 use_circuit_breaker: bool = True, use_seen_store: bool = True,
+                 incremental: bool = False, minify: bool = False,
+                 compression: Sequence[str] = (), use_archive: bool = False,
+                 split_sources: bool = False):
         """
         Initialize the news collector.
         
         Args:
             data_dir: Directory path for storing JSON output files
+            use_http_cache: Send conditional GETs and reuse items of unchanged sources
+            use_circuit_breaker: Skip sources that failed several runs in a row
+            use_seen_store: Remember published items to keep their timestamps stable
+            incremental: Only emit items not published by an earlier run
+            minify: Write compact JSON without indentation
+            compression: Precompressed variants written next to each JSON file ('gzip', 'br')
+            use_archive: Keep every collected item in a SQLite archive and build day files from it
+            split_sources: Also write each day as per-source files plus a small header
         """
         self.data_dir = Path(data_dir)
-        self.fetchers: List[SourceFetcher] = []
+        self.fetchers: List[Union[SourceFetcher, AsyncSourceFetcher]] = []
         self.collected_items: List[NewsItem] = []
+        self.skipped_sources: List[str] = []
+        self.http_cache = (
+            HTTPValidatorCache(self.data_dir / self.HTTP_CACHE_FILE) if use_http_cache else None
+        )
+        self.circuit_breaker = (
+            CircuitBreaker(self.data_dir / self.CIRCUIT_STATE_FILE) if use_circuit_breaker else None
+        )
+        self.seen_items = (
+            SeenItemsStore(self.data_dir / self.SEEN_ITEMS_FILE) if use_seen_store or incremental else None
+        )
+        self.incremental = incremental
+        self.indent = None if minify else 2
+        self.compression = supported_encodings(compression)
+        self.near_duplicate_detector = NearDuplicateDetector()
+        self.archive = NewsArchive(self.data_dir / self.ARCHIVE_FILE) if use_archive else None
+        self.split_sources = split_sources
+        # Manifest entries of the day files written by this collector, by date
+        self.day_manifests: Dict[str, dict] = {}
         
         # Ensure data directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info(f"NewsCollector initialized with data_dir: {self.data_dir}")
     
-    def register_fetcher(self, fetcher: SourceFetcher) -> None:
+    def register_fetcher(self, fetcher: Union[SourceFetcher, AsyncSourceFetcher]) -> None:
         """
         Register a source fetcher to be used during collection.
         
         Args:
-            fetcher: SourceFetcher instance to register
+            fetcher: SourceFetcher or AsyncSourceFetcher instance to register
         """
+        if getattr(fetcher, 'http_cache', None) is None:
+            fetcher.http_cache = self.http_cache
+        
         self.fetchers.append(fetcher)
         logger.info(f"Registered fetcher: {fetcher.source_name}")
     
-    def collect_all_sources(self) -> CollectionResult:
+    def collect_all_sources(self, max_workers: int = 1,
+                            source_timeout: Optional[float] = None) -> CollectionResult:
         """
         Execute collection from all registered sources.
         
+        With max_workers > 1 the sources are fetched concurrently on a bounded
+        thread pool, so the run is bounded by the slowest source rather than
+        the sum of all of them. Results are reported in registration order
+        either way.
+        
+        Args:
+            max_workers: Number of sources to fetch in parallel (1 = sequential)
+            source_timeout: Per-source deadline in seconds for concurrent runs;
+                a source that has not finished in time is reported as failed
+            
         Returns:
             CollectionResult with aggregated data from all sources
         """
@@ -67,31 +141,302 @@ class NewsCollector:
             last_updated=current_timestamp
         )
         
+        self.skipped_sources = []
+        
+        if max_workers > 1 and len(self.fetchers) > 1:
+            outcomes = self._collect_concurrently(max_workers, source_timeout)
+        else:
+            outcomes = [self._collect_source(fetcher) for fetcher in self.fetchers]
+        
+        self._apply_outcomes(result, outcomes)
+        self._save_state()
+        
+        return result
+    
+    async def collect_all_sources_async(self, max_concurrency: int = 100,
+                                        max_workers: int = 6,
+                                        source_timeout: Optional[float] = None) -> CollectionResult:
+        """
+        Execute collection from all registered sources on one event loop.
+        
+        AsyncSourceFetcher instances run natively and share one HTTP session.
+        Blocking SourceFetcher instances are adapted automatically and run on a
+        small bounded thread pool, so threads are not created per feed.
+        
+        Args:
+            max_concurrency: Maximum number of sources in flight at once
+            max_workers: Thread pool size for adapted blocking fetchers
+            source_timeout: Per-source deadline in seconds, None for no limit
+            
+        Returns:
+            CollectionResult with aggregated data from all sources
+        """
+        logger.info(f"Starting async collection from {len(self.fetchers)} sources")
+        
+        current_date = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        current_timestamp = datetime.now(timezone.utc).isoformat()
+        
+        result = CollectionResult(
+            date=current_date,
+            last_updated=current_timestamp
+        )
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='collector')
+        
+        self.skipped_sources = []
+        
+        async def run(fetcher: AsyncSourceFetcher) -> List[NewsItem]:
+            state = self._circuit_state(fetcher.source_name)
+            if state == CircuitBreaker.OPEN:
+                return []
+            
+            max_attempts = 1 if state == CircuitBreaker.HALF_OPEN else None
+            
+            async with semaphore:
+                try:
+                    items = await asyncio.wait_for(
+                        fetcher.fetch_with_retry(max_attempts=max_attempts),
+                        timeout=source_timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(f"{fetcher.source_name}: Collection exceeded {source_timeout}s deadline")
+                    items = []
+                except Exception as e:
+                    logger.error(f"{fetcher.source_name}: Collection failed with error: {str(e)}")
+                    items = []
+            
+            self._record_health(fetcher.source_name, items)
+            return self._deduplicate_items(items)
+        
+        borrowed = []
+        
+        try:
+            async with _shared_http_session(self.fetchers) as session:
+                async_fetchers = []
+                for fetcher in self.fetchers:
+                    if not isinstance(fetcher, AsyncSourceFetcher):
+                        fetcher = SyncFetcherAdapter(fetcher, executor)
+                    elif fetcher.http_session is None:
+                        fetcher.http_session = session
+                        borrowed.append(fetcher)
+                    async_fetchers.append(fetcher)
+                
+                outcomes = await asyncio.gather(*(run(fetcher) for fetcher in async_fetchers))
+        finally:
+            # The shared session is closed now; do not leave it on the fetchers
+            for fetcher in borrowed:
+                fetcher.http_session = None
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        self._apply_outcomes(result, list(outcomes))
+        self._save_state()
+        
+        return result
+    
+    def _collect_source(self, fetcher: Union[SourceFetcher, AsyncSourceFetcher]) -> List[NewsItem]:
+        """
+        Fetch and deduplicate items from a single source.
+        
+        Args:
+            fetcher: SourceFetcher or AsyncSourceFetcher to run
+            
+        Returns:
+            List of unique NewsItem objects, empty list on failure
+        """
+        items = self._fetch_source(fetcher)
+        if items is None:
+            return []
+        
+        self._record_health(fetcher.source_name, items)
+        
+        # Deduplicate within source
+        return self._deduplicate_items(items)
+    
+    def _fetch_source(self, fetcher: Union[SourceFetcher, AsyncSourceFetcher]) -> Optional[List[NewsItem]]:
+        """
+        Fetch a single source without recording its health.
+        
+        Args:
+            fetcher: SourceFetcher or AsyncSourceFetcher to run
+            
+        Returns:
+            Fetched items (empty list on failure), or None if the circuit is open
+        """
+        state = self._circuit_state(fetcher.source_name)
+        if state == CircuitBreaker.OPEN:
+            return None
+        
+        # A half-open circuit gets one cheap probe instead of the full retry budget
+        max_attempts = 1 if state == CircuitBreaker.HALF_OPEN else None
+        
+        try:
+            if isinstance(fetcher, AsyncSourceFetcher):
+                return asyncio.run(_fetch_standalone(fetcher, max_attempts))
+            return fetcher.fetch_with_retry(max_attempts=max_attempts)
+        except Exception as e:
+            logger.error(f"{fetcher.source_name}: Collection failed with error: {str(e)}")
+            return []
+    
+    def _circuit_state(self, source_name: str) -> str:
+        """
+        Check the circuit breaker before fetching a source.
+        
+        Sources with an open circuit are logged and added to skipped_sources.
+        
+        Args:
+            source_name: Source identifier
+            
+        Returns:
+            CircuitBreaker state; always CLOSED when the breaker is disabled
+        """
+        if not self.circuit_breaker:
+            return CircuitBreaker.CLOSED
+        
+        state = self.circuit_breaker.state(source_name)
+        
+        if state == CircuitBreaker.OPEN:
+            logger.warning(f"{source_name}: Circuit open, skipping source")
+            self.skipped_sources.append(source_name)
+        elif state == CircuitBreaker.HALF_OPEN:
+            logger.info(f"{source_name}: Circuit half-open, probing with a single attempt")
+        
+        return state
+    
+    def _record_health(self, source_name: str, items: List[NewsItem]) -> None:
+        """
+        Feed the outcome of a fetch into the circuit breaker.
+        
+        Args:
+            source_name: Source identifier
+            items: Items returned by the fetch; empty counts as a failure
+        """
+        if not self.circuit_breaker:
+            return
+        
+        if items:
+            self.circuit_breaker.record_success(source_name)
+        else:
+            self.circuit_breaker.record_failure(source_name)
+    
+    def _save_state(self) -> None:
+        """Persist the HTTP cache and circuit breaker state after a run."""
+        if self.http_cache:
+            self.http_cache.save()
+        if self.circuit_breaker:
+            self.circuit_breaker.save()
+    
+    def _collect_concurrently(self, max_workers: int,
+                              source_timeout: Optional[float]) -> List[List[NewsItem]]:
+        """
+        Fetch all sources on a bounded thread pool.
+        
+        The deadline for each source starts when its worker picks it up, so
+        sources queued behind a busy pool are not penalised. Sources that miss
+        their deadline are abandoned and yield an empty list. Source health
+        is recorded here, once per source, so an abandoned worker that
+        finishes late does not count a second time.
+        
+        Args:
+            max_workers: Maximum number of worker threads
+            source_timeout: Per-source deadline in seconds, None for no limit
+            
+        Returns:
+            List of item lists, one per registered fetcher in registration order
+        """
+        started_at: Dict[int, float] = {}
+        
+        def run(index: int, fetcher: SourceFetcher) -> Optional[List[NewsItem]]:
+            started_at[index] = time.monotonic()
+            return self._fetch_source(fetcher)
+        
+        outcomes: List[List[NewsItem]] = [[] for _ in self.fetchers]
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(self.fetchers)),
+            thread_name_prefix='collector'
+        )
+        
+        try:
+            pending = {
+                executor.submit(run, index, fetcher): index
+                for index, fetcher in enumerate(self.fetchers)
+            }
+            
+            while pending:
+                wait_for = None
+                if source_timeout is not None:
+                    now = time.monotonic()
+                    deadlines = [
+                        started_at[index] + source_timeout
+                        for index in pending.values() if index in started_at
+                    ]
+                    wait_for = max(0.0, min(deadlines) - now) if deadlines else source_timeout
+                
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    index = pending.pop(future)
+                    items = future.result()
+                    if items is not None:
+                        self._record_health(self.fetchers[index].source_name, items)
+                        outcomes[index] = self._deduplicate_items(items)
+                
+                if source_timeout is None:
+                    continue
+                
+                # Abandon sources whose deadline has passed
+                now = time.monotonic()
+                for future, index in list(pending.items()):
+                    started = started_at.get(index)
+                    if started is not None and now - started >= source_timeout:
+                        fetcher = self.fetchers[index]
+                        logger.error(f"{fetcher.source_name}: Collection exceeded {source_timeout}s deadline")
+                        self._record_health(fetcher.source_name, [])
+                        future.cancel()
+                        del pending[future]
+        finally:
+            # Do not block on abandoned workers; they finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return outcomes
+    
+    def _apply_outcomes(self, result: CollectionResult,
+                        outcomes: List[List[NewsItem]]) -> None:
+        """
+        Record per-source items and collection status on the result.
+        
+        Args:
+            result: CollectionResult to populate
+            outcomes: Item lists, one per registered fetcher in registration order
+        """
         successful_sources = []
         failed_sources = []
         total_items = 0
+        new_items = 0
+        # Undated items are stamped with the run time, which tells stamps from real dates later
+        run_time = datetime.fromisoformat(result.last_updated)
         
-        # Collect from each source
-        for fetcher in self.fetchers:
-            try:
-                items = fetcher.fetch_with_retry()
-                
-                if items:
-                    # Deduplicate within source
-                    unique_items = self._deduplicate_items(items)
-                    result.add_source_items(fetcher.source_name, unique_items)
-                    successful_sources.append(fetcher.source_name)
-                    total_items += len(unique_items)
-                    logger.info(f"{fetcher.source_name}: Collected {len(unique_items)} unique items")
-                else:
-                    result.add_source_items(fetcher.source_name, [])
-                    failed_sources.append(fetcher.source_name)
-                    logger.warning(f"{fetcher.source_name}: No items collected")
-                    
-            except Exception as e:
-                logger.error(f"{fetcher.source_name}: Collection failed with error: {str(e)}")
-                result.add_source_items(fetcher.source_name, [])
+        for fetcher, items in zip(self.fetchers, outcomes):
+            if items:
+                successful_sources.append(fetcher.source_name)
+                logger.info(f"{fetcher.source_name}: Collected {len(items)} unique items")
+            else:
                 failed_sources.append(fetcher.source_name)
+                logger.warning(f"{fetcher.source_name}: No items collected")
+            
+            # Known items get their first published time back; new ones are recorded,
+            # and items without a date are stamped with the time they were first seen
+            if self.seen_items is not None:
+                unseen = self.seen_items.observe_all(items, now=run_time)
+                new_items += len(unseen)
+                if self.incremental:
+                    logger.info(f"{fetcher.source_name}: {len(unseen)} items not published before")
+                    items = unseen
+            else:
+                fill_missing_published(items, now=run_time)
+            
+            result.add_source_items(fetcher.source_name, items)
+            total_items += len(items)
         
         # Update collection status
         result.collection_status = {
@@ -102,13 +447,19 @@ class NewsCollector:
             'total_items': total_items
         }
         
-        logger.info(f"Collection complete: {total_items} items from {len(successful_sources)}/{len(self.fetchers)} sources")
+        if self.skipped_sources:
+            result.collection_status['skipped_sources'] = [
+                fetcher.source_name for fetcher in self.fetchers
+                if fetcher.source_name in self.skipped_sources
+            ]
         
-        return result
+        logger.info(f"Collection complete: {total_items} items from {len(successful_sources)}/{len(self.fetchers)} sources")
+        if self.seen_items is not None:
+            logger.info(f"{new_items} items were not published by an earlier run")
     
     def _deduplicate_items(self, items: List[NewsItem]) -> List[NewsItem]:
         """
-        Remove duplicate news items based on title similarity.
+        Remove duplicate news items sharing a canonical link or normalized title.
         
         Args:
             items: List of NewsItem objects
@@ -119,8 +470,8 @@ class NewsCollector:
         if not items:
             return []
         
-        # Use set to remove exact duplicates (based on __hash__ and __eq__ in NewsItem)
-        unique_items = list(dict.fromkeys(items))
+        # One pass over a hash index of canonical links and normalized titles
+        unique_items = ExactDuplicateIndex().unique(items)
         
         removed_count = len(items) - len(unique_items)
         if removed_count > 0:
@@ -128,65 +479,434 @@ class NewsCollector:
         
         return unique_items
     
-    def deduplicate_across_sources(self, result: CollectionResult) -> CollectionResult:
+    def deduplicate_across_sources(self, result: CollectionResult,
+                                   fuzzy: bool = False) -> CollectionResult:
         """
         Remove duplicates across all sources (optional advanced deduplication).
         
         Args:
             result: CollectionResult with items from all sources
+            fuzzy: Also drop near-duplicate titles (e.g. the same story re-posted on Reddit)
             
         Returns:
             CollectionResult with cross-source duplicates removed
         """
-        # Collect all items with their source
-        all_items_with_source = []
-        for source_name, items in result.sources.items():
-            for item in items:
-                all_items_with_source.append((source_name, item))
-        
-        # Track seen titles
-        seen_titles = set()
-        deduplicated_sources = {source: [] for source in result.sources.keys()}
+        # Exact duplicates first: one shared index, sources in priority order
+        index = ExactDuplicateIndex()
+        deduplicated_sources = {
+            source_name: index.unique(items)
+            for source_name, items in result.sources.items()
+        }
         
-        for source_name, item in all_items_with_source:
-            title_normalized = item.title.lower().strip()
-            if title_normalized not in seen_titles:
-                seen_titles.add(title_normalized)
-                deduplicated_sources[source_name].append(item)
+        if fuzzy:
+            deduplicated_sources = self._remove_near_duplicates(result, deduplicated_sources)
         
         # Update result
         for source_name, items in deduplicated_sources.items():
             result.sources[source_name] = items
         
+        result.refresh_status()
+        
+        return result
+    
+    def find_near_duplicates(self, result: CollectionResult) -> List[DuplicateCluster]:
+        """
+        Cluster items across all sources that report the same story.
+        
+        Args:
+            result: CollectionResult with items from all sources
+            
+        Returns:
+            Clusters in source order; each holds the canonical item and its alternates
+        """
+        items = [item for items in result.sources.values() for item in items]
+        return self.near_duplicate_detector.cluster(items)
+    
+    def _remove_near_duplicates(self, result: CollectionResult,
+                                sources: Dict[str, List[NewsItem]]) -> Dict[str, List[NewsItem]]:
+        """
+        Keep only the canonical item of every near-duplicate cluster.
+        
+        Args:
+            result: CollectionResult whose status records the number removed
+            sources: Mapping of source name to items, in source priority order
+            
+        Returns:
+            Mapping of source name to the surviving items
+        """
+        items = [item for source_items in sources.values() for item in source_items]
+        clusters = self.near_duplicate_detector.cluster(items)
+        
+        canonical_ids = {id(cluster.canonical) for cluster in clusters}
+        removed = len(items) - len(canonical_ids)
+        
+        if removed:
+            logger.info(f"Removed {removed} near-duplicate items across sources")
+        result.collection_status['near_duplicates_removed'] = removed
+        
+        return {
+            source: [item for item in source_items if id(item) in canonical_ids]
+            for source, source_items in sources.items()
+        }
+    
+    def load_result(self, filename: str) -> Optional[CollectionResult]:
+        """
+        Load a previously written day file.
+        
+        Args:
+            filename: Name of the file in the data directory
+            
+        Returns:
+            CollectionResult, or None if the file is missing or unreadable
+        """
+        filepath = self.data_dir / filename
+        if not filepath.exists():
+            return None
+        
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return CollectionResult.from_dict(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable day file {filepath}: {str(e)}")
+            return None
+    
+    def merge_with_existing(self, result: CollectionResult, filename: str) -> CollectionResult:
+        """
+        Merge a collection result into the day file already on disk.
+        
+        Items from earlier runs are kept even if they dropped off their feed.
+        New items (by canonical link or normalized title) are prepended per
+        source, and existing items keep their stored form and order, except
+        for publication times the new run resolved for them (see
+        _correct_published). The source and item counts of the status are
+        recomputed for the merged sources. When the content fingerprint is
+        unchanged and no date was corrected, the earlier last_updated is
+        kept so the file is byte-for-byte identical.
+        
+        Args:
+            result: Freshly collected result (updated in place)
+            filename: Name of the day file in the data directory
+            
+        Returns:
+            The merged CollectionResult
+        """
+        existing = self.load_result(filename)
+        if existing is None:
+            return result
+        
+        merged_sources = {}
+        added = 0
+        corrected = 0
+        
+        for source_name in list(result.sources) + [s for s in existing.sources if s not in result.sources]:
+            previous = existing.sources.get(source_name, [])
+            corrected += _correct_published(previous, result.sources.get(source_name, []), result.last_updated)
+            index = ExactDuplicateIndex()
+            for item in previous:
+                index.add(item)
+            
+            fresh = [item for item in result.sources.get(source_name, []) if index.add(item)]
+            merged_sources[source_name] = fresh + previous
+            added += len(fresh)
+        
+        result.sources = merged_sources
+        result.refresh_status()
+        
+        if not corrected and result_fingerprint(result) == result_fingerprint(existing):
+            result.last_updated = existing.last_updated
+        
+        logger.info(f"Merged {added} new items into existing {filename}")
         return result
     
-    def generate_json(self, result: CollectionResult, filename: str) -> str:
+    def keep_unchanged_content(self, result: CollectionResult, filename: str) -> CollectionResult:
+        """
+        Carry over the stored form of content that did not materially change.
+        
+        Sources whose fingerprint (titles, summaries, canonical links, order)
+        matches the day file on disk keep their stored items, so first-seen
+        stamps do not churn. Publication times the run resolved from the
+        source still replace stored ones (see _correct_published) and count
+        as a change. If nothing changed, the earlier last_updated is kept
+        as well and the file is not rewritten.
+        
+        Args:
+            result: Freshly collected result (updated in place)
+            filename: Name of the day file in the data directory
+            
+        Returns:
+            The stabilized CollectionResult
+        """
+        existing = self.load_result(filename)
+        if existing is None:
+            return result
+        
+        unchanged = 0
+        corrected = 0
+        for source_name, items in result.sources.items():
+            previous = existing.sources.get(source_name)
+            if previous is not None and source_fingerprint(previous) == source_fingerprint(items):
+                corrected += _correct_published(previous, items, result.last_updated)
+                result.sources[source_name] = previous
+                unchanged += 1
+        
+        if not corrected and result_fingerprint(result) == result_fingerprint(existing):
+            result.last_updated = existing.last_updated
+            logger.info(f"No material changes for {filename}")
+        else:
+            logger.info(f"{len(result.sources) - unchanged} of {len(result.sources)} sources changed in {filename}")
+        
+        return result
+    
+    def generate_json(self, result: CollectionResult, filename: str, merge: bool = False,
+                      update_today: bool = False) -> str:
         """
         Write CollectionResult to JSON file.
         
+        The JSON is streamed to a temporary file and atomically renamed into
+        place; the file is only replaced when its content changed. Content
+        is compared by fingerprint first (see keep_unchanged_content()), so
+        runs that only refreshed timestamps leave the file, today.json and
+        their modification times untouched.
+        
         Args:
             result: CollectionResult to serialize
             filename: Name of the output file (without path)
+            merge: Merge into an existing file for the same name instead of replacing it
+                (always done by incremental collectors, whose results only hold new items)
+            update_today: Also point today.json at the written file, in the same pass
             
         Returns:
             Full path to the created file
         """
         filepath = self.data_dir / filename
+        links = [self.data_dir / 'today.json'] if update_today else []
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(result.to_json())
+            if merge or self.incremental:
+                self.merge_with_existing(result, filename)
+            else:
+                self.keep_unchanged_content(result, filename)
+            
+            digest = hashlib.sha256()
+            if write_atomic(filepath, result.iter_json(self.indent), links=links,
+                            encodings=self.compression, digest=digest):
+                logger.info(f"Generated JSON file: {filepath}")
+            else:
+                logger.info(f"JSON file unchanged, not rewritten: {filepath}")
+            
+            self.day_manifests[filepath.stem] = _day_manifest(
+                result, digest.hexdigest(), filepath.stat().st_size
+            )
+            
+            if self.split_sources:
+                self.write_source_files(result, filepath.stem, update_today=update_today)
+            elif update_today:
+                self._remove_today_header()
+            
+            # Items only count as published once they are written out
+            if self.seen_items is not None:
+                self.seen_items.save()
             
-            logger.info(f"Generated JSON file: {filepath}")
             return str(filepath)
             
         except Exception as e:
             logger.error(f"Failed to write JSON file {filepath}: {str(e)}")
             raise
     
+    def write_source_files(self, result: CollectionResult, name: str,
+                           update_today: bool = False) -> str:
+        """
+        Write a result as one file per source plus a header, for lazy loading.
+        
+        The files go to a directory named after the day file (e.g.
+        2025-10-19/arxiv.json). The header holds the result's metadata and,
+        per source, the path of its file relative to the data directory,
+        its item count, SHA-256 and size, so clients can render counts at
+        once and fetch sources as they become visible. Files of sources no
+        longer in the result are removed. Source names are escaped for use
+        as file names (see _source_file_name).
+        
+        Args:
+            result: CollectionResult to split
+            name: Directory name, usually the date (YYYY-MM-DD)
+            update_today: Also point today.header.json at the header
+            
+        Returns:
+            Path to the header file
+        """
+        shard_dir = self.data_dir / name
+        shard_dir.mkdir(exist_ok=True)
+        
+        header_stem = Path(self.SOURCE_HEADER_FILE).stem
+        sources = {}
+        for source_name, items in result.sources.items():
+            shard_path = shard_dir / f"{_source_file_name(source_name, header_stem)}.json"
+            digest = hashlib.sha256()
+            write_atomic(shard_path, [DEFAULT_SERIALIZER.encode(item_dicts(items), self.indent)],
+                         encodings=self.compression, digest=digest)
+            sources[source_name] = {
+                'file': f"{name}/{shard_path.name}",
+                'items': len(items),
+                'sha256': digest.hexdigest(),
+                'bytes': shard_path.stat().st_size
+            }
+        
+        written = {entry['file'] for entry in sources.values()}
+        for shard_path in shard_dir.glob('*.json'):
+            if f"{name}/{shard_path.name}" not in written and shard_path.name != self.SOURCE_HEADER_FILE:
+                for sibling in compressed_siblings(shard_path):
+                    sibling.unlink()
+                shard_path.unlink()
+        
+        header = {
+            'date': result.date,
+            'last_updated': result.last_updated,
+            'collection_status': result.collection_status,
+            'sources': sources
+        }
+        header_path = shard_dir / self.SOURCE_HEADER_FILE
+        links = [self.data_dir / self.TODAY_HEADER_FILE] if update_today else []
+        write_atomic(header_path, [DEFAULT_SERIALIZER.encode(header, self.indent)],
+                     links=links, encodings=self.compression)
+        
+        logger.info(f"Wrote {len(sources)} source files to {shard_dir}")
+        return str(header_path)
+    
+    def _remove_today_header(self) -> None:
+        """Remove today.header.json, which would otherwise keep pointing at stale split files."""
+        today_header = self.data_dir / self.TODAY_HEADER_FILE
+        for path in compressed_siblings(today_header) + [today_header]:
+            if path.exists():
+                path.unlink()
+                logger.info(f"Removed {path}")
+    
+    def _remove_stale_source_files(self, dates_to_keep: List[str]) -> None:
+        """
+        Remove per-source directories that no day file in use refers to.
+        
+        With split output on, only directories of days outside dates_to_keep
+        are removed. With it off, all of them and today.header.json go, as
+        later runs would no longer update them.
+        
+        Args:
+            dates_to_keep: Dates whose day files are kept
+        """
+        if not self.split_sources:
+            self._remove_today_header()
+            dates_to_keep = []
+        
+        for shard_dir in self.data_dir.glob('????-??-??'):
+            if shard_dir.is_dir() and shard_dir.name not in dates_to_keep:
+                shutil.rmtree(shard_dir)
+                logger.info(f"Removed source files in {shard_dir}")
+    
+    def _require_archive(self) -> NewsArchive:
+        """Get the archive, failing clearly when it is not enabled."""
+        if self.archive is None:
+            raise RuntimeError("The news archive is not enabled (use_archive=False)")
+        return self.archive
+    
+    def archive_result(self, result: CollectionResult, date: Optional[str] = None) -> int:
+        """
+        Append a collection result to the archive.
+        
+        Args:
+            result: Collected result
+            date: Date to archive the items under (default: result.date)
+            
+        Returns:
+            Number of items not archived before for that date
+        """
+        return self._require_archive().add_result(result, date)
+    
+    def materialize_day(self, date_str: str, update_today: bool = False) -> Optional[str]:
+        """
+        Write the day file of a date from the archive.
+        
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            update_today: Also point today.json at the written file
+            
+        Returns:
+            Path to the day file, or None if the date is not archived
+        """
+        result = self._require_archive().result_for_date(date_str)
+        if result is None:
+            logger.warning(f"No archived items for {date_str}")
+            return None
+        
+        return self.generate_json(result, f"{date_str}.json", update_today=update_today)
+    
+    def materialize_missing_days(self, retention_days: int = 7) -> List[str]:
+        """
+        Rebuild day files of the retention window that are missing on disk.
+        
+        Args:
+            retention_days: Number of most recent archived dates to cover
+            
+        Returns:
+            Paths of the day files written
+        """
+        written = []
+        for date_str in self._require_archive().dates(limit=retention_days):
+            if not (self.data_dir / f"{date_str}.json").exists():
+                written.append(self.materialize_day(date_str))
+        return written
+    
+    def items_between(self, start: str, end: str,
+                      sources: Optional[Sequence[str]] = None) -> List[NewsItem]:
+        """
+        Query archived items collected within a date range.
+        
+        Args:
+            start: First date, inclusive (YYYY-MM-DD)
+            end: Last date, inclusive (YYYY-MM-DD)
+            sources: Restrict to these sources (default: all)
+            
+        Returns:
+            Items, newest date first
+        """
+        return self._require_archive().items_between(start, end, sources)
+    
+    def items_for_source(self, source_name: str, limit: Optional[int] = None) -> List[NewsItem]:
+        """
+        Query archived items of one source.
+        
+        Args:
+            source_name: Source identifier
+            limit: Return at most this many items
+            
+        Returns:
+            Items, newest first
+        """
+        return self._require_archive().items_for_source(source_name, limit)
+    
+    def latest_items(self, limit: int = 50) -> List[NewsItem]:
+        """
+        Query the most recently archived items across all sources.
+        
+        Args:
+            limit: Number of items
+            
+        Returns:
+            Items, newest first
+        """
+        return self._require_archive().latest(limit)
+    
     def update_index(self, available_dates: List[str]) -> str:
         """
-        Update the index.json file with list of available dates.
+        Update the index.json manifest of available dates.
+        
+        Besides the list of dates, the manifest describes every day file:
+        item count, items per source, SHA-256 and size in bytes, so clients
+        can decide what to fetch without downloading the files, and whether
+        per-source files with a today.header.json exist. Entries of
+        files written by this collector come from the same pass that wrote
+        them; other files are rehashed, and their previous entry is only
+        reused (without re-parsing) while the sha256 still matches. Beyond
+        INDEX_SHARD_THRESHOLD dates the entries move to monthly shards in
+        index/YYYY-MM.json, which index.json then lists instead. When
+        nothing but the timestamp would change, the file is left untouched.
         
         Args:
             available_dates: List of dates in YYYY-MM-DD format
@@ -194,17 +914,31 @@ class NewsCollector:
         Returns:
             Path to the index file
         """
-        index_data = {
-            'last_updated': datetime.now(timezone.utc).isoformat(),
-            'available_dates': sorted(available_dates, reverse=True),
-            'total_days': len(available_dates)
-        }
-        
+        dates = sorted(available_dates, reverse=True)
         index_path = self.data_dir / 'index.json'
         
         try:
-            with open(index_path, 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False)
+            previous = self._load_index()
+            manifests = self._day_manifests_for(dates, self._load_day_manifests(previous))
+            index_data = {
+                'last_updated': datetime.now(timezone.utc).isoformat(),
+                'available_dates': dates,
+                'total_days': len(dates),
+                'total_items': sum(entry['items'] for entry in manifests.values()),
+                'split_sources': (self.data_dir / self.TODAY_HEADER_FILE).exists()
+            }
+            
+            if len(dates) > self.INDEX_SHARD_THRESHOLD:
+                index_data['months'] = self._write_index_shards(manifests)
+            else:
+                index_data['dates'] = manifests
+                self._write_index_shards({})
+            
+            if previous.get('last_updated') and _without_timestamp(previous) == _without_timestamp(index_data):
+                index_data['last_updated'] = previous['last_updated']
+            
+            write_atomic(index_path, [DEFAULT_SERIALIZER.encode(index_data, self.indent)],
+                         encodings=self.compression)
             
             logger.info(f"Updated index.json with {len(available_dates)} dates")
             return str(index_path)
@@ -213,6 +947,102 @@ class NewsCollector:
             logger.error(f"Failed to update index.json: {str(e)}")
             raise
     
+    def _day_manifests_for(self, dates: List[str], previous: Dict[str, dict]) -> Dict[str, dict]:
+        """
+        Manifest entries for the given dates, skipping dates without a day file.
+        
+        Files not written in this run are rehashed; the previous entry is
+        only reused when its sha256 still matches, so an edit that keeps
+        the file size never leaves a stale hash in the index.
+        """
+        manifests = {}
+        
+        for date_str in dates:
+            filepath = self.data_dir / f"{date_str}.json"
+            entry = self.day_manifests.get(date_str)
+            
+            if entry is None:
+                try:
+                    entry = self._scan_day_file(filepath, previous.get(date_str))
+                except (OSError, ValueError):
+                    entry = None
+            
+            if entry is not None:
+                manifests[date_str] = entry
+        
+        return manifests
+    
+    def _load_index(self) -> dict:
+        """The index.json written by an earlier run, or an empty dict."""
+        try:
+            with open(self.data_dir / 'index.json', 'r', encoding='utf-8') as f:
+                index_data = json.load(f)
+            return index_data if isinstance(index_data, dict) else {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"No previous index.json: {str(e)}")
+            return {}
+    
+    def _load_day_manifests(self, index_data: dict) -> Dict[str, dict]:
+        """Day entries of an earlier index.json and its shards."""
+        try:
+            manifests = dict(index_data.get('dates', {}))
+            for month in index_data.get('months', {}).values():
+                with open(self.data_dir / month['file'], 'r', encoding='utf-8') as f:
+                    manifests.update(json.load(f).get('dates', {}))
+            return manifests
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.debug(f"No reusable index manifest: {str(e)}")
+            return {}
+    
+    def _scan_day_file(self, filepath: Path, previous: Optional[dict] = None) -> dict:
+        """Build the manifest entry of a day file, reusing previous if the content is unchanged."""
+        content = filepath.read_bytes()
+        sha = hashlib.sha256(content).hexdigest()
+        if previous and previous.get('sha256') == sha and previous.get('bytes') == len(content):
+            return previous
+        result = CollectionResult.from_dict(json.loads(content))
+        return _day_manifest(result, sha, len(content))
+    
+    def _write_index_shards(self, manifests: Dict[str, dict]) -> Dict[str, dict]:
+        """
+        Write monthly index shards and remove shards of months no longer listed.
+        
+        Args:
+            manifests: Day entries by date
+            
+        Returns:
+            Summary of each shard by month (YYYY-MM), as listed in index.json
+        """
+        shard_dir = self.data_dir / self.INDEX_SHARD_DIR
+        by_month: Dict[str, Dict[str, dict]] = {}
+        for date_str, entry in manifests.items():
+            by_month.setdefault(date_str[:7], {})[date_str] = entry
+        
+        months = {}
+        for month, entries in by_month.items():
+            shard_dir.mkdir(exist_ok=True)
+            shard_path = shard_dir / f"{month}.json"
+            digest = hashlib.sha256()
+            shard = {'month': month, 'dates': entries}
+            write_atomic(shard_path, [DEFAULT_SERIALIZER.encode(shard, self.indent)],
+                         encodings=self.compression, digest=digest)
+            months[month] = {
+                'file': f"{self.INDEX_SHARD_DIR}/{shard_path.name}",
+                'days': len(entries),
+                'items': sum(entry['items'] for entry in entries.values()),
+                'sha256': digest.hexdigest(),
+                'bytes': shard_path.stat().st_size
+            }
+        
+        if shard_dir.is_dir():
+            for shard_path in shard_dir.glob('????-??.json'):
+                if shard_path.stem not in months:
+                    for sibling in compressed_siblings(shard_path):
+                        sibling.unlink()
+                    shard_path.unlink()
+        
+        return months
+    
     def get_available_dates(self) -> List[str]:
         """
         Get list of dates for which JSON files exist.
@@ -232,6 +1062,9 @@ class NewsCollector:
         """
         Delete JSON files older than retention period.
         
+        Per-source directories of deleted days are removed as well, and all
+        split output when split_sources is off (see _remove_stale_source_files).
+        
         Args:
             retention_days: Number of days to retain files
             
@@ -240,19 +1073,24 @@ class NewsCollector:
         """
         available_dates = self.get_available_dates()
         
-        if len(available_dates) <= retention_days:
-            logger.info(f"No cleanup needed: {len(available_dates)} files <= {retention_days} retention days")
-            return []
-        
         # Keep only the most recent files
         dates_to_keep = available_dates[:retention_days]
         dates_to_delete = available_dates[retention_days:]
         
+        self._remove_stale_source_files(dates_to_keep)
+        
+        if len(available_dates) <= retention_days:
+            logger.info(f"No cleanup needed: {len(available_dates)} files <= {retention_days} retention days")
+            return []
+        
         deleted_files = []
         
         for date_str in dates_to_delete:
             filepath = self.data_dir / f"{date_str}.json"
             try:
+                for sibling in compressed_siblings(filepath):
+                    sibling.unlink()
+                
                 if filepath.exists():
                     filepath.unlink()
                     deleted_files.append(str(filepath))
@@ -279,14 +1117,117 @@ class NewsCollector:
             return
         
         try:
-            # Read source and write to today.json (copy instead of symlink for GitHub Pages)
-            with open(source_file, 'r', encoding='utf-8') as src:
-                content = src.read()
-            
-            with open(today_file, 'w', encoding='utf-8') as dst:
-                dst.write(content)
+            # Hard link (or copy) instead of symlink for GitHub Pages; never read back
+            link_atomic(source_file, today_file)
             
             logger.info(f"Updated today.json to point to {date_str}.json")
             
         except Exception as e:
             logger.error(f"Failed to create today.json: {str(e)}")
+
+
+@asynccontextmanager
+async def _shared_http_session(fetchers):
+    """
+    Open one aiohttp session for all native async fetchers that need one.
+    
+    Yields None when no fetcher needs a session or aiohttp is not installed.
+    """
+    needs_session = any(
+        isinstance(fetcher, AsyncSourceFetcher) and fetcher.http_session is None
+        for fetcher in fetchers
+    )
+    
+    if not needs_session or aiohttp is None:
+        yield None
+        return
+    
+    async with aiohttp.ClientSession(
+        headers={'User-Agent': 'Eternal-AI-News-Bot/1.0 (GitHub Actions; +https://github.com/eternal)'}
+    ) as session:
+        yield session
+
+
+async def _fetch_standalone(fetcher: AsyncSourceFetcher,
+                            max_attempts: Optional[int] = None) -> List[NewsItem]:
+    """
+    Run a single async fetcher outside the async orchestrator.
+    
+    Used when an AsyncSourceFetcher is collected through the blocking path; the
+    session is only borrowed for this call.
+    """
+    async with _shared_http_session([fetcher]) as session:
+        if session is None:
+            return await fetcher.fetch_with_retry(max_attempts=max_attempts)
+        
+        fetcher.http_session = session
+        try:
+            return await fetcher.fetch_with_retry(max_attempts=max_attempts)
+        finally:
+            fetcher.http_session = None
+
+
+def _correct_published(stored: List[NewsItem], fetched: List[NewsItem], run_stamp: str) -> int:
+    """
+    Update stored items with publication times resolved in the current run.
+    
+    Items are matched like in the seen-items store (canonical link, else
+    normalized title). Only times the run resolved from its sources are
+    used (see resolved_published), so real dates replace earlier first-seen
+    stamps but this run's stamps never replace stored dates.
+    
+    Args:
+        stored: Items loaded from the day file (updated in place)
+        fetched: Items of the same source from the current run
+        run_stamp: last_updated of the current run
+    
+    Returns:
+        Number of stored items whose published time changed
+    """
+    resolved = resolved_published(fetched, run_stamp)
+    corrected = 0
+    for item in stored:
+        published = resolved.get(item_key(item))
+        if published and published != item.published:
+            item.published = published
+            corrected += 1
+    return corrected
+
+
+def _without_timestamp(data: dict) -> dict:
+    """Copy of a serialized result without its last_updated field."""
+    return {key: value for key, value in data.items() if key != 'last_updated'}
+
+
+# Characters kept as they are in per-source file names
+_UNSAFE_FILE_CHARS_RE = re.compile(r'[^A-Za-z0-9_-]')
+
+
+def _source_file_name(source_name: str, reserved: str) -> str:
+    """
+    File name stem of a source's split file, safe inside the day directory.
+    
+    Every character other than letters, digits, '_' and '-' (notably '/'
+    and '.') is escaped as ~XX per UTF-8 byte, so names can neither leave
+    the directory nor collide with each other. A name equal to the reserved
+    stem (the header's) has its first character escaped as well.
+    """
+    stem = _UNSAFE_FILE_CHARS_RE.sub(
+        lambda match: ''.join(f"~{byte:02x}" for byte in match.group().encode('utf-8')),
+        source_name
+    )
+    if not stem:
+        return '~'
+    if stem == reserved:
+        return f"~{ord(stem[0]):02x}{stem[1:]}"
+    return stem
+
+
+def _day_manifest(result: CollectionResult, sha256: str, size: int) -> dict:
+    """Index manifest entry of a day file holding result."""
+    return {
+        'items': result.get_total_items(),
+        'sources': {source: len(items) for source, items in result.sources.items()},
+        'sha256': sha256,
+        'bytes': size
+    }
@@ -0,0 +1,319 @@
+"""
+Near-duplicate detection for news items across sources.
+Title words are summarized as MinHash signatures, and an LSH index proposes
+candidate pairs, so clustering stays roughly linear in the number of items
+instead of comparing every pair. Titles naming different numbers or
+versions (GPT-4o vs GPT-5) are never merged.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+import random
+import re
+import zlib
+
+from collector.models import NewsItem, normalize_title
+
+
+_WORD_MASK = (1 << 64) - 1
+
+_SUBREDDIT_PREFIX_RE = re.compile(r'^\s*\[r/[^\]]*\]\s*', re.IGNORECASE)
+# Numbers and version strings such as "5", "4o", "2.5" or "3.1b"
+_VERSION_RE = re.compile(r'\d+(?:\.\d+)*[a-z]*')
+
+# Words that carry no meaning for title similarity ("s" is left over from "OpenAI's")
+_STOPWORDS = frozenset(
+    'a an and are as at be by for from has have in into is it its of on or s that the this to with'.split()
+)
+
+
+def title_terms(title: str) -> List[str]:
+    """
+    Split a title into the words compared for near-duplicates.
+    
+    Stopwords are dropped and a plural "s" is stripped, so "releases" and
+    "release" count as the same word.
+    
+    Args:
+        title: Raw item title
+    
+    Returns:
+        Words in title order
+    """
+    terms = []
+    for word in normalize_title(title).split():
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def version_tokens(title: str) -> FrozenSet[str]:
+    """
+    Extract the numbers and version strings of a title.
+    
+    Args:
+        title: Raw item title
+    
+    Returns:
+        Tokens such as "5", "4o" or "2.5"
+    """
+    title = _SUBREDDIT_PREFIX_RE.sub('', title or '')
+    return frozenset(_VERSION_RE.findall(title.lower()))
+
+
+class ExactDuplicateIndex:
+    """
+    Hash index for exact duplicates by canonical link or normalized title.
+    
+    An item is a duplicate when either its canonical link or its normalized
+    title has been seen before, so a whole batch is deduplicated in one O(n)
+    pass before any fuzzy matching is needed. The keys are the ones cached
+    on the item (NewsItem.link_key, NewsItem.title_key).
+    """
+    
+    def __init__(self):
+        """Initialize an empty index."""
+        self._links: Set[str] = set()
+        self._titles: Set[str] = set()
+    
+    def add(self, item: NewsItem) -> bool:
+        """
+        Record an item unless it duplicates one already indexed.
+        
+        Args:
+            item: Candidate item
+        
+        Returns:
+            True if the item is new, False if it is a duplicate
+        """
+        link = item.link_key
+        title = item.title_key
+        
+        if (link and link in self._links) or (title and title in self._titles):
+            return False
+        
+        if link:
+            self._links.add(link)
+        if title:
+            self._titles.add(title)
+        return True
+    
+    def unique(self, items: List[NewsItem]) -> List[NewsItem]:
+        """
+        Filter items down to those not seen before, keeping the first occurrence.
+        
+        Args:
+            items: Items in priority order
+        
+        Returns:
+            New items in their original order
+        """
+        return [item for item in items if self.add(item)]
+
+
+@dataclass
+class DuplicateCluster:
+    """
+    A group of items reporting the same story.
+    
+    Attributes:
+        canonical: Item kept in the output (first seen in source order)
+        alternates: Near-duplicate items from the same or other sources
+    """
+    canonical: NewsItem
+    alternates: List[NewsItem] = field(default_factory=list)
+    
+    @property
+    def sources(self) -> List[str]:
+        """Sources that reported the story, canonical first."""
+        return list(dict.fromkeys(
+            [self.canonical.source] + [item.source for item in self.alternates]
+        ))
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures over word shingles.
+    
+    Each permutation is a multiply-shift hash of the shingle's CRC32, which
+    avoids a modulo per value and keeps signature computation cheap.
+    """
+    
+    def __init__(self, num_perm: int = 32, shingle_size: int = 1, seed: int = 1):
+        """
+        Initialize the hash permutations.
+        
+        Args:
+            num_perm: Signature length (number of hash permutations)
+            shingle_size: Words per shingle
+            seed: Seed for the permutation coefficients
+        """
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._permutations = [
+            (rng.getrandbits(64) | 1, rng.getrandbits(64))
+            for _ in range(num_perm)
+        ]
+    
+    def shingles(self, terms: Sequence[str]) -> Set[str]:
+        """
+        Join consecutive words into overlapping shingles.
+        
+        Args:
+            terms: Words from title_terms()
+        
+        Returns:
+            Set of shingles (all words joined if there are fewer than one shingle)
+        """
+        size = self.shingle_size
+        if len(terms) <= size:
+            return {' '.join(terms)} if terms else set()
+        return {' '.join(terms[i:i + size]) for i in range(len(terms) - size + 1)}
+    
+    def signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        """
+        Compute the MinHash signature of a shingle set.
+        
+        Args:
+            shingles: Shingle set from shingles()
+        
+        Returns:
+            Tuple of num_perm minimum hash values (empty for an empty set)
+        """
+        if not shingles:
+            return ()
+        
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+        return tuple(
+            min([((a * h + b) & _WORD_MASK) >> 32 for h in hashes])
+            for a, b in self._permutations
+        )
+
+
+class LSHIndex:
+    """
+    Banded locality-sensitive hashing index over MinHash signatures.
+    
+    Signatures are cut into bands; items sharing any identical band become
+    candidate duplicates. With b bands of r rows, pairs above a Jaccard
+    similarity of roughly (1/b) ** (1/r) are likely to collide.
+    """
+    
+    def __init__(self, bands: int = 16, rows: int = 2):
+        """
+        Initialize an empty index.
+        
+        Args:
+            bands: Number of bands
+            rows: Signature values per band
+        """
+        self.bands = bands
+        self.rows = rows
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    
+    def insert(self, key: int, signature: Sequence[int]) -> Set[int]:
+        """
+        Add a signature and return previously inserted keys that collide with it.
+        
+        Args:
+            key: Identifier for the signature
+            signature: MinHash signature of length bands * rows
+        
+        Returns:
+            Keys sharing at least one band with the signature
+        """
+        candidates = set()
+        
+        for band in range(self.bands):
+            start = band * self.rows
+            bucket = self._buckets.setdefault((band, tuple(signature[start:start + self.rows])), [])
+            candidates.update(bucket)
+            bucket.append(key)
+        
+        return candidates
+
+
+class NearDuplicateDetector:
+    """
+    Clusters near-duplicate news items by title similarity.
+    
+    Titles are compared by their words (see title_terms), and only titles
+    with the same numbers and version strings can match, so "Llama 3" and
+    "Llama 4" stay separate stories however similar the rest reads.
+    """
+    
+    def __init__(self, threshold: float = 0.8, bands: int = 16, rows: int = 2,
+                 shingle_size: int = 1):
+        """
+        Initialize the detector.
+        
+        Args:
+            threshold: Minimum Jaccard similarity of title shingles for a duplicate
+            bands: LSH bands
+            rows: LSH rows per band
+            shingle_size: Words per shingle
+        """
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.hasher = MinHasher(num_perm=bands * rows, shingle_size=shingle_size)
+    
+    def cluster(self, items: List[NewsItem]) -> List[DuplicateCluster]:
+        """
+        Group items into clusters of near-duplicates.
+        
+        Candidate pairs come from the LSH index, tuned to a low collision
+        threshold for recall, and are confirmed with the exact Jaccard
+        similarity of their shingle sets and equal version tokens. Earlier
+        items win, so pass items in source priority order.
+        
+        Args:
+            items: Items to cluster
+        
+        Returns:
+            One cluster per distinct story, in order of first appearance
+        """
+        index = LSHIndex(self.bands, self.rows)
+        parent = list(range(len(items)))
+        shingle_sets = []
+        versions = [version_tokens(item.title) for item in items]
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        for i, item in enumerate(items):
+            shingles = self.hasher.shingles(title_terms(item.title))
+            shingle_sets.append(shingles)
+            if not shingles:
+                continue
+            
+            for j in index.insert(i, self.hasher.signature(shingles)):
+                if versions[i] == versions[j] and _jaccard(shingles, shingle_sets[j]) >= self.threshold:
+                    root_i, root_j = find(i), find(j)
+                    if root_i != root_j:
+                        # Keep the earliest item as the root (canonical)
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        clusters: Dict[int, DuplicateCluster] = {}
+        for i, item in enumerate(items):
+            root = find(i)
+            if root == i:
+                clusters[i] = DuplicateCluster(canonical=item)
+            else:
+                clusters[root].alternates.append(item)
+        
+        return list(clusters.values())
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
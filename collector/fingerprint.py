@@ -0,0 +1,51 @@
+"""
+Content fingerprints of collected news.
+A fingerprint covers what readers see - titles, summaries, canonical links,
+item and source order, collection status - and ignores volatile timestamps
+(last_updated, per-run published times), so a run that found nothing new
+can be recognized and its output left untouched.
+"""
+
+from hashlib import sha256
+from typing import Iterable
+import json
+
+from collector.models import CollectionResult, NewsItem
+from collector.urls import canonicalize_url
+
+
+def source_fingerprint(items: Iterable[NewsItem]) -> str:
+    """
+    Fingerprint the items of one source.
+    
+    Args:
+        items: Items in output order (a list or an ItemBatch)
+    
+    Returns:
+        Hex digest over each item's title, summary and canonical link
+    """
+    digest = sha256()
+    for item in items:
+        for value in (item.title.strip(), item.summary.strip(), canonicalize_url(item.link)):
+            digest.update(value.encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def result_fingerprint(result: CollectionResult) -> str:
+    """
+    Fingerprint a whole collection result, i.e. one day file.
+    
+    Args:
+        result: Collection result
+    
+    Returns:
+        Hex digest over the date, collection status and every source's fingerprint
+    """
+    digest = sha256()
+    digest.update(result.date.encode('utf-8') + b'\0')
+    digest.update(json.dumps(result.collection_status, sort_keys=True).encode('utf-8') + b'\0')
+    for source, items in result.sources.items():
+        digest.update(f"{source}\0{source_fingerprint(items)}\n".encode('utf-8'))
+    return digest.hexdigest()
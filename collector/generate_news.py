@@ -13,10 +13,23 @@ Options:
     --verbose, -v        Enable verbose logging
     --dry-run            Run without writing files
     --retention DAYS     Number of days to retain (default: 7)
+    --workers N          Number of sources fetched in parallel (default: 6)
+    --source-timeout S   Per-source deadline in seconds (default: 300)
+    --asyncio            Collect on a single asyncio event loop
+    --no-circuit-breaker Fetch every source, even ones that keep failing
+    --dedup MODE         Cross-source deduplication: none, exact or fuzzy (default: none)
+    --incremental        Only emit items not published by an earlier run (implies --merge)
+    --merge              Merge into an existing file for the date instead of replacing it
+    --minify             Write compact JSON without indentation
+    --compress FORMAT    Also write precompressed .gz / .br files (repeatable: gzip, br)
+    --archive            Keep all items in data/archive.sqlite3 and build day files from it
+    --split-sources      Also write per-source files (YYYY-MM-DD/<source>.json) and a header
+    --sources-config F   JSON source registry to collect from (default: collector/sources.json)
 """
 
 import sys
 import argparse
+import asyncio
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -29,14 +42,7 @@ sys.path.insert(0, str(parent_dir))
 
 # Now import from collector package
 from collector.collector import NewsCollector
-from collector.sources import (
-    ArxivFetcher,
-    HuggingFaceFetcher,
-    ProductHuntFetcher,
-    RedditFetcher,
-    AINewsFetcher,
-    CrescendoFetcher
-)
+from collector.registry import DEFAULT_CONFIG, SourceRegistry
 
 
 def setup_logging(verbose: bool = False):
@@ -93,6 +99,84 @@ def parse_arguments():
         help='Number of days to retain data files (default: 7)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=6,
+        help='Number of sources fetched in parallel, 1 for sequential (default: 6)'
+    )
+    
+    parser.add_argument(
+        '--source-timeout',
+        type=float,
+        default=300,
+        help='Per-source deadline in seconds for parallel collection (default: 300)'
+    )
+    
+    parser.add_argument(
+        '--asyncio',
+        action='store_true',
+        help='Collect all sources on one asyncio event loop'
+    )
+    
+    parser.add_argument(
+        '--no-circuit-breaker',
+        action='store_true',
+        help='Fetch every source, even ones whose circuit is open after repeated failures'
+    )
+    
+    parser.add_argument(
+        '--dedup',
+        choices=['none', 'exact', 'fuzzy'],
+        default='none',
+        help='Cross-source deduplication: exact titles, or also near-duplicates (default: none)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only emit items that no earlier run has published (implies --merge)'
+    )
+    
+    parser.add_argument(
+        '--merge',
+        action='store_true',
+        help='Merge new items into the existing file for the date; unchanged files are not rewritten'
+    )
+    
+    parser.add_argument(
+        '--minify',
+        action='store_true',
+        help='Write compact JSON without indentation'
+    )
+    
+    parser.add_argument(
+        '--compress',
+        action='append',
+        choices=['gzip', 'br'],
+        default=[],
+        help='Also write a precompressed variant of every JSON file; repeat for several (br needs the brotli package)'
+    )
+    
+    parser.add_argument(
+        '--archive',
+        action='store_true',
+        help='Append items to the SQLite archive and materialize day files from it (implies --merge)'
+    )
+    
+    parser.add_argument(
+        '--split-sources',
+        action='store_true',
+        help='Also write every day as per-source files plus header.json, for lazy loading in the web app'
+    )
+    
+    parser.add_argument(
+        '--sources-config',
+        type=str,
+        default=str(DEFAULT_CONFIG),
+        help='JSON file listing the sources to collect (default: collector/sources.json)'
+    )
+    
     parser.add_argument(
         '--data-dir',
         type=str,
@@ -121,28 +205,42 @@ def main():
     
     try:
         # Initialize collector
-        collector = NewsCollector(data_dir=args.data_dir)
+        collector = NewsCollector(
+            data_dir=args.data_dir,
+            use_circuit_breaker=not args.no_circuit_breaker,
+            incremental=args.incremental,
+            minify=args.minify,
+            compression=args.compress,
+            use_archive=args.archive,
+            split_sources=args.split_sources
+        )
         logger.info(f"Initialized collector with data directory: {args.data_dir}")
         
-        # Register all source fetchers
-        logger.info("Registering source fetchers...")
-        fetchers = [
-            ArxivFetcher(),
-            HuggingFaceFetcher(),
-            ProductHuntFetcher(),
-            RedditFetcher(),
-            AINewsFetcher(),
-            CrescendoFetcher()
-        ]
+        # Register the configured sources that are enabled and due in this run
+        logger.info(f"Loading sources from {args.sources_config}...")
+        registry = SourceRegistry.from_file(args.sources_config)
+        fetchers = registry.build()
         
         for fetcher in fetchers:
             collector.register_fetcher(fetcher)
         
-        logger.info(f"Registered {len(fetchers)} source fetchers")
+        logger.info(f"Registered {len(fetchers)} of {len(registry)} configured source fetchers")
         
         # Collect from all sources
         logger.info("Starting collection from all sources...")
-        result = collector.collect_all_sources()
+        if args.asyncio:
+            result = asyncio.run(collector.collect_all_sources_async(
+                max_workers=args.workers,
+                source_timeout=args.source_timeout
+            ))
+        else:
+            result = collector.collect_all_sources(
+                max_workers=args.workers,
+                source_timeout=args.source_timeout
+            )
+        
+        if args.dedup != 'none':
+            result = collector.deduplicate_across_sources(result, fuzzy=args.dedup == 'fuzzy')
         
         # Log collection summary
         logger.info("-" * 60)
@@ -156,6 +254,12 @@ def main():
         if result.collection_status['failed_sources']:
             logger.warning(f"  Failed Sources: {', '.join(result.collection_status['failed_sources'])}")
         
+        if result.collection_status.get('skipped_sources'):
+            logger.warning(f"  Skipped (circuit open): {', '.join(result.collection_status['skipped_sources'])}")
+        
+        if result.collection_status.get('near_duplicates_removed'):
+            logger.info(f"  Near-duplicates removed: {result.collection_status['near_duplicates_removed']}")
+        
         # Log items per source
         logger.info("-" * 60)
         logger.info("Items per source:")
@@ -175,18 +279,19 @@ def main():
         if not args.dry_run:
             # Generate JSON file for this date
             filename = f"{output_date}.json"
-            filepath = collector.generate_json(result, filename)
+            # today.json is linked to the date file in the same pass
+            if args.archive:
+                added = collector.archive_result(result, output_date)
+                logger.info(f"Archived {added} new items")
+                filepath = collector.materialize_day(output_date, update_today=True)
+                collector.materialize_missing_days(retention_days=args.retention)
+            else:
+                # Incremental results only hold new items, so they always extend the day file
+                filepath = collector.generate_json(result, filename, merge=args.merge or args.incremental,
+                                                   update_today=True)
             logger.info(f"Generated JSON file: {filepath}")
-            
-            # Create/update today.json
-            collector.create_today_symlink(output_date)
             logger.info("Updated today.json")
             
-            # Update index.json with available dates
-            available_dates = collector.get_available_dates()
-            index_path = collector.update_index(available_dates)
-            logger.info(f"Updated index.json with {len(available_dates)} dates")
-            
             # Cleanup old files
             logger.info(f"Cleaning up files older than {args.retention} days...")
             deleted_files = collector.cleanup_old_files(retention_days=args.retention)
@@ -198,6 +303,11 @@ def main():
             else:
                 logger.info("No old files to delete")
             
+            # Update the index.json manifest after cleanup, so it only lists existing files
+            available_dates = collector.get_available_dates()
+            index_path = collector.update_index(available_dates)
+            logger.info(f"Updated index.json with {len(available_dates)} dates")
+            
             # Final summary
             logger.info("=" * 60)
             logger.info("Collection Complete!")
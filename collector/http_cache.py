@@ -0,0 +1,128 @@
+"""
+Persistent HTTP validator cache for conditional GET requests.
+Stores ETag / Last-Modified per URL together with the items parsed from
+that response, so unchanged sources cost a 304 and no parsing.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from collector.models import NewsItem
+from collector.state import JSONStateFile
+
+
+class HTTPValidatorCache(JSONStateFile):
+    """
+    URL-keyed cache of HTTP validators and previously parsed items.
+    
+    The cache file is loaded lazily on first use and only written back,
+    atomically, when something changed. All methods are safe to call from
+    multiple threads.
+    """
+    
+    DESCRIPTION = 'HTTP cache'
+    
+    # Entries not refreshed within this window are dropped on save
+    MAX_AGE_DAYS = 14
+    # checked_at is only refreshed once it is this old, so runs answered
+    # with 304 Not Modified leave the cache file untouched
+    REFRESH_AFTER_DAYS = 7
+    
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Get request headers that make a GET for url conditional.
+        
+        Validators are only sent when cached items exist to fall back on.
+        
+        Args:
+            url: Request URL
+            
+        Returns:
+            Dictionary with If-None-Match / If-Modified-Since, possibly empty
+        """
+        with self._lock:
+            entry = self._load().get(url)
+        
+        headers = {}
+        if entry and entry.get('items'):
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def get_validators(self, url: str) -> Dict[str, Optional[str]]:
+        """
+        Get the raw cached validators for url.
+        
+        Args:
+            url: Request URL
+            
+        Returns:
+            Dictionary with 'etag' and 'last_modified' (None when unknown or
+            when no cached items exist)
+        """
+        with self._lock:
+            entry = self._load().get(url) or {}
+        
+        if not entry.get('items'):
+            return {'etag': None, 'last_modified': None}
+        return {'etag': entry.get('etag'), 'last_modified': entry.get('last_modified')}
+    
+    def get_items(self, url: str) -> Optional[List[NewsItem]]:
+        """
+        Get the items parsed from the last full response for url.
+        
+        Args:
+            url: Request URL
+            
+        Returns:
+            List of NewsItem objects, or None if nothing is cached
+        """
+        with self._lock:
+            entry = self._load().get(url)
+            if not entry or not entry.get('items'):
+                return None
+            now = datetime.now(timezone.utc)
+            refresh_before = (now - timedelta(days=self.REFRESH_AFTER_DAYS)).isoformat()
+            if entry.get('checked_at', '') < refresh_before:
+                entry['checked_at'] = now.isoformat()
+                self._dirty = True
+        
+        source = entry.get('source', '')
+        return [NewsItem.from_dict(data, source) for data in entry['items']]
+    
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str],
+              items: List[NewsItem]) -> None:
+        """
+        Remember validators and parsed items for url.
+        
+        Responses without any validator are not cached.
+        
+        Args:
+            url: Request URL
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+            items: Items parsed from the response
+        """
+        with self._lock:
+            entries = self._load()
+            
+            if not (etag or last_modified) or not items:
+                if entries.pop(url, None) is not None:
+                    self._dirty = True
+                return
+            
+            entries[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'checked_at': datetime.now(timezone.utc).isoformat(),
+                'source': items[0].source,
+                'items': [item.to_dict() for item in items]
+            }
+            self._dirty = True
+    
+    def _prune(self, entries: Dict[str, dict]) -> Dict[str, dict]:
+        """Drop entries not checked within MAX_AGE_DAYS."""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=self.MAX_AGE_DAYS)).isoformat()
+        return {url: entry for url, entry in entries.items() if entry.get('checked_at', '') >= cutoff}
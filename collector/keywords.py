@@ -0,0 +1,149 @@
+"""
+Precompiled keyword classification for filtering news items.
+All keywords are folded into a single word-boundary-aware regular expression,
+so a text is scanned once regardless of how many keywords are configured.
+"""
+
+from typing import Dict, Iterable, Mapping, Set, Union
+import re
+
+
+# Strong signals count fully; generic terms only count alongside another hit
+DEFAULT_AI_KEYWORDS: Dict[str, float] = {
+    'ai': 1.0,
+    'artificial intelligence': 1.0,
+    'machine learning': 1.0,
+    'ml': 1.0,
+    'deep learning': 1.0,
+    'neural network': 1.0,
+    'llm': 1.0,
+    'gpt': 1.0,
+    'nlp': 1.0,
+    'computer vision': 1.0,
+    'reinforcement learning': 1.0,
+    'chatbot': 1.0,
+    'claude': 1.0,
+    'openai': 1.0,
+    'anthropic': 1.0,
+    'hugging face': 1.0,
+    'pytorch': 1.0,
+    'tensorflow': 1.0,
+    'keras': 1.0,
+    'scikit': 1.0,
+    'langchain': 1.0,
+    'transformer': 0.5,
+    'generative': 0.5,
+    'diffusion': 0.5,
+    'model': 0.5,
+    'dataset': 0.5,
+    'training': 0.5,
+    'inference': 0.5,
+    'embedding': 0.5,
+    'attention': 0.5,
+    'agent': 0.5,
+    'prompt': 0.5,
+}
+
+_SEPARATOR_RE = re.compile(r'[\s\-]+')
+
+
+def _normalize(keyword: str) -> str:
+    """Lowercase a keyword and collapse whitespace and hyphens to single spaces."""
+    return _SEPARATOR_RE.sub(' ', keyword.strip().lower())
+
+
+class KeywordClassifier:
+    """
+    Weighted multi-keyword matcher with word boundaries.
+    
+    Keywords only match as whole words ('ai' matches "AI-powered" but not
+    "said"), multi-word keywords tolerate any whitespace or hyphens between
+    words, and a trailing plural 's' is accepted. Each distinct keyword
+    contributes its weight once; a text matches when the total reaches the
+    threshold.
+    """
+    
+    def __init__(self, keywords: Union[Mapping[str, float], Iterable[str]], threshold: float = 1.0):
+        """
+        Compile the keyword set.
+        
+        Args:
+            keywords: Mapping of keyword to weight, or plain keywords (weight 1.0)
+            threshold: Minimum total weight for a text to match
+        """
+        if not isinstance(keywords, Mapping):
+            keywords = {keyword: 1.0 for keyword in keywords}
+        
+        self.weights: Dict[str, float] = {_normalize(k): float(w) for k, w in keywords.items()}
+        self.threshold = threshold
+        
+        if not self.weights:
+            raise ValueError("KeywordClassifier requires at least one keyword")
+        
+        # Longest first so 'machine learning' wins over any shorter prefix
+        alternation = '|'.join(
+            r'[\s\-]+'.join(re.escape(word) for word in keyword.split(' '))
+            for keyword in sorted(self.weights, key=len, reverse=True)
+        )
+        self._pattern = re.compile(
+            rf'(?<![a-z0-9])({alternation})s?(?![a-z0-9])',
+            re.IGNORECASE
+        )
+    
+    def matches(self, text: str) -> Set[str]:
+        """
+        Find every keyword present in the text.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Set of matched keywords in normalized form
+        """
+        if not text:
+            return set()
+        return {_normalize(match.group(1)) for match in self._pattern.finditer(text)}
+    
+    def score(self, text: str) -> float:
+        """
+        Sum the weights of the distinct keywords present in the text.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Total weight of matched keywords
+        """
+        return sum(self.weights[keyword] for keyword in self.matches(text))
+    
+    def is_match(self, text: str) -> bool:
+        """
+        Check whether the text reaches the threshold.
+        
+        Stops scanning as soon as the threshold is reached.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            True if the matched keywords weigh at least the threshold
+        """
+        if not text:
+            return False
+        
+        seen = set()
+        total = 0.0
+        
+        for match in self._pattern.finditer(text):
+            keyword = _normalize(match.group(1))
+            if keyword in seen:
+                continue
+            seen.add(keyword)
+            total += self.weights[keyword]
+            if total >= self.threshold:
+                return True
+        
+        return False
+
+
+AI_CLASSIFIER = KeywordClassifier(DEFAULT_AI_KEYWORDS)
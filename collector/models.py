@@ -3,10 +3,171 @@ Data models for Eternal AI News Aggregator.
 Defines structures for news items and collection results.
 """
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
 import json
-from datetime import datetime
+import re
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson
+except ImportError:  # Optional: faster serialization when installed
+    orjson = None
+
+from collector.urls import url_key
+
+
+class JSONSerializer:
+    """
+    Standard library JSON backend for all output files.
+    
+    Results are encoded frame by frame: the outer structure is written
+    directly and each source's items are encoded on their own, so no
+    dictionary tree for the whole result is ever built. Subclasses only
+    override encode().
+    """
+    
+    name = 'json'
+    
+    def encode(self, obj, indent: Optional[int] = 2) -> str:
+        """
+        Encode a JSON-compatible value.
+        
+        Args:
+            obj: Value to encode
+            indent: Number of spaces for indentation, None for minified output
+            
+        Returns:
+            JSON text (non-ASCII characters are not escaped)
+        """
+        if indent is None:
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+        return json.dumps(obj, indent=indent, ensure_ascii=False)
+    
+    def iter_result(self, result: 'CollectionResult', indent: Optional[int] = 2) -> Iterator[str]:
+        """
+        Encode a CollectionResult as a stream of chunks, one per source.
+        
+        The text is identical to encode(result.to_dict(), indent).
+        
+        Args:
+            result: Result to encode
+            indent: Number of spaces for indentation, None for minified output
+            
+        Returns:
+            Iterator over JSON text chunks
+        """
+        def newline(depth: int) -> str:
+            return '\n' + ' ' * (indent * depth) if indent else ''
+        
+        def nested(obj, depth: int) -> str:
+            # Encoded JSON never contains raw newlines inside strings
+            text = self.encode(obj, indent)
+            return text.replace('\n', newline(depth)) if indent else text
+        
+        colon = ': ' if indent else ':'
+        
+        yield (
+            '{' + newline(1) + '"date"' + colon + self.encode(result.date) + ','
+            + newline(1) + '"last_updated"' + colon + self.encode(result.last_updated) + ','
+            + newline(1) + '"collection_status"' + colon + nested(result.collection_status, 1) + ','
+            + newline(1) + '"sources"' + colon
+        )
+        
+        if not result.sources:
+            yield '{}' + newline(0) + '}'
+            return
+        
+        yield '{'
+        for i, (source, items) in enumerate(result.sources.items()):
+            # One chunk per source keeps memory bounded by the largest source
+            yield (
+                (',' if i else '') + newline(2) + self.encode(source) + colon
+                + nested(item_dicts(items), 2)
+            )
+        
+        yield newline(1) + '}' + newline(0) + '}'
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    orjson backend, several times faster than the standard library.
+    
+    For strings, integers, booleans and nested containers (everything a
+    news result holds) the text matches JSONSerializer at the indentation
+    levels orjson supports (2 spaces or minified); other indents use
+    JSONSerializer. Floats can differ: orjson writes 1e16 where the stdlib
+    writes 1e+16, and NaN or infinity as null. Values orjson rejects,
+    such as integers beyond 64 bits or lone surrogates, fall back to
+    JSONSerializer.
+    """
+    
+    name = 'orjson'
+    
+    def encode(self, obj, indent: Optional[int] = 2) -> str:
+        """
+        Encode a JSON-compatible value.
+        
+        Args:
+            obj: Value to encode
+            indent: Number of spaces for indentation, None for minified output
+            
+        Returns:
+            JSON text (non-ASCII characters are not escaped)
+        """
+        try:
+            if indent is None:
+                return orjson.dumps(obj).decode('utf-8')
+            if indent == 2:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass
+        return super().encode(obj, indent)
+
+
+def get_serializer(name: Optional[str] = None) -> JSONSerializer:
+    """
+    Get a JSON serializer backend.
+    
+    Args:
+        name: 'orjson' or 'json'; default picks orjson when it is installed
+        
+    Returns:
+        Serializer instance
+    """
+    if name is None:
+        name = 'orjson' if orjson is not None else 'json'
+    
+    if name == 'orjson':
+        if orjson is None:
+            raise ValueError("orjson is not installed")
+        return OrjsonSerializer()
+    if name == 'json':
+        return JSONSerializer()
+    raise ValueError(f"Unknown JSON serializer: {name}")
+
+
+_SUBREDDIT_PREFIX_RE = re.compile(r'^\s*\[r/[^\]]*\]\s*', re.IGNORECASE)
+_NON_WORD_RE = re.compile(r'[^\w]+')
+
+
+def normalize_title(title: str) -> str:
+    """
+    Reduce a title to lowercase words for similarity comparisons.
+    
+    Source decorations such as Reddit's "[r/name]" prefix and punctuation
+    are removed and whitespace is collapsed.
+    
+    Args:
+        title: Raw item title
+    
+    Returns:
+        Normalized title
+    """
+    title = _SUBREDDIT_PREFIX_RE.sub('', title or '')
+    return _NON_WORD_RE.sub(' ', title.lower()).strip()
 
 
 @dataclass
@@ -20,13 +181,45 @@ class NewsItem:
         link: URL to the original source
         published: ISO 8601 formatted publication timestamp
         source: Identifier of the source (e.g., 'arxiv', 'huggingface')
+    
+    Instances are slotted and cache the two keys duplicate detection uses,
+    title_key and link_key, once computed, so an item checked by several
+    dedup passes (sources, merges, the seen-items store) is only normalized
+    once. Reassigning title or link clears the matching key.
     """
+    __slots__ = ('title', 'summary', 'link', 'published', 'source', '_title_key', '_link_key')
+    
     title: str
     summary: str
     link: str
     published: str
     source: str
     
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == 'title':
+            object.__setattr__(self, '_title_key', None)
+        elif name == 'link':
+            object.__setattr__(self, '_link_key', None)
+    
+    @property
+    def title_key(self) -> str:
+        """Normalized title (see normalize_title), used for hashing and equality."""
+        key = self._title_key
+        if key is None:
+            key = normalize_title(self.title)
+            object.__setattr__(self, '_title_key', key)
+        return key
+    
+    @property
+    def link_key(self) -> str:
+        """Canonical form of the link (see url_key), empty if it is not a URL."""
+        key = self._link_key
+        if key is None:
+            key = url_key(self.link)
+            object.__setattr__(self, '_link_key', key)
+        return key
+    
     def to_dict(self) -> dict:
         """
         Convert NewsItem to dictionary format for JSON serialization.
@@ -41,15 +234,409 @@ class NewsItem:
             'published': self.published
         }
     
+    @classmethod
+    def from_dict(cls, data: dict, source: str) -> 'NewsItem':
+        """
+        Rebuild a NewsItem from its serialized dictionary form.
+        
+        Args:
+            data: Dictionary as produced by to_dict()
+            source: Identifier of the source the item belongs to
+            
+        Returns:
+            NewsItem instance
+        """
+        return cls(
+            title=data.get('title', ''),
+            summary=data.get('summary', ''),
+            link=data.get('link', ''),
+            published=data.get('published', ''),
+            source=source
+        )
+    
     def __hash__(self):
         """Make NewsItem hashable for deduplication using title."""
-        return hash(self.title.lower().strip())
+        return hash(self.title_key)
     
     def __eq__(self, other):
         """Compare NewsItems by normalized title for deduplication."""
         if not isinstance(other, NewsItem):
             return False
-        return self.title.lower().strip() == other.title.lower().strip()
+        return self.title_key == other.title_key
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _published_to_epoch(published: str) -> Optional[int]:
+    """Parse an ISO 8601 timestamp to microseconds since the epoch (naive = UTC)."""
+    try:
+        dt = datetime.fromisoformat(published)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _epoch_to_published(epoch: int) -> str:
+    """Render microseconds since the epoch as a UTC ISO 8601 timestamp."""
+    return (_EPOCH + timedelta(0, 0, epoch)).isoformat()
+
+
+class ItemBatch:
+    """
+    Columnar container for many news items.
+    
+    Holds parallel columns instead of one NewsItem object per item: lists
+    of titles, summaries and links, published times as int64 microseconds
+    since the Unix epoch, and per-row source ids into a small table of
+    source names. Filtering, sorting, slicing and duplicate masks work on
+    whole columns and return new batches; NewsItems are only built on
+    access. Published values that do not round-trip through a UTC
+    timestamp (empty, unparseable or non-UTC offsets) are kept verbatim,
+    so serialized output is unchanged; unparseable ones sort as the epoch.
+    """
+    
+    __slots__ = ('titles', 'summaries', 'links', 'published', 'source_ids',
+                 'source_names', '_source_index', '_published_text')
+    
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.titles: List[str] = []
+        self.summaries: List[str] = []
+        self.links: List[str] = []
+        self.published = array('q')
+        self.source_ids = array('H')
+        self.source_names: List[str] = []
+        self._source_index: Dict[str, int] = {}
+        # Row -> original published text, for rows the epoch cannot reproduce
+        self._published_text: Dict[int, str] = {}
+    
+    @classmethod
+    def from_items(cls, items: Iterable[NewsItem]) -> 'ItemBatch':
+        """
+        Build a batch from NewsItems.
+        
+        Args:
+            items: News items, possibly from several sources
+            
+        Returns:
+            ItemBatch with one row per item, in order
+        """
+        batch = cls()
+        batch.extend(items)
+        return batch
+    
+    def _source_id(self, source: str) -> int:
+        """Id of a source name, registering it on first use."""
+        source_id = self._source_index.get(source)
+        if source_id is None:
+            source_id = self._source_index[source] = len(self.source_names)
+            self.source_names.append(source)
+        return source_id
+    
+    def append(self, item: NewsItem) -> None:
+        """
+        Add one item as a new row.
+        
+        Args:
+            item: News item
+        """
+        epoch = _published_to_epoch(item.published)
+        if epoch is None or _epoch_to_published(epoch) != item.published:
+            self._published_text[len(self.titles)] = item.published
+        
+        self.titles.append(item.title)
+        self.summaries.append(item.summary)
+        self.links.append(item.link)
+        self.published.append(epoch if epoch is not None else 0)
+        self.source_ids.append(self._source_id(item.source))
+    
+    def extend(self, items: Union[Iterable[NewsItem], 'ItemBatch']) -> None:
+        """
+        Add items as new rows.
+        
+        Args:
+            items: News items, or another batch whose columns are copied directly
+        """
+        if isinstance(items, ItemBatch):
+            offset = len(self)
+            source_ids = [self._source_id(source) for source in items.source_names]
+            self.titles.extend(items.titles)
+            self.summaries.extend(items.summaries)
+            self.links.extend(items.links)
+            self.published.extend(items.published)
+            self.source_ids.extend(map(source_ids.__getitem__, items.source_ids))
+            for row, text in items._published_text.items():
+                self._published_text[offset + row] = text
+            return
+        
+        for item in items:
+            self.append(item)
+    
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.titles)
+    
+    def __iter__(self) -> Iterator[NewsItem]:
+        """Iterate over the rows as NewsItems."""
+        return map(self.item, range(len(self)))
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[NewsItem, 'ItemBatch']:
+        """
+        Get one row as a NewsItem, or a slice of rows as a new batch.
+        
+        Args:
+            index: Row number or slice
+            
+        Returns:
+            NewsItem for an int index, ItemBatch for a slice
+        """
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+        return self.item(index)
+    
+    def item(self, row: int) -> NewsItem:
+        """
+        Materialize one row.
+        
+        Args:
+            row: Row number (negative values count from the end)
+            
+        Returns:
+            NewsItem for that row
+        """
+        if row < 0:
+            row += len(self)
+        published = self._published_text.get(row)
+        if published is None:
+            published = _epoch_to_published(self.published[row])
+        
+        return NewsItem(
+            title=self.titles[row],
+            summary=self.summaries[row],
+            link=self.links[row],
+            published=published,
+            source=self.source_names[self.source_ids[row]]
+        )
+    
+    def to_items(self) -> List[NewsItem]:
+        """
+        Materialize all rows.
+        
+        Returns:
+            List of NewsItems in row order
+        """
+        return list(self)
+    
+    def to_dicts(self) -> List[dict]:
+        """
+        Convert all rows to the dictionary form of NewsItem.to_dict().
+        
+        Returns:
+            List of item dictionaries, without building NewsItems
+        """
+        text = self._published_text
+        return [
+            {
+                'title': title,
+                'summary': summary,
+                'link': link,
+                'published': text[row] if row in text else _epoch_to_published(epoch)
+            }
+            for row, (title, summary, link, epoch)
+            in enumerate(zip(self.titles, self.summaries, self.links, self.published))
+        ]
+    
+    def _derive(self, rows: Sequence[int], titles: List[str], summaries: List[str],
+                links: List[str], published: array, source_ids: array) -> 'ItemBatch':
+        """Build a batch from selected columns; rows are the source row numbers."""
+        batch = ItemBatch()
+        batch.titles = titles
+        batch.summaries = summaries
+        batch.links = links
+        batch.published = published
+        batch.source_ids = source_ids
+        batch.source_names = list(self.source_names)
+        batch._source_index = dict(self._source_index)
+        text = self._published_text
+        if text:
+            batch._published_text = {
+                new_row: text[row] for new_row, row in enumerate(rows) if row in text
+            }
+        return batch
+    
+    def take(self, rows: Iterable[int]) -> 'ItemBatch':
+        """
+        Select rows by number, in the given order.
+        
+        Args:
+            rows: Row numbers; may repeat or reorder rows
+            
+        Returns:
+            New ItemBatch
+        """
+        rows = list(rows)
+        titles, summaries, links = self.titles, self.summaries, self.links
+        published, source_ids = self.published, self.source_ids
+        return self._derive(
+            rows,
+            [titles[row] for row in rows],
+            [summaries[row] for row in rows],
+            [links[row] for row in rows],
+            array('q', [published[row] for row in rows]),
+            array('H', [source_ids[row] for row in rows])
+        )
+    
+    def filter(self, mask: Sequence[bool]) -> 'ItemBatch':
+        """
+        Keep the rows where mask is true.
+        
+        Args:
+            mask: One boolean per row, e.g. from dedup_mask() or published_mask()
+            
+        Returns:
+            New ItemBatch in the original row order
+        """
+        if len(mask) != len(self):
+            raise ValueError(f"Mask has {len(mask)} entries for {len(self)} rows")
+        
+        rows = list(compress(range(len(self)), mask)) if self._published_text else ()
+        return self._derive(
+            rows,
+            list(compress(self.titles, mask)),
+            list(compress(self.summaries, mask)),
+            list(compress(self.links, mask)),
+            array('q', compress(self.published, mask)),
+            array('H', compress(self.source_ids, mask))
+        )
+    
+    def argsort(self, by: str = 'published', reverse: bool = False) -> List[int]:
+        """
+        Compute the row order that sorts the batch.
+        
+        Args:
+            by: Column to sort on: 'published', 'title' or 'source'
+            reverse: Sort in descending order
+            
+        Returns:
+            Row numbers in sorted order (stable for equal keys)
+        """
+        if by == 'published':
+            key = self.published.__getitem__
+        elif by == 'title':
+            key = self.titles.__getitem__
+        elif by == 'source':
+            names = [self.source_names[source_id] for source_id in self.source_ids]
+            key = names.__getitem__
+        else:
+            raise ValueError(f"Unknown sort column: {by}")
+        return sorted(range(len(self)), key=key, reverse=reverse)
+    
+    def sort(self, by: str = 'published', reverse: bool = False) -> 'ItemBatch':
+        """
+        Sort the rows by a column.
+        
+        Args:
+            by: Column to sort on: 'published', 'title' or 'source'
+            reverse: Sort in descending order
+            
+        Returns:
+            New sorted ItemBatch
+        """
+        return self.take(self.argsort(by, reverse))
+    
+    def dedup_mask(self) -> List[bool]:
+        """
+        Mark the rows that are not duplicates of an earlier row.
+        
+        Applies the rule of ExactDuplicateIndex: a row is a duplicate when
+        its canonical link (url_key) or normalized title (normalize_title)
+        appeared in an earlier kept row, so filtering with this mask keeps
+        the same items as ExactDuplicateIndex().unique().
+        
+        Returns:
+            One boolean per row, False for later duplicates
+        """
+        links = set()
+        titles = set()
+        mask = []
+        for link, title in zip(map(url_key, self.links), map(normalize_title, self.titles)):
+            keep = not ((link and link in links) or (title and title in titles))
+            if keep:
+                if link:
+                    links.add(link)
+                if title:
+                    titles.add(title)
+            mask.append(keep)
+        return mask
+    
+    def published_mask(self, since: Optional[datetime] = None,
+                       until: Optional[datetime] = None) -> List[bool]:
+        """
+        Mark rows published within a time window.
+        
+        Args:
+            since: Inclusive lower bound (naive datetimes are taken as UTC)
+            until: Exclusive upper bound (naive datetimes are taken as UTC)
+            
+        Returns:
+            One boolean per row
+        """
+        low = _published_to_epoch(since.isoformat()) if since else None
+        high = _published_to_epoch(until.isoformat()) if until else None
+        
+        if low is not None and high is not None:
+            return [low <= epoch < high for epoch in self.published]
+        if low is not None:
+            return [epoch >= low for epoch in self.published]
+        if high is not None:
+            return [epoch < high for epoch in self.published]
+        return [True] * len(self)
+    
+    def source_mask(self, *sources: str) -> List[bool]:
+        """
+        Mark rows belonging to any of the given sources.
+        
+        Args:
+            sources: Source names
+            
+        Returns:
+            One boolean per row
+        """
+        wanted = {self._source_index[source] for source in sources if source in self._source_index}
+        return [source_id in wanted for source_id in self.source_ids]
+    
+    def split_by_source(self) -> Dict[str, 'ItemBatch']:
+        """
+        Split the batch into one batch per source.
+        
+        Returns:
+            Dictionary mapping source names to their rows, in first-seen order
+        """
+        present = set(self.source_ids)
+        return {
+            source: self.filter(self.source_mask(source))
+            for source_id, source in enumerate(self.source_names)
+            if source_id in present
+        }
+
+
+def item_dicts(items: Union[List[NewsItem], ItemBatch]) -> List[dict]:
+    """
+    Convert a source's items to their serialized dictionary form.
+    
+    Args:
+        items: List of NewsItems or an ItemBatch
+        
+    Returns:
+        List of dictionaries as produced by NewsItem.to_dict()
+    """
+    if isinstance(items, ItemBatch):
+        return items.to_dicts()
+    return [item.to_dict() for item in items]
 
 
 @dataclass
@@ -62,11 +649,12 @@ class CollectionResult:
         last_updated: ISO 8601 timestamp of when collection completed
         collection_status: Metadata about the collection process
         sources: Dictionary mapping source names to lists of NewsItems
+            or to ItemBatches holding the same items in columnar form
     """
     date: str
     last_updated: str
     collection_status: Dict[str, any] = field(default_factory=dict)
-    sources: Dict[str, List[NewsItem]] = field(default_factory=dict)
+    sources: Dict[str, Union[List[NewsItem], ItemBatch]] = field(default_factory=dict)
     
     def to_dict(self) -> dict:
         """
@@ -80,33 +668,111 @@ class CollectionResult:
             'last_updated': self.last_updated,
             'collection_status': self.collection_status,
             'sources': {
-                source: [item.to_dict() for item in items]
+                source: item_dicts(items)
                 for source, items in self.sources.items()
             }
         }
     
-    def to_json(self, indent: int = 2) -> str:
+    @classmethod
+    def from_dict(cls, data: dict, columnar: bool = False) -> 'CollectionResult':
+        """
+        Rebuild a CollectionResult from its serialized dictionary form.
+        
+        Args:
+            data: Dictionary as produced by to_dict()
+            columnar: Hold each source's items as an ItemBatch instead of a list
+            
+        Returns:
+            CollectionResult instance
+        """
+        sources = {}
+        for source, items in data.get('sources', {}).items():
+            items = [NewsItem.from_dict(item, source) for item in items]
+            sources[source] = ItemBatch.from_items(items) if columnar else items
+        
+        return cls(
+            date=data.get('date', ''),
+            last_updated=data.get('last_updated', ''),
+            collection_status=data.get('collection_status', {}),
+            sources=sources
+        )
+    
+    def to_json(self, indent: Optional[int] = 2,
+                serializer: Optional[JSONSerializer] = None) -> str:
         """
         Convert CollectionResult to JSON string.
         
         Args:
-            indent: Number of spaces for JSON indentation
+            indent: Number of spaces for JSON indentation, None for minified output
+            serializer: JSON backend (default: orjson if installed, else stdlib)
             
         Returns:
             Formatted JSON string
         """
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        return ''.join(self.iter_json(indent, serializer))
+    
+    def iter_json(self, indent: Optional[int] = 2,
+                  serializer: Optional[JSONSerializer] = None) -> Iterator[str]:
+        """
+        Encode CollectionResult to JSON incrementally.
+        
+        Yields the same text as to_json() in small chunks, so it can be
+        streamed to a file without building the whole string.
+        
+        Args:
+            indent: Number of spaces for JSON indentation, None for minified output
+            serializer: JSON backend (default: orjson if installed, else stdlib)
+            
+        Returns:
+            Iterator over JSON text chunks
+        """
+        return (serializer or DEFAULT_SERIALIZER).iter_result(self, indent)
     
-    def add_source_items(self, source_name: str, items: List[NewsItem]) -> None:
+    def add_source_items(self, source_name: str,
+                         items: Union[List[NewsItem], ItemBatch]) -> None:
         """
         Add news items from a specific source.
         
         Args:
             source_name: Identifier for the source
-            items: List of NewsItem objects from that source
+            items: List of NewsItem objects from that source, or an ItemBatch
         """
         self.sources[source_name] = items
     
+    def add_batch(self, batch: ItemBatch) -> None:
+        """
+        Add the rows of a batch under their own sources.
+        
+        Rows of a source that already has items are appended after them;
+        the existing list or batch is not modified in place.
+        
+        Args:
+            batch: Items from one or more sources
+        """
+        for source, rows in batch.split_by_source().items():
+            existing = self.sources.get(source)
+            if not existing:
+                self.sources[source] = rows
+            elif isinstance(existing, ItemBatch):
+                merged = ItemBatch()
+                merged.extend(existing)
+                merged.extend(rows)
+                self.sources[source] = merged
+            else:
+                self.sources[source] = list(existing) + rows.to_items()
+    
+    def to_batch(self) -> ItemBatch:
+        """
+        Gather the items of all sources into a single batch.
+        
+        Returns:
+            ItemBatch with the sources' items in source order
+        """
+        batch = ItemBatch()
+        for items in self.sources.values():
+            batch.extend(items)
+        return batch
+    
     def get_total_items(self) -> int:
         """
         Get total count of news items across all sources.
@@ -133,3 +799,27 @@ class CollectionResult:
             List of source names without items
         """
         return [source for source, items in self.sources.items() if not items]
+    
+    def refresh_status(self) -> None:
+        """
+        Recompute the source and item counts in collection_status from sources.
+        
+        Called after merging or deduplication, so the status describes the
+        items actually in the result: a source counts as failed when it has
+        no items. skipped_sources and near_duplicates_removed still describe
+        the last run. Only keys already present are updated.
+        """
+        failed_sources = self.get_failed_sources()
+        counts = {
+            'total_sources': len(self.sources),
+            'successful': len(self.sources) - len(failed_sources),
+            'failed': len(failed_sources),
+            'failed_sources': failed_sources,
+            'total_items': self.get_total_items()
+        }
+        for key, value in counts.items():
+            if key in self.collection_status:
+                self.collection_status[key] = value
+
+
+DEFAULT_SERIALIZER = get_serializer()
@@ -0,0 +1,258 @@
+"""
+Publication time resolution for scraped and feed items.
+Real dates are taken from page metadata where it is cheap to read:
+<time> elements and schema.org microdata inside an article's container,
+and JSON-LD or OpenGraph blocks on the fetched page. Items without any
+date keep an empty published field, which the collector fills with the
+item's persisted first-seen time, so timestamps never drift between runs.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+import json
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from collector.models import NewsItem
+from collector.seen import item_key
+from collector.urls import url_key
+
+
+# JSON-LD properties holding an item's publication time, in order of preference
+_JSONLD_DATE_KEYS = ('datePublished', 'dateCreated', 'uploadDate')
+_JSONLD_URL_KEYS = ('url', 'mainEntityOfPage', '@id')
+
+# Elements holding page-level date metadata
+_METADATA_STRAINERS = (
+    SoupStrainer('script', attrs={'type': 'application/ld+json'}),
+    SoupStrainer('meta', attrs={'property': re.compile(r'^(og:url|article:published_time)$')}),
+)
+
+
+class AnyStrainer(SoupStrainer):
+    """
+    SoupStrainer keeping the top-level elements any of several strainers keeps.
+    
+    Lets one strained parse collect article containers and page metadata
+    together. Both the bs4 4.12 hook (search_tag) and the 4.13+ hooks
+    (allow_tag_creation, allow_string_creation) are implemented.
+    """
+    
+    def __init__(self, *strainers: SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+    
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return next((found for strainer in self.strainers
+                     if (found := strainer.search_tag(markup_name, markup_attrs))), None)
+    
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return any(strainer.allow_tag_creation(nsprefix, name, attrs) for strainer in self.strainers)
+    
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+
+def parse_published(value) -> str:
+    """
+    Normalize a publication time to an ISO 8601 UTC timestamp.
+    
+    Accepts ISO 8601 (including a trailing "Z" and plain dates) and RFC 2822
+    as used by RSS. Times without a zone are taken as UTC.
+    
+    Args:
+        value: Raw date string
+    
+    Returns:
+        ISO 8601 timestamp, or an empty string if value is not a date
+    """
+    value = (value or '').strip()
+    if not value:
+        return ''
+    
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return ''
+    
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat()
+
+
+def element_published(element: Optional[Tag]) -> str:
+    """
+    Read a publication time from an element such as <time> or microdata.
+    
+    Args:
+        element: Element carrying the date in its datetime or content
+            attribute, or in its text
+    
+    Returns:
+        ISO 8601 timestamp, or an empty string
+    """
+    if element is None:
+        return ''
+    for value in (element.get('datetime'), element.get('content'), element.get_text()):
+        published = parse_published(value)
+        if published:
+            return published
+    return ''
+
+
+def declares_published_times(raw_content) -> bool:
+    """
+    Cheap check whether a page may carry JSON-LD or OpenGraph dates.
+    
+    Args:
+        raw_content: Page HTML (bytes or text)
+    
+    Returns:
+        False if the page certainly has no date metadata
+    """
+    raw_content = raw_content or ''
+    markers = (b'ld+json', b'published_time') if isinstance(raw_content, bytes) else ('ld+json', 'published_time')
+    return any(marker in raw_content for marker in markers)
+
+
+def metadata_strainer(strainer: Optional[SoupStrainer] = None) -> SoupStrainer:
+    """
+    Strainer keeping the page's date metadata, plus what strainer keeps.
+    
+    Args:
+        strainer: Strainer for the elements the caller needs itself
+    
+    Returns:
+        SoupStrainer for a parse that soup_published_times() can read
+    """
+    return AnyStrainer(*_METADATA_STRAINERS, *([strainer] if strainer else []))
+
+
+def page_published_times(raw_content, base_url: str = '', parser: str = 'lxml') -> Dict[str, str]:
+    """
+    Collect publication times that a page declares for its articles.
+    
+    Pages without either kind of metadata are not parsed. Callers that
+    parse the page anyway should add metadata_strainer() to their own
+    parse and call soup_published_times() instead.
+    
+    Args:
+        raw_content: Page HTML (bytes or text)
+        base_url: Base for resolving relative URLs
+        parser: BeautifulSoup parser to use
+    
+    Returns:
+        Mapping of url_key() of each article URL to its ISO 8601 timestamp
+    """
+    if not declares_published_times(raw_content):
+        return {}
+    
+    soup = BeautifulSoup(raw_content, parser, parse_only=metadata_strainer())
+    return soup_published_times(soup, base_url)
+
+
+def soup_published_times(soup: BeautifulSoup, base_url: str = '') -> Dict[str, str]:
+    """
+    Collect publication times from the metadata of a parsed page.
+    
+    Reads JSON-LD objects with a URL and datePublished (including @graph
+    and ItemList members) and the OpenGraph article:published_time of the
+    page itself.
+    
+    Args:
+        soup: Parsed page, or a strained parse including metadata_strainer()
+        base_url: Base for resolving relative URLs
+    
+    Returns:
+        Mapping of url_key() of each article URL to its ISO 8601 timestamp
+    """
+    times: Dict[str, str] = {}
+    
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        for node in _jsonld_nodes(data):
+            published = next((parse_published(node.get(key)) for key in _JSONLD_DATE_KEYS
+                              if isinstance(node.get(key), str)), '')
+            url = next((_jsonld_url(node.get(key)) for key in _JSONLD_URL_KEYS if node.get(key)), '')
+            if published and url:
+                times.setdefault(url_key(urljoin(base_url, url)), published)
+    
+    og_url = soup.find('meta', attrs={'property': 'og:url'})
+    og_time = soup.find('meta', attrs={'property': 'article:published_time'})
+    if og_url and og_time:
+        published = parse_published(og_time.get('content'))
+        if published and og_url.get('content'):
+            times.setdefault(url_key(urljoin(base_url, og_url['content'])), published)
+    
+    return times
+
+
+def _jsonld_nodes(data) -> Iterable[dict]:
+    """Every JSON object in a JSON-LD document, depth first."""
+    if isinstance(data, list):
+        for value in data:
+            yield from _jsonld_nodes(value)
+    elif isinstance(data, dict):
+        yield data
+        for value in data.values():
+            if isinstance(value, (list, dict)):
+                yield from _jsonld_nodes(value)
+
+
+def _jsonld_url(value) -> str:
+    """URL of a JSON-LD url / @id / mainEntityOfPage value."""
+    if isinstance(value, dict):
+        value = value.get('@id') or value.get('url')
+    return value if isinstance(value, str) else ''
+
+
+def fill_missing_published(items: List[NewsItem], now: Optional[datetime] = None) -> List[NewsItem]:
+    """
+    Stamp items without a known publication time with the current time.
+    
+    Only used when no seen-items store is available to supply the time an
+    item was first seen.
+    
+    Args:
+        items: Items to update in place
+        now: Time to use (default: current UTC time)
+    
+    Returns:
+        The same items
+    """
+    stamp = (now or datetime.now(timezone.utc)).isoformat()
+    for item in items:
+        if not item.published:
+            item.published = stamp
+    return items
+
+
+def resolved_published(items: Iterable[NewsItem], run_stamp: str) -> Dict[str, str]:
+    """
+    Collect the publication times a run resolved from its sources.
+    
+    Items stamped with run_stamp (the time undated items of the run were
+    first seen) or without a time are left out, so a stamp never replaces
+    a real date stored by an earlier run.
+    
+    Args:
+        items: Items of the run
+        run_stamp: last_updated of the run
+    
+    Returns:
+        Mapping of item_key() to ISO 8601 timestamp, first item winning
+    """
+    times: Dict[str, str] = {}
+    for item in items:
+        if item.published and item.published != run_stamp:
+            times.setdefault(item_key(item), item.published)
+    return times
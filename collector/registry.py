@@ -0,0 +1,251 @@
+"""
+Configurable registry of news sources.
+Sources are described in a JSON file (type, URL, limits, selectors,
+schedule, priority) instead of being hardcoded, and each fetcher module is
+only imported once an enabled source needs it, so large source lists stay
+cheap to load and slow sources can be switched off without code changes.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import importlib
+import json
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+# Bundled configuration with the built-in sources
+DEFAULT_CONFIG = Path(__file__).with_name('sources.json')
+
+# Built-in source types as "module:Class"; any other "module:Class" string is accepted as a type too
+FETCHER_TYPES = {
+    'arxiv': 'collector.sources:ArxivFetcher',
+    'reddit': 'collector.sources:RedditFetcher',
+    'feed': 'collector.sources:FeedFetcher',
+    'async_feed': 'collector.sources:AsyncFeedFetcher',
+    'huggingface': 'collector.sources:HuggingFaceFetcher',
+    'producthunt': 'collector.sources:ProductHuntFetcher',
+    'ai_news': 'collector.sources:AINewsFetcher',
+    'crescendo': 'collector.sources:CrescendoFetcher',
+    'scraper': 'collector.scraper:SelectorFetcher',
+}
+
+
+@dataclass(frozen=True)
+class SourceConfig:
+    """
+    Configuration of one news source.
+    
+    Attributes:
+        name: Unique source name, used as the key in the output
+        type: Key of FETCHER_TYPES, or a "module:Class" path
+        url: URL to fetch (default: the fetcher's own)
+        limit: Maximum number of items (default: the fetcher's own)
+        selectors: CSS selectors for scraper types (title, link, summary,
+            published, containers)
+        schedule: UTC hours in which the source is collected (default: every run)
+        priority: Sources with a higher priority are fetched and listed first
+        enabled: Disabled sources are neither imported nor fetched
+        options: Further keyword arguments for the fetcher
+    """
+    name: str
+    type: str
+    url: str = ''
+    limit: Optional[int] = None
+    selectors: Dict[str, Any] = field(default_factory=dict)
+    schedule: Tuple[int, ...] = ()
+    priority: int = 0
+    enabled: bool = True
+    options: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SourceConfig':
+        """
+        Create a source configuration from a JSON object.
+        
+        Args:
+            data: Mapping with at least name and type
+        
+        Returns:
+            SourceConfig instance
+        
+        Raises:
+            ValueError: If the entry is incomplete or has unknown keys or types
+        """
+        unknown = set(data) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown source keys: {', '.join(sorted(unknown))}")
+        if not data.get('name') or not data.get('type'):
+            raise ValueError("Every source needs a name and a type")
+        if data['type'] not in FETCHER_TYPES and ':' not in data['type']:
+            raise ValueError(f"{data['name']}: unknown source type {data['type']!r}")
+        
+        schedule = tuple(data.get('schedule', ()))
+        if any(not isinstance(hour, int) or not 0 <= hour < 24 for hour in schedule):
+            raise ValueError(f"{data['name']}: schedule must list UTC hours 0-23")
+        
+        return cls(**{**data, 'schedule': schedule})
+    
+    def is_due(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check whether the source should be collected in this run.
+        
+        Args:
+            now: Time of the run (default: current UTC time)
+        
+        Returns:
+            True if the source is enabled and scheduled for this hour
+        """
+        if not self.enabled:
+            return False
+        if not self.schedule:
+            return True
+        return (now or datetime.now(timezone.utc)).astimezone(timezone.utc).hour in self.schedule
+
+
+def load_fetcher_class(source_type: str) -> type:
+    """
+    Import the fetcher class of a source type.
+    
+    Args:
+        source_type: Key of FETCHER_TYPES, or a "module:Class" path
+    
+    Returns:
+        Fetcher class
+    """
+    module_name, _, class_name = FETCHER_TYPES.get(source_type, source_type).partition(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def build_fetcher(config: SourceConfig):
+    """
+    Instantiate the fetcher for a source.
+    
+    Fetcher classes with a from_config() classmethod build themselves from
+    the configuration; others are called with source_name, url and limit
+    (when set) and the options as keyword arguments.
+    
+    Args:
+        config: Source configuration
+    
+    Returns:
+        SourceFetcher or AsyncSourceFetcher instance
+    """
+    fetcher_class = load_fetcher_class(config.type)
+    
+    if hasattr(fetcher_class, 'from_config'):
+        return fetcher_class.from_config(config)
+    
+    options = dict(config.options)
+    if config.url:
+        options['url'] = config.url
+    if config.limit is not None:
+        options['limit'] = config.limit
+    return fetcher_class(source_name=config.name, **options)
+
+
+class SourceRegistry:
+    """
+    Ordered collection of configured sources.
+    
+    Loading a registry only parses and validates the configuration; fetcher
+    modules are imported by build(), and only for the sources due in the run.
+    """
+    
+    def __init__(self, sources=()):
+        """
+        Initialize the registry.
+        
+        Args:
+            sources: SourceConfig instances in configuration order
+        """
+        self._sources: Dict[str, SourceConfig] = {}
+        for config in sources:
+            self.add(config)
+    
+    @classmethod
+    def from_file(cls, path=DEFAULT_CONFIG) -> 'SourceRegistry':
+        """
+        Load a registry from a JSON file of the form {"sources": [...]}.
+        
+        Args:
+            path: Configuration file (default: the bundled sources.json)
+        
+        Returns:
+            SourceRegistry instance
+        
+        Raises:
+            ValueError: If the file is not a valid source configuration
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        entries = data.get('sources') if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            raise ValueError(f"{path}: expected an object with a 'sources' list")
+        
+        return cls(SourceConfig.from_dict(entry) for entry in entries)
+    
+    def add(self, config: SourceConfig) -> None:
+        """
+        Add a source.
+        
+        Args:
+            config: Source configuration
+        
+        Raises:
+            ValueError: If a source with the same name is already registered
+        """
+        if config.name in self._sources:
+            raise ValueError(f"Duplicate source name: {config.name}")
+        self._sources[config.name] = config
+    
+    def __len__(self) -> int:
+        return len(self._sources)
+    
+    def __iter__(self) -> Iterator[SourceConfig]:
+        return iter(self._sources.values())
+    
+    def get(self, name: str) -> Optional[SourceConfig]:
+        """Get a source by name, or None."""
+        return self._sources.get(name)
+    
+    def due(self, now: Optional[datetime] = None) -> List[SourceConfig]:
+        """
+        Get the sources to collect in a run.
+        
+        Args:
+            now: Time of the run (default: current UTC time)
+        
+        Returns:
+            Enabled sources scheduled for this hour, highest priority first,
+            otherwise in configuration order
+        """
+        now = now or datetime.now(timezone.utc)
+        due = [config for config in self._sources.values() if config.is_due(now)]
+        return sorted(due, key=lambda config: -config.priority)
+    
+    def build(self, now: Optional[datetime] = None) -> List:
+        """
+        Import and instantiate the fetchers of the sources due in a run.
+        
+        A source whose fetcher cannot be imported or constructed is logged
+        and left out, so one bad entry does not stop the whole collection.
+        
+        Args:
+            now: Time of the run (default: current UTC time)
+        
+        Returns:
+            Fetcher instances in collection order
+        """
+        fetchers = []
+        for config in self.due(now):
+            try:
+                fetchers.append(build_fetcher(config))
+            except (ImportError, AttributeError, TypeError, ValueError, KeyError) as e:
+                logger.error(f"Cannot build source {config.name} ({config.type}): {str(e)}")
+        return fetchers
@@ -0,0 +1,144 @@
+"""
+Unified retry policy for source fetchers.
+Combines jittered exponential backoff, a total per-source deadline,
+Retry-After handling and classification of retryable vs. fatal errors.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+import asyncio
+import random
+import time
+
+import requests
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether and when a failed fetch should be retried.
+    
+    Attributes:
+        max_attempts: Maximum number of attempts, including the first one
+        base_delay: Backoff ceiling for the first retry in seconds
+        max_delay: Upper bound for a single backoff sleep in seconds
+        deadline: Total time budget per source in seconds
+        retry_statuses: HTTP status codes worth retrying
+    """
+    max_attempts: int = 3
+    base_delay: float = 2.0
+    max_delay: float = 30.0
+    deadline: float = 90.0
+    retry_statuses: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+    
+    def start(self) -> float:
+        """
+        Start the deadline clock for a new fetch.
+        
+        Returns:
+            Absolute deadline on the time.monotonic() clock
+        """
+        return time.monotonic() + self.deadline
+    
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Classify an exception as transient (retry) or fatal (give up).
+        
+        Timeouts, connection failures and 408/429/5xx responses are transient.
+        Other HTTP errors (403, 404, ...) and parsing errors are fatal, since
+        retrying them cannot succeed.
+        
+        Args:
+            error: Exception raised by a fetch attempt
+        
+        Returns:
+            True if another attempt may succeed
+        """
+        status = _status_code(error)
+        if status is not None:
+            return status in self.retry_statuses
+        
+        if isinstance(error, requests.exceptions.RequestException):
+            return isinstance(error, (
+                requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError
+            ))
+        
+        return isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError, OSError))
+    
+    def backoff(self, attempt: int) -> float:
+        """
+        Full-jitter exponential backoff for the given attempt number.
+        
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+        
+        Returns:
+            Sleep duration in seconds
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+    
+    def next_delay(self, attempt: int, error: BaseException, deadline: float) -> Optional[float]:
+        """
+        Compute how long to wait before the next attempt.
+        
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            error: Exception raised by that attempt
+            deadline: Absolute deadline returned by start()
+        
+        Returns:
+            Delay in seconds, or None if the fetch should give up
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        
+        # A server-provided Retry-After wins over our own backoff
+        delay = _retry_after(error)
+        if delay is None:
+            delay = self.backoff(attempt)
+        
+        # Only retry if the sleep still fits within the source's budget
+        if time.monotonic() + delay >= deadline:
+            return None
+        
+        return delay
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Extract an HTTP status code from requests or aiohttp errors."""
+    response = getattr(error, 'response', None)
+    if response is not None and getattr(response, 'status_code', None) is not None:
+        return response.status_code
+    
+    status = getattr(error, 'status', None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Parse the Retry-After header of a failed response, if present."""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or getattr(error, 'headers', None)
+    if not headers:
+        return None
+    
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
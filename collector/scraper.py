@@ -0,0 +1,311 @@
+"""
+Declarative, selector-driven scraping for HTML news listings.
+A ScraperSpec describes where articles live on a page; SelectorFetcher turns
+any spec into a working source without per-site parsing code.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+import logging
+import re
+
+import soupsieve
+from bs4 import SoupStrainer, Tag
+
+from collector.fetchers import SourceFetcher
+from collector.models import NewsItem
+from collector.published import (
+    declares_published_times, element_published, metadata_strainer, soup_published_times
+)
+from collector.urls import url_key
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ContainerRule:
+    """
+    Describes the elements that hold one article each.
+    
+    Attributes:
+        tags: Tag names a container may have
+        attrs: Attribute name to regex; all must match (e.g. {'class': 'post|entry'})
+    """
+    tags: Tuple[str, ...]
+    attrs: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    """
+    Declarative description of an HTML news source.
+    
+    Field selectors are CSS selectors evaluated inside each container; when
+    several are given they are tried in priority order.
+    
+    Attributes:
+        source_name: Unique identifier for the source
+        url: Listing page to scrape
+        containers: Container rules tried in order until one matches
+        title: Selectors for the title element
+        link: Selectors for the link element (must carry href)
+        summary: Selectors for the summary element
+        published: Selectors for an element carrying the publication time
+            (<time datetime>, microdata or meta content)
+        link_in_title: Prefer a link nested inside the title element
+        base_url: Base for resolving relative links (default: url)
+        limit: Maximum number of containers to read
+        summary_length: Maximum summary length in characters
+        fallback_summary: Summary template when no summary element matches
+        require_ai_related: Drop items that do not look AI-related
+    """
+    source_name: str
+    url: str
+    containers: Tuple[ContainerRule, ...]
+    title: Tuple[str, ...]
+    link: Tuple[str, ...] = ('a[href]',)
+    summary: Tuple[str, ...] = ()
+    published: Tuple[str, ...] = (
+        'time[datetime]', '[itemprop="datePublished"]', 'meta[property="article:published_time"]'
+    )
+    link_in_title: bool = False
+    base_url: str = ''
+    limit: int = 15
+    summary_length: int = 250
+    fallback_summary: str = '{title}'
+    require_ai_related: bool = False
+
+
+class SelectorFetcher(SourceFetcher):
+    """
+    Scrapes an HTML listing page as described by a ScraperSpec.
+    
+    Selectors are compiled once per fetcher. Each container is walked in a
+    single pass, matching every field selector against each element, instead
+    of one tree search per field. Publication times come from the container
+    or from JSON-LD / OpenGraph metadata of the page; items without one are
+    left with an empty published field for the collector's first-seen time.
+    """
+    
+    SPEC: Optional[ScraperSpec] = None
+    
+    _FIELDS = ('title', 'link', 'summary', 'published')
+    
+    def __init__(self, spec: Optional[ScraperSpec] = None):
+        """
+        Initialize the fetcher from a spec.
+        
+        Args:
+            spec: Scraper description (default: the class-level SPEC)
+        """
+        spec = spec or self.SPEC
+        if spec is None:
+            raise ValueError(f"{self.__class__.__name__} requires a ScraperSpec")
+        
+        super().__init__(spec.source_name)
+        self.spec = spec
+        
+        self._containers = []
+        for rule in spec.containers:
+            attrs = {name: re.compile(pattern) for name, pattern in rule.attrs.items()}
+            self._containers.append((list(rule.tags), attrs, SoupStrainer(list(rule.tags), attrs=attrs)))
+        
+        self._selectors = {
+            name: tuple(soupsieve.compile(selector) for selector in getattr(spec, name))
+            for name in self._FIELDS
+        }
+        self._link_in_title = soupsieve.compile('a[href]')
+    
+    @classmethod
+    def from_config(cls, config) -> 'SelectorFetcher':
+        """
+        Build a scraper from a registry entry.
+        
+        The entry's url, limit, selectors and options override the matching
+        fields of the class SPEC; without a class SPEC they must describe
+        the whole page (at least containers and title). Selectors may be a
+        single string or a list in priority order, and containers a list of
+        {"tags": [...], "attrs": {...}} rules.
+        
+        Args:
+            config: SourceConfig for the source
+        
+        Returns:
+            Configured fetcher
+        """
+        fields = dict(config.options)
+        fields.update(config.selectors)
+        if config.url:
+            fields['url'] = config.url
+        if config.limit is not None:
+            fields['limit'] = config.limit
+        
+        for name in ('title', 'link', 'summary', 'published'):
+            if isinstance(fields.get(name), str):
+                fields[name] = (fields[name],)
+            elif name in fields:
+                fields[name] = tuple(fields[name])
+        if 'containers' in fields:
+            fields['containers'] = tuple(
+                ContainerRule(tags=tuple(rule['tags']), attrs=dict(rule.get('attrs', {})))
+                for rule in fields['containers']
+            )
+        
+        if cls.SPEC is not None:
+            return cls(replace(cls.SPEC, source_name=config.name, **fields))
+        return cls(ScraperSpec(source_name=config.name, **fields))
+    
+    def fetch(self) -> List[NewsItem]:
+        """
+        Scrape the listing page described by the spec.
+        
+        Returns:
+            List of NewsItem objects
+        """
+        logger.info(f"Fetching from {self.spec.url}")
+        
+        return self.fetch_cached(self.spec.url, self.parse)
+    
+    def parse(self, raw_content) -> List[NewsItem]:
+        """
+        Extract articles from the listing page HTML.
+        
+        Args:
+            raw_content: Raw HTML of the page
+        
+        Returns:
+            List of NewsItem objects
+        """
+        containers = []
+        # Dates the page declares for its articles, looked up by canonical link
+        page_times: Dict[str, str] = {}
+        with_metadata = declares_published_times(raw_content)
+        
+        # Each rule needs its own strained parse; later rules are fallbacks.
+        # The first parse also keeps the page's date metadata, if any.
+        for tags, attrs, strainer in self._containers:
+            if with_metadata:
+                strainer = metadata_strainer(strainer)
+            soup = self.parse_html(raw_content, strainer)
+            if with_metadata:
+                page_times = soup_published_times(soup, self.spec.base_url or self.spec.url)
+                with_metadata = False
+            
+            containers = soup.find_all(tags, attrs=attrs, limit=self.spec.limit)
+            if containers:
+                break
+        
+        items = []
+        
+        for container in containers:
+            try:
+                item = self._parse_container(container, page_times)
+                if item:
+                    items.append(item)
+            except Exception as e:
+                logger.warning(f"Failed to parse {self.source_name} item: {str(e)}")
+                continue
+        
+        logger.info(f"Parsed {len(items)} items from {self.source_name}")
+        return items
+    
+    def _match_fields(self, container: Tag) -> Dict[str, Tag]:
+        """
+        Find the best element for every field in one walk over the container.
+        
+        For each field the element matching the highest-priority selector
+        wins; among equal priorities the first in document order wins.
+        
+        Args:
+            container: Article container element
+        
+        Returns:
+            Mapping of field name to matched element
+        """
+        best: Dict[str, Tuple[int, Tag]] = {}
+        fields = [(name, selectors) for name, selectors in self._selectors.items() if selectors]
+        
+        for element in container.descendants:
+            if not isinstance(element, Tag):
+                continue
+            
+            settled = True
+            for name, selectors in fields:
+                current = best.get(name)
+                limit = current[0] if current else len(selectors)
+                
+                for priority in range(limit):
+                    if selectors[priority].match(element):
+                        best[name] = (priority, element)
+                        break
+                
+                if name not in best or best[name][0] > 0:
+                    settled = False
+            
+            # Every field has its top-priority match; nothing can improve
+            if settled:
+                break
+        
+        return {name: element for name, (_, element) in best.items()}
+    
+    def _parse_container(self, container: Tag,
+                         page_times: Optional[Dict[str, str]] = None) -> Optional[NewsItem]:
+        """
+        Build a NewsItem from one article container.
+        
+        Args:
+            container: Article container element
+            page_times: Publication times declared by the page, by url_key() of the link
+        
+        Returns:
+            NewsItem, or None if required fields are missing or filtered out
+        """
+        spec = self.spec
+        matches = self._match_fields(container)
+        
+        title_elem = matches.get('title')
+        if title_elem is None:
+            return None
+        
+        title = self.clean_text(title_elem.get_text())
+        
+        link_elem = None
+        if spec.link_in_title:
+            link_elem = next(
+                (el for el in title_elem.descendants
+                 if isinstance(el, Tag) and self._link_in_title.match(el)),
+                None
+            )
+        link_elem = link_elem or matches.get('link')
+        if link_elem is None or not link_elem.get('href'):
+            return None
+        
+        link = urljoin(spec.base_url or spec.url, link_elem['href'])
+        
+        summary_elem = matches.get('summary')
+        if summary_elem is not None:
+            summary = self.clean_text(summary_elem.get_text())
+        else:
+            summary = spec.fallback_summary.format(title=title)
+        
+        summary = self.truncate_summary(summary, spec.summary_length)
+        
+        published = element_published(matches.get('published'))
+        if not published and page_times:
+            published = page_times.get(url_key(link), '')
+        
+        if not (title and link):
+            return None
+        
+        if spec.require_ai_related and not self.is_ai_related(title + ' ' + summary):
+            return None
+        
+        return NewsItem(
+            title=title,
+            summary=summary,
+            link=link,
+            published=published,
+            source=self.source_name
+        )
@@ -0,0 +1,136 @@
+"""
+Persistent index of items already published by the collector.
+Remembers, per item, when it was first and last seen and the published
+time it was first emitted with, so repeated runs can skip known items and
+keep timestamps stable.
+"""
+
+from datetime import datetime, timezone
+from hashlib import blake2b
+from typing import Dict, List, Optional
+
+from collector.models import NewsItem
+from collector.state import JSONStateFile
+
+
+def item_key(item: NewsItem) -> str:
+    """
+    Compute the compact identity hash of an item.
+    
+    The canonical link identifies the item; the normalized title is the
+    fallback for items without a usable link.
+    
+    Args:
+        item: News item
+    
+    Returns:
+        16-character hex digest
+    """
+    identity = item.link_key or 'title:' + item.title_key
+    return blake2b(identity.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class SeenItemsStore(JSONStateFile):
+    """
+    Hash-keyed store of previously seen items.
+    
+    Entries are kept as compact [first_seen, last_seen, published] lists,
+    with first/last seen as Unix timestamps. The file is loaded lazily and
+    only written back, atomically, when something changed. All methods are
+    thread-safe.
+    """
+    
+    DESCRIPTION = 'seen-items store'
+    INDENT = None
+    
+    # Entries not seen again within this window are dropped on save
+    MAX_AGE_DAYS = 30
+    # last_seen is only refreshed once it is this old, so a run that sees
+    # no new items leaves the store file untouched
+    REFRESH_AFTER_DAYS = 7
+    
+    def __len__(self) -> int:
+        """Number of items in the store."""
+        with self._lock:
+            return len(self._load())
+    
+    def observe(self, item: NewsItem, now: Optional[datetime] = None) -> bool:
+        """
+        Record a sighting of an item.
+        
+        A publication time resolved by the fetcher always wins and is
+        stored. An item without one (no date on the page or in the feed)
+        gets its stored time back, or is stamped with the time it was
+        first seen, so the timestamp does not drift between runs.
+        
+        Args:
+            item: Item fetched in the current run (published may be updated)
+            now: Time of the sighting (default: current UTC time)
+        
+        Returns:
+            True if the item had never been seen before
+        """
+        now = now or datetime.now(timezone.utc)
+        timestamp = int(now.timestamp())
+        key = item_key(item)
+        
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            
+            if entry is None:
+                if not item.published:
+                    item.published = now.astimezone(timezone.utc).isoformat()
+                entries[key] = [timestamp, timestamp, item.published]
+                self._dirty = True
+                return True
+            
+            if timestamp - entry[1] >= self.REFRESH_AFTER_DAYS * 86400:
+                entry[1] = timestamp
+                self._dirty = True
+            if item.published:
+                if item.published != entry[2]:
+                    entry[2] = item.published
+                    self._dirty = True
+            else:
+                if not entry[2]:
+                    entry[2] = datetime.fromtimestamp(entry[0], timezone.utc).isoformat()
+                    self._dirty = True
+                item.published = entry[2]
+            return False
+    
+    def observe_all(self, items: List[NewsItem], now: Optional[datetime] = None) -> List[NewsItem]:
+        """
+        Record a batch of items and return the ones never seen before.
+        
+        Args:
+            items: Items fetched in the current run
+            now: Time of the sighting (default: current UTC time)
+        
+        Returns:
+            New items in their original order
+        """
+        now = now or datetime.now(timezone.utc)
+        return [item for item in items if self.observe(item, now)]
+    
+    def first_seen(self, item: NewsItem) -> Optional[datetime]:
+        """
+        Look up when an item was first seen.
+        
+        Args:
+            item: News item
+        
+        Returns:
+            UTC datetime of the first sighting, or None if unknown
+        """
+        with self._lock:
+            entry = self._load().get(item_key(item))
+        
+        if entry is None:
+            return None
+        return datetime.fromtimestamp(entry[0], timezone.utc)
+    
+    def _prune(self, entries: Dict[str, list]) -> Dict[str, list]:
+        """Drop entries not seen within MAX_AGE_DAYS."""
+        cutoff = datetime.now(timezone.utc).timestamp() - self.MAX_AGE_DAYS * 86400
+        return {key: entry for key, entry in entries.items() if entry[1] >= cutoff}
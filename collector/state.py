@@ -0,0 +1,88 @@
+"""
+Base class for the JSON state files kept between collection runs.
+The HTTP validator cache, the seen-items store and the source health file
+share the same life cycle: loaded lazily, changed under a lock and written
+back atomically only when something changed, so a crash mid-write never
+leaves a truncated file behind.
+"""
+
+from pathlib import Path
+from typing import Optional
+import json
+import logging
+import threading
+
+from collector.writer import write_atomic
+
+
+logger = logging.getLogger(__name__)
+
+
+class JSONStateFile:
+    """
+    Lazily loaded, thread-safe JSON state file.
+    
+    Subclasses keep their entries in the dict returned by _load(), hold
+    _lock around every access and set _dirty when they change something.
+    save() then writes the file with write_atomic(), so readers and later
+    runs see either the old or the new file, never a partial one.
+    """
+    
+    # Name of the file in log messages
+    DESCRIPTION = 'state file'
+    # Indentation of the written JSON; None writes it compactly
+    INDENT: Optional[int] = 2
+    
+    def __init__(self, path):
+        """
+        Initialize the state file.
+        
+        Args:
+            path: Location of the JSON file
+        """
+        self.path = Path(path)
+        self._entries: Optional[dict] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def _load(self) -> dict:
+        """Load the file on first access. Caller must hold the lock."""
+        if self._entries is None:
+            self._entries = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._entries = self._from_json(json.load(f))
+                except (OSError, ValueError, AttributeError) as e:
+                    logger.warning(f"Ignoring unreadable {self.DESCRIPTION} {self.path}: {str(e)}")
+        return self._entries
+    
+    def _from_json(self, data) -> dict:
+        """Entries stored in the parsed file."""
+        return data
+    
+    def _to_json(self, entries: dict):
+        """Document to write for the entries."""
+        return entries
+    
+    def _prune(self, entries: dict) -> dict:
+        """Entries to keep on save (default: all)."""
+        return entries
+    
+    def save(self) -> None:
+        """Write the file back to disk if it changed, dropping stale entries."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            
+            self._entries = self._prune(self._entries)
+            separators = (',', ':') if self.INDENT is None else None
+            encoder = json.JSONEncoder(indent=self.INDENT, separators=separators,
+                                       ensure_ascii=False, sort_keys=True)
+            
+            try:
+                write_atomic(self.path, encoder.iterencode(self._to_json(self._entries)))
+                self._dirty = False
+                logger.info(f"Saved {self.DESCRIPTION} with {len(self._entries)} entries")
+            except OSError as e:
+                logger.error(f"Failed to save {self.DESCRIPTION} {self.path}: {str(e)}")
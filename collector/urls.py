@@ -0,0 +1,111 @@
+"""
+URL normalization for comparing news item links.
+The same article often arrives with tracking parameters, http vs https,
+fragments or alternate arXiv paths; normalized keys make exact
+deduplication by link possible. Published links are never rewritten:
+http-only sites, meaningful query parameters and arXiv versions must keep
+working as the source linked them.
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import re
+
+
+TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref_src', 'ref_url', 'si', 'spm', '_hsenc', '_hsmi',
+})
+TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_')
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+_HOST_ALIASES = {
+    'export.arxiv.org': 'arxiv.org',
+    'www.arxiv.org': 'arxiv.org',
+    'old.reddit.com': 'www.reddit.com',
+    'np.reddit.com': 'www.reddit.com',
+    'm.reddit.com': 'www.reddit.com',
+    'reddit.com': 'www.reddit.com',
+}
+_ARXIV_PATH_RE = re.compile(r'^/(?:abs|pdf)/(?P<id>[^/]+?(?:/\d+)?)(?:v\d+)?(?:\.pdf)?/?$')
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a link for comparison with other links.
+    
+    Folds http into https, lowercases the host, drops default ports,
+    fragments and tracking parameters, sorts the remaining query and maps
+    arXiv PDF or versioned links to the unversioned abstract page. The
+    result identifies the article but is not meant to replace the link in
+    output. Non-HTTP and malformed URLs are returned stripped but otherwise
+    unchanged.
+    
+    Args:
+        url: Link as found in the source
+    
+    Returns:
+        Normalized URL
+    """
+    url = (url or '').strip()
+    if url.startswith('//'):
+        url = 'https:' + url
+    
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return url
+    
+    host = parts.hostname.lower().rstrip('.')
+    host = _HOST_ALIASES.get(host, host)
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+    
+    path = parts.path or '/'
+    if host == 'arxiv.org':
+        match = _ARXIV_PATH_RE.match(path)
+        if match:
+            path = f"/abs/{match.group('id')}"
+    
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(key)
+    ))
+    
+    return urlunsplit(('https', host, path, query, ''))
+
+
+def url_key(url: str) -> str:
+    """
+    Build a comparison key under which equivalent links collide.
+    
+    Goes beyond canonicalize_url() by ignoring the scheme, a leading
+    "www." and trailing slashes, which rarely distinguish two articles.
+    
+    Args:
+        url: Link as found in the source
+    
+    Returns:
+        Dedup key, or an empty string for an empty link
+    """
+    canonical = canonicalize_url(url)
+    if not canonical:
+        return ''
+    
+    parts = urlsplit(canonical)
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    
+    path = parts.path.rstrip('/')
+    return f"{host}{path}?{parts.query}" if parts.query else f"{host}{path}"
+
+
+def _is_tracking_param(key: str) -> bool:
+    """Check whether a query parameter only tracks the click."""
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
@@ -0,0 +1,221 @@
+"""
+Atomic file output for the data directory.
+Files are streamed to a temporary sibling, fsynced and renamed into place,
+so readers such as the web app never observe a half-written file.
+Optional .gz / .br variants are compressed from the same stream.
+"""
+
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Iterable, List, Sequence
+import filecmp
+import logging
+import os
+import shutil
+import threading
+import zlib
+
+try:
+    import brotli
+except ImportError:  # Optional: only needed for .br output
+    brotli = None
+
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED_SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+
+
+def _temp_path(path: Path) -> Path:
+    """Hidden temporary sibling of path, unique per process and thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory, where the platform allows it."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def supported_encodings(requested: Iterable[str]) -> List[str]:
+    """
+    Filter requested precompression formats down to the usable ones.
+    
+    Args:
+        requested: Encoding names ('gzip', 'br')
+    
+    Returns:
+        Usable encodings in a stable order; 'br' is dropped with a warning
+        when the brotli package is not installed
+    """
+    encodings = []
+    for encoding in requested:
+        if encoding not in COMPRESSED_SUFFIXES:
+            raise ValueError(f"Unsupported output encoding: {encoding}")
+        if encoding == 'br' and brotli is None:
+            logger.warning("brotli is not installed, skipping .br output")
+            continue
+        if encoding not in encodings:
+            encodings.append(encoding)
+    return encodings
+
+
+def compressed_siblings(path) -> List[Path]:
+    """
+    Precompressed variants (.gz, .br) of path that exist on disk.
+    
+    Args:
+        path: Uncompressed file
+    
+    Returns:
+        Existing sibling paths
+    """
+    path = Path(path)
+    siblings = (path.with_name(path.name + suffix) for suffix in COMPRESSED_SUFFIXES.values())
+    return [sibling for sibling in siblings if sibling.exists()]
+
+
+def _compressor(encoding: str):
+    """Streaming (compress, finish) pair for an encoding."""
+    if encoding == 'gzip':
+        # zlib's gzip framing stores no file name and a zero mtime, so output is reproducible
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress, compressor.flush
+    
+    compressor = brotli.Compressor(quality=11)
+    return compressor.process, compressor.finish
+
+
+def write_atomic(path, chunks: Iterable[str], links: Sequence = (),
+                 skip_unchanged: bool = True, encodings: Sequence[str] = (),
+                 digest=None) -> bool:
+    """
+    Stream text chunks into path atomically.
+    
+    The chunks are written to a temporary file in the same directory, which
+    is fsynced and then renamed over path. Precompressed siblings
+    (path.gz, path.br) are produced from the same chunks in the same pass.
+    Each of links is then pointed at the same content with link_atomic(),
+    without re-reading or re-writing it.
+    
+    Args:
+        path: Destination file
+        chunks: Text chunks, e.g. from json.JSONEncoder.iterencode()
+        links: Further paths that should hold the same content (e.g. today.json)
+        skip_unchanged: Leave path untouched if it already has identical content
+        encodings: Precompressed variants to write alongside ('gzip', 'br')
+        digest: hashlib object updated with the uncompressed bytes as they are written
+    
+    Returns:
+        True if path was (re)written, False if it was already up to date
+    """
+    path = Path(path)
+    targets = {None: path}
+    for encoding in encodings:
+        targets[encoding] = path.with_name(path.name + COMPRESSED_SUFFIXES[encoding])
+    temps = {encoding: _temp_path(target) for encoding, target in targets.items()}
+    
+    try:
+        compressors = {encoding: _compressor(encoding) for encoding in encodings}
+        
+        with ExitStack() as stack:
+            files = {
+                encoding: stack.enter_context(open(temp, 'xb'))
+                for encoding, temp in temps.items()
+            }
+            
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                files[None].write(data)
+                if digest is not None:
+                    digest.update(data)
+                for encoding, (compress, _) in compressors.items():
+                    files[encoding].write(compress(data))
+            
+            for encoding, (_, finish) in compressors.items():
+                files[encoding].write(finish())
+            
+            for f in files.values():
+                f.flush()
+                os.fsync(f.fileno())
+        
+        changed = not (skip_unchanged and path.exists()
+                       and filecmp.cmp(temps[None], path, shallow=False))
+        
+        for encoding, target in targets.items():
+            if changed or not target.exists():
+                os.replace(temps[encoding], target)
+            else:
+                temps[encoding].unlink()
+        
+        # Variants no longer produced would go stale; remove them
+        if changed:
+            for sibling in compressed_siblings(path):
+                if sibling not in targets.values():
+                    sibling.unlink()
+        
+        _fsync_directory(path.parent)
+    except BaseException:
+        for temp in temps.values():
+            temp.unlink(missing_ok=True)
+        raise
+    
+    for link in links:
+        link_atomic(path, link)
+    
+    return changed
+
+
+def link_atomic(source, target) -> None:
+    """
+    Atomically make target (and its precompressed siblings) hold the content of source.
+    
+    Uses a hard link where the file system supports it, so no data is
+    copied; otherwise falls back to a copy. Either way target is replaced
+    by rename, never truncated in place.
+    
+    Args:
+        source: Existing file
+        target: Path to create or replace
+    """
+    source, target = Path(source), Path(target)
+    
+    source_siblings = {sibling.name[len(source.name):]: sibling for sibling in compressed_siblings(source)}
+    for suffix in COMPRESSED_SUFFIXES.values():
+        target_sibling = target.with_name(target.name + suffix)
+        if suffix in source_siblings:
+            _link_file(source_siblings[suffix], target_sibling)
+        else:
+            target_sibling.unlink(missing_ok=True)
+    
+    _link_file(source, target)
+
+
+def _link_file(source: Path, target: Path) -> None:
+    """Hard link (or copy) source to target, replacing target by rename."""
+    try:
+        if target.exists() and os.path.samefile(source, target):
+            return
+    except OSError:
+        pass
+    
+    temp = _temp_path(target)
+    try:
+        try:
+            os.link(source, temp)
+        except OSError:
+            shutil.copyfile(source, temp)
+        os.replace(temp, target)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+    
+    _fsync_directory(target.parent)
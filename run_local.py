@@ -14,6 +14,31 @@ PORT = 8000
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Custom handler to serve from root directory"""
     
+    # Precompressed siblings written by the collector (--compress), best first
+    PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+    
+    def send_head(self):
+        """Serve a precompressed .json.br / .json.gz sibling when the client accepts it"""
+        path = self.translate_path(self.path)
+        
+        if path.endswith('.json'):
+            accepted = {
+                token.split(';')[0].strip().lower()
+                for token in self.headers.get('Accept-Encoding', '').split(',')
+            }
+            for encoding, suffix in self.PRECOMPRESSED:
+                if encoding in accepted and os.path.isfile(path + suffix):
+                    f = open(path + suffix, 'rb')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Encoding', encoding)
+                    self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+                    self.send_header('Vary', 'Accept-Encoding')
+                    self.end_headers()
+                    return f
+        
+        return super().send_head()
+    
     def end_headers(self):
         # Add CORS headers for local testing
         self.send_header('Access-Control-Allow-Origin', '*')
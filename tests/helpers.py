@@ -0,0 +1,80 @@
+"""
+Shared test doubles for HTTP responses and sessions.
+"""
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+    
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+    
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+    
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Session that replays queued responses and records request headers."""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+    
+    def get(self, url, timeout=None, headers=None, stream=False, **kwargs):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+class FakeStream:
+    """Stand-in for aiohttp's StreamReader."""
+    
+    def __init__(self, content):
+        self.content = content
+        self.bytes_read = 0
+    
+    async def iter_chunked(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            chunk = self.content[start:start + chunk_size]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+
+class FakeAsyncResponse:
+    """Minimal stand-in for aiohttp.ClientResponse."""
+    
+    def __init__(self, status, content=b'', headers=None):
+        self.status = status
+        self.content = FakeStream(content)
+        self.headers = headers or {}
+    
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeAsyncSession:
+    """aiohttp-style session that replays queued responses."""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+    
+    def get(self, url, headers=None, **kwargs):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
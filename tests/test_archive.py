@@ -0,0 +1,131 @@
+"""
+Unit tests for the SQLite news archive and the day files built from it.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from collector.archive import NewsArchive
+from collector.collector import NewsCollector
+from collector.models import CollectionResult, NewsItem
+
+
+def make_result(date, timestamp, sources):
+    result = CollectionResult(date=date, last_updated=timestamp)
+    for source, titles in sources.items():
+        result.add_source_items(source, [
+            NewsItem(title, "Summary", f"https://example.com/{source}/{title}", f"{date}T05:00:00+00:00", source)
+            for title in titles
+        ])
+    result.collection_status = {'total_items': result.get_total_items()}
+    return result
+
+
+class TestNewsArchive:
+    """Test cases for NewsArchive."""
+    
+    @pytest.fixture
+    def archive(self, tmp_path):
+        archive = NewsArchive(tmp_path / "archive.sqlite3")
+        yield archive
+        archive.close()
+    
+    def test_later_runs_append_new_items_first(self, archive):
+        """Test that a second run only adds unseen items, ranked before earlier ones."""
+        assert archive.add_result(make_result("2025-10-19", "2025-10-19T05:00:00Z", {"src": ["a", "b"]})) == 2
+        assert archive.add_result(make_result("2025-10-19", "2025-10-19T17:00:00Z", {"src": ["c", "a"]})) == 1
+        
+        result = archive.result_for_date("2025-10-19")
+        
+        assert [item.title for item in result.sources["src"]] == ["c", "a", "b"]
+        assert result.collection_status['total_items'] == 3
+        assert result.last_updated == "2025-10-19T17:00:00Z"
+    
+    def test_unchanged_run_keeps_timestamp(self, archive):
+        """Test that a run without new items does not advance last_updated."""
+        archive.add_result(make_result("2025-10-19", "2025-10-19T05:00:00Z", {"src": ["a", "b"], "failed": []}))
+        archive.add_result(make_result("2025-10-19", "2025-10-19T17:00:00Z", {"src": ["b"]}))
+        
+        result = archive.result_for_date("2025-10-19")
+        
+        assert result.last_updated == "2025-10-19T05:00:00Z"
+        assert list(result.sources) == ["src", "failed"]
+        assert archive.result_for_date("2025-10-20") is None
+    
+    def test_resolved_date_corrects_archived_item(self, archive):
+        """Test that a later run's real date replaces the archived one."""
+        archive.add_result(make_result("2025-10-19", "2025-10-19T05:00:00Z", {"src": ["a", "b"]}))
+        later = make_result("2025-10-19", "2025-10-19T17:00:00Z", {"src": ["a", "b"]})
+        later.sources["src"][0].published = "2025-10-18T09:30:00+00:00"
+        later.sources["src"][1].published = "2025-10-19T17:00:00Z"
+        
+        assert archive.add_result(later) == 0
+        result = archive.result_for_date("2025-10-19")
+        
+        assert [item.published for item in result.sources["src"]] == [
+            "2025-10-18T09:30:00+00:00", "2025-10-19T05:00:00+00:00"
+        ]
+        assert result.last_updated == "2025-10-19T17:00:00Z"
+    
+    def test_queries(self, archive):
+        """Test date range, source, latest and link lookups."""
+        archive.add_result(make_result("2025-10-18", "2025-10-18T05:00:00Z", {"src": ["a"], "other": ["x"]}))
+        archive.add_result(make_result("2025-10-19", "2025-10-19T05:00:00Z", {"src": ["b", "c"]}))
+        archive.add_result(make_result("2025-10-20", "2025-10-20T05:00:00Z", {"other": ["y"]}))
+        
+        assert archive.dates() == ["2025-10-20", "2025-10-19", "2025-10-18"]
+        assert archive.dates(limit=1) == ["2025-10-20"]
+        assert [i.title for i in archive.items_between("2025-10-18", "2025-10-19")] == ["b", "c", "a", "x"]
+        assert [i.title for i in archive.items_between("2025-10-18", "2025-10-20", ["other"])] == ["y", "x"]
+        assert [i.title for i in archive.items_for_source("src", limit=2)] == ["b", "c"]
+        assert [i.title for i in archive.latest(2)] == ["y", "b"]
+        assert [i.title for i in archive.items_with_link("http://www.example.com/src/a?utm_source=rss")] == ["a"]
+
+
+class TestArchivedDayFiles:
+    """Test cases for materializing day files from the archive."""
+    
+    @pytest.fixture
+    def collector(self, tmp_path):
+        collector = NewsCollector(data_dir=str(tmp_path), use_seen_store=False, use_archive=True)
+        yield collector
+        collector.archive.close()
+    
+    def test_day_file_matches_merged_file(self, collector, tmp_path):
+        """Test that a materialized day file equals the merged JSON output."""
+        morning = make_result("2025-10-19", "2025-10-19T05:00:00Z", {"src": ["a", "b"], "other": []})
+        evening = make_result("2025-10-19", "2025-10-19T17:00:00Z", {"src": ["c", "a"]})
+        
+        collector.archive_result(morning)
+        collector.archive_result(evening)
+        filepath = Path(collector.materialize_day("2025-10-19", update_today=True))
+        
+        plain = NewsCollector(data_dir=str(tmp_path / "plain"), use_seen_store=False)
+        plain.generate_json(make_result("2025-10-19", "2025-10-19T05:00:00Z", {"src": ["a", "b"], "other": []}),
+                            "2025-10-19.json")
+        merged = Path(plain.generate_json(evening, "2025-10-19.json", merge=True))
+        
+        assert filepath.read_bytes() == merged.read_bytes()
+        assert (tmp_path / "today.json").read_bytes() == filepath.read_bytes()
+    
+    def test_missing_days_are_rebuilt(self, collector, tmp_path):
+        """Test that day files in the retention window are restored from the archive."""
+        for day in ("2025-10-17", "2025-10-18", "2025-10-19"):
+            collector.archive_result(make_result(day, f"{day}T05:00:00Z", {"src": [day]}))
+        
+        written = collector.materialize_missing_days(retention_days=2)
+        
+        assert sorted(Path(path).name for path in written) == ["2025-10-18.json", "2025-10-19.json"]
+        assert not (tmp_path / "2025-10-17.json").exists()
+        data = json.loads((tmp_path / "2025-10-18.json").read_text(encoding='utf-8'))
+        assert data['sources']['src'][0]['title'] == "2025-10-18"
+        assert collector.materialize_missing_days(retention_days=2) == []
+    
+    def test_queries_require_archive(self, tmp_path):
+        """Test that archive queries fail clearly when the archive is disabled."""
+        collector = NewsCollector(data_dir=str(tmp_path), use_seen_store=False)
+        
+        with pytest.raises(RuntimeError):
+            collector.latest_items()
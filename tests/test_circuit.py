@@ -0,0 +1,110 @@
+"""
+Unit tests for the per-source circuit breaker.
+"""
+
+from datetime import datetime, timedelta, timezone
+import pytest
+
+from collector.models import NewsItem
+from collector.collector import NewsCollector
+from collector.circuit import CircuitBreaker
+from collector.fetchers import SourceFetcher
+
+
+class CountingFetcher(SourceFetcher):
+    """Fetcher that records how it was called and returns canned items."""
+    
+    def __init__(self, source_name, titles):
+        super().__init__(source_name)
+        self.titles = titles
+        self.attempt_limits = []
+    
+    def fetch_with_retry(self, max_attempts=None):
+        self.attempt_limits.append(max_attempts)
+        return self.fetch()
+    
+    def fetch(self):
+        return [
+            NewsItem(title, "Summary", f"https://example.com/{title}", "2025-10-19T10:00:00Z", self.source_name)
+            for title in self.titles
+        ]
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker state transitions."""
+    
+    @pytest.fixture
+    def breaker(self, tmp_path):
+        """Create a breaker with a low threshold."""
+        return CircuitBreaker(tmp_path / "source_health.json", failure_threshold=2, cooldown_hours=12)
+    
+    def test_opens_after_threshold(self, breaker):
+        """Test that consecutive failures open the circuit."""
+        breaker.record_failure("producthunt")
+        assert breaker.state("producthunt") == CircuitBreaker.CLOSED
+        
+        breaker.record_failure("producthunt")
+        assert breaker.state("producthunt") == CircuitBreaker.OPEN
+    
+    def test_half_opens_after_cooldown(self, breaker):
+        """Test that an open circuit allows a probe once the cooldown passes."""
+        breaker.record_failure("producthunt")
+        breaker.record_failure("producthunt")
+        
+        later = datetime.now(timezone.utc) + timedelta(hours=13)
+        assert breaker.state("producthunt", now=later) == CircuitBreaker.HALF_OPEN
+    
+    def test_success_closes_circuit(self, breaker):
+        """Test that a successful fetch resets the failure count."""
+        breaker.record_failure("producthunt")
+        breaker.record_failure("producthunt")
+        breaker.record_success("producthunt")
+        
+        assert breaker.state("producthunt") == CircuitBreaker.CLOSED
+    
+    def test_state_persists(self, breaker, tmp_path):
+        """Test that the state file carries failures across runs."""
+        breaker.record_failure("producthunt")
+        breaker.record_failure("producthunt")
+        breaker.save()
+        
+        reloaded = CircuitBreaker(tmp_path / "source_health.json", failure_threshold=2)
+        assert reloaded.state("producthunt") == CircuitBreaker.OPEN
+
+
+class TestCollectorCircuit:
+    """Test cases for circuit breaker integration in NewsCollector."""
+    
+    def test_open_source_is_skipped(self, tmp_path):
+        """Test that a source failing every run stops being fetched."""
+        collector = NewsCollector(data_dir=str(tmp_path))
+        dead = CountingFetcher("producthunt", [])
+        collector.register_fetcher(dead)
+        collector.register_fetcher(CountingFetcher("arxiv", ["Paper"]))
+        
+        for _ in range(3):
+            collector.collect_all_sources()
+        
+        result = collector.collect_all_sources()
+        
+        assert len(dead.attempt_limits) == 3
+        assert result.collection_status['failed_sources'] == ["producthunt"]
+        assert result.collection_status['skipped_sources'] == ["producthunt"]
+        assert (tmp_path / "source_health.json").exists()
+    
+    def test_half_open_source_gets_single_probe(self, tmp_path):
+        """Test that a half-open source is probed with one attempt."""
+        collector = NewsCollector(data_dir=str(tmp_path))
+        collector.circuit_breaker.cooldown = timedelta(0)
+        fetcher = CountingFetcher("producthunt", [])
+        collector.register_fetcher(fetcher)
+        
+        for _ in range(3):
+            collector.collect_all_sources()
+        
+        fetcher.titles = ["Back online"]
+        result = collector.collect_all_sources()
+        
+        assert fetcher.attempt_limits == [None, None, None, 1]
+        assert result.collection_status['successful'] == 1
+        assert collector.circuit_breaker.state("producthunt") == CircuitBreaker.CLOSED
@@ -0,0 +1,300 @@
+"""
+Unit tests for source collection orchestration in NewsCollector.
+Uses stub fetchers so no network access is required.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+
+from collector.models import NewsItem
+from collector.collector import NewsCollector
+from collector.fetchers import SourceFetcher, AsyncSourceFetcher
+from collector.sources import AsyncFeedFetcher, FeedFetcher
+
+
+# Upper bound for stubs waiting on a barrier or event, so a broken test fails instead of hanging
+WAIT_TIMEOUT = 5.0
+
+
+class StubFetcher(SourceFetcher):
+    """
+    Fetcher returning canned items after an optional delay.
+    
+    A barrier makes the fetch wait for the other sources sharing it, so it
+    only succeeds if they all run at the same time. A release event holds
+    the fetch until the test sets it; finished is set once it returns.
+    """
+    
+    def __init__(self, source_name, titles, delay=0.0, error=None, barrier=None, release=None):
+        super().__init__(source_name)
+        self.titles = titles
+        self.delay = delay
+        self.error = error
+        self.barrier = barrier
+        self.release = release
+        self.finished = threading.Event()
+    
+    def fetch_with_retry(self, max_attempts=None):
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if self.barrier is not None:
+                self.barrier.wait(WAIT_TIMEOUT)
+            if self.release is not None:
+                self.release.wait(WAIT_TIMEOUT)
+            if self.error:
+                raise self.error
+            return self.fetch()
+        finally:
+            self.finished.set()
+    
+    def fetch(self):
+        return [
+            NewsItem(title, f"Summary of {title}", f"https://example.com/{i}",
+                     "2025-10-19T10:00:00Z", self.source_name)
+            for i, title in enumerate(self.titles)
+        ]
+
+
+class TestConcurrentCollection:
+    """Test cases for concurrent collection mode."""
+    
+    @pytest.fixture
+    def collector(self, tmp_path):
+        """Create a NewsCollector with temporary data directory."""
+        return NewsCollector(data_dir=str(tmp_path))
+    
+    def _register(self, collector, *fetchers):
+        for fetcher in fetchers:
+            collector.register_fetcher(fetcher)
+    
+    def test_concurrent_matches_sequential(self, collector):
+        """Test that concurrent mode produces the same result as sequential mode."""
+        self._register(
+            collector,
+            StubFetcher("slow", ["A", "B", "A"], delay=0.05),
+            StubFetcher("empty", []),
+            StubFetcher("fast", ["C"])
+        )
+        
+        sequential = collector.collect_all_sources()
+        concurrent = collector.collect_all_sources(max_workers=3)
+        
+        assert concurrent.to_dict()['sources'] == sequential.to_dict()['sources']
+        assert concurrent.collection_status == sequential.collection_status
+        assert list(concurrent.sources) == ["slow", "empty", "fast"]
+        assert concurrent.collection_status['failed_sources'] == ["empty"]
+        assert concurrent.collection_status['total_items'] == 3
+    
+    def test_sources_run_in_parallel(self, collector):
+        """Test that all sources are in flight at once, so the slowest bounds the run."""
+        barrier = threading.Barrier(4)
+        self._register(collector, *[
+            StubFetcher(f"source{i}", [f"Title {i}"], barrier=barrier) for i in range(4)
+        ])
+        
+        result = collector.collect_all_sources(max_workers=4)
+        
+        assert result.collection_status['successful'] == 4
+        assert not barrier.broken
+    
+    def test_source_deadline_marks_source_failed(self, collector):
+        """Test that a source exceeding its deadline is reported as failed without waiting for it."""
+        release = threading.Event()
+        hanging = StubFetcher("hanging", ["Late"], release=release)
+        self._register(collector, hanging, StubFetcher("quick", ["On time"]))
+        
+        try:
+            result = collector.collect_all_sources(max_workers=2, source_timeout=0.2)
+            assert not hanging.finished.is_set()
+        finally:
+            release.set()
+        
+        assert result.sources["hanging"] == []
+        assert len(result.sources["quick"]) == 1
+        assert result.collection_status['failed_sources'] == ["hanging"]
+    
+    def test_abandoned_source_counts_one_failure(self, collector):
+        """Test that a source finishing after its deadline is not recorded twice."""
+        release = threading.Event()
+        hanging = StubFetcher("hanging", ["Late"], release=release)
+        self._register(collector, hanging, StubFetcher("quick", ["On time"]))
+        
+        collector.collect_all_sources(max_workers=2, source_timeout=0.1)
+        release.set()
+        assert hanging.finished.wait(WAIT_TIMEOUT)
+        
+        health = collector.circuit_breaker._load()
+        assert health["hanging"]["consecutive_failures"] == 1
+        assert "healthy_since" not in health["hanging"]
+    
+    def test_unchanged_run_leaves_data_untouched(self, tmp_path):
+        """Test that a repeated run with the same content changes no file in the data directory.
+        
+        A failing source still changes source_health.json, since its failure count advances.
+        """
+        def run():
+            collector = NewsCollector(data_dir=str(tmp_path))
+            self._register(collector, StubFetcher("papers", ["A", "B"]), StubFetcher("forum", ["C"]))
+            result = collector.collect_all_sources()
+            collector.generate_json(result, f"{result.date}.json", merge=True, update_today=True)
+            collector.update_index(collector.get_available_dates())
+            return {path.name: path.read_bytes() for path in tmp_path.iterdir() if path.is_file()}
+        
+        first = run()
+        time.sleep(0.01)
+        
+        assert run() == first
+        assert "source_health.json" in first and "seen_items.json" in first
+    
+    def test_fetcher_exception_is_isolated(self, collector):
+        """Test that an exception in one source does not affect the others."""
+        self._register(
+            collector,
+            StubFetcher("broken", [], error=RuntimeError("boom")),
+            StubFetcher("working", ["Fine"])
+        )
+        
+        result = collector.collect_all_sources(max_workers=2)
+        
+        assert result.collection_status['failed_sources'] == ["broken"]
+        assert result.collection_status['successful'] == 1
+
+
+class StubAsyncFetcher(AsyncSourceFetcher):
+    """Async fetcher returning canned items after an optional delay or barrier."""
+    
+    def __init__(self, source_name, titles, delay=0.0, barrier=None):
+        super().__init__(source_name)
+        self.titles = titles
+        self.delay = delay
+        self.barrier = barrier
+    
+    async def fetch(self):
+        await asyncio.sleep(self.delay)
+        if self.barrier is not None:
+            await self.barrier.wait()
+        return [
+            NewsItem(title, "Summary", f"https://example.com/{title}",
+                     "2025-10-19T10:00:00Z", self.source_name)
+            for title in self.titles
+        ]
+
+
+class TestAsyncCollection:
+    """Test cases for the asyncio orchestrator."""
+    
+    @pytest.fixture
+    def collector(self, tmp_path):
+        """Create a NewsCollector with temporary data directory."""
+        return NewsCollector(data_dir=str(tmp_path))
+    
+    def test_many_async_sources_share_one_loop(self, collector):
+        """Test that hundreds of async sources run on one loop, max_concurrency at a time."""
+        barrier = asyncio.Barrier(100)
+        for i in range(200):
+            collector.register_fetcher(StubAsyncFetcher(f"feed{i}", [f"Item {i}"], barrier=barrier))
+        
+        result = asyncio.run(collector.collect_all_sources_async(
+            max_concurrency=100, source_timeout=WAIT_TIMEOUT
+        ))
+        
+        assert result.collection_status['successful'] == 200
+        assert list(result.sources)[:3] == ["feed0", "feed1", "feed2"]
+    
+    def test_sync_fetchers_are_adapted(self, collector):
+        """Test that blocking fetchers run alongside async ones."""
+        collector.register_fetcher(StubFetcher("sync", ["A", "A", "B"]))
+        collector.register_fetcher(StubAsyncFetcher("async", ["C"]))
+        
+        result = asyncio.run(collector.collect_all_sources_async())
+        
+        assert [item.title for item in result.sources["sync"]] == ["A", "B"]
+        assert [item.title for item in result.sources["async"]] == ["C"]
+        assert result.collection_status['total_items'] == 3
+    
+    def test_async_source_deadline(self, collector):
+        """Test that a slow async source is reported as failed."""
+        collector.register_fetcher(StubAsyncFetcher("slow", ["Late"], delay=1.0))
+        collector.register_fetcher(StubAsyncFetcher("fast", ["Early"]))
+        
+        result = asyncio.run(collector.collect_all_sources_async(source_timeout=0.2))
+        
+        assert result.collection_status['failed_sources'] == ["slow"]
+    
+    def test_async_fetcher_in_blocking_collection(self, collector):
+        """Test that async fetchers also work with collect_all_sources."""
+        collector.register_fetcher(StubAsyncFetcher("async", ["One", "Two"]))
+        
+        result = collector.collect_all_sources()
+        
+        assert result.collection_status['total_items'] == 2
+
+
+class TestFeedFetchers:
+    """Test feed parsing in FeedFetcher and AsyncFeedFetcher."""
+    
+    FEED = b"""<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>Feed</title>
+      <item>
+        <title>New transformer model</title>
+        <link>https://example.com/post</link>
+        <description>&lt;p&gt;A &lt;b&gt;great&lt;/b&gt; paper&lt;/p&gt;</description>
+        <pubDate>Sun, 19 Oct 2025 10:00:00 GMT</pubDate>
+      </item>
+    </channel></rss>"""
+    
+    @pytest.mark.parametrize("fetcher_class", [FeedFetcher, AsyncFeedFetcher])
+    def test_parse_feed_bytes(self, fetcher_class):
+        """Test that feed entries become NewsItems with UTC timestamps."""
+        fetcher = fetcher_class("feed", "https://example.com/rss", title_prefix="[feed] ")
+        items = fetcher.parse(self.FEED)
+        
+        assert len(items) == 1
+        assert items[0].title == "[feed] New transformer model"
+        assert items[0].summary == "A great paper"
+        assert items[0].published == "2025-10-19T10:00:00+00:00"
+        assert items[0].source == "feed"
+
+
+class TestIncrementalCollection:
+    """Test cases for collection backed by the seen-items store."""
+    
+    def test_incremental_emits_only_new_items(self, tmp_path):
+        """Test that a second run only emits items the first run did not publish."""
+        first = NewsCollector(data_dir=str(tmp_path), incremental=True)
+        first.register_fetcher(StubFetcher("src", ["A", "B"]))
+        first.generate_json(first.collect_all_sources(), "2025-10-19.json")
+        
+        second = NewsCollector(data_dir=str(tmp_path), incremental=True)
+        second.register_fetcher(StubFetcher("src", ["A", "B", "C"]))
+        result = second.collect_all_sources()
+        
+        assert [item.title for item in result.sources["src"]] == ["C"]
+        assert result.collection_status['successful'] == 1
+    
+    def test_incremental_runs_keep_earlier_items(self, tmp_path):
+        """Test that an incremental run adds to the day file instead of replacing it."""
+        first = NewsCollector(data_dir=str(tmp_path), incremental=True)
+        first.register_fetcher(StubFetcher("src", ["A", "B"]))
+        first.generate_json(first.collect_all_sources(), "2025-10-19.json")
+        
+        second = NewsCollector(data_dir=str(tmp_path), incremental=True)
+        second.register_fetcher(StubFetcher("src", ["A", "B", "C"]))
+        second.generate_json(second.collect_all_sources(), "2025-10-19.json")
+        
+        stored = second.load_result("2025-10-19.json")
+        assert [item.title for item in stored.sources["src"]] == ["C", "A", "B"]
+    
+    def test_unsaved_run_does_not_mark_items_seen(self, tmp_path):
+        """Test that items only count as published once a file is written."""
+        dry = NewsCollector(data_dir=str(tmp_path), incremental=True)
+        dry.register_fetcher(StubFetcher("src", ["A"]))
+        dry.collect_all_sources()
+        
+        real = NewsCollector(data_dir=str(tmp_path), incremental=True)
+        real.register_fetcher(StubFetcher("src", ["A"]))
+        
+        assert [item.title for item in real.collect_all_sources().sources["src"]] == ["A"]
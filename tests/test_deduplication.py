@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 
 from collector.models import NewsItem, CollectionResult
 from collector.collector import NewsCollector
+from collector.dedup import NearDuplicateDetector, normalize_title
 
 
 class TestDeduplication:
@@ -135,6 +136,33 @@ class TestDeduplication:
         total_items = deduplicated_result.get_total_items()
         assert total_items == 3  # One duplicate removed
     
+    def test_deduplicate_by_canonical_link(self):
+        """Test that the same article under a different title and link variant is removed."""
+        collector = NewsCollector(data_dir="test_data")
+        
+        items = [
+            NewsItem("Agents that plan", "Summary", "https://arxiv.org/abs/2510.00001", "2025-10-19T10:00:00Z", "arxiv"),
+            NewsItem("[r/ML] New paper on planning agents", "Summary", "http://arxiv.org/pdf/2510.00001v2?utm_source=reddit", "2025-10-19T11:00:00Z", "reddit"),
+            NewsItem("Unrelated", "Summary", "https://arxiv.org/abs/2510.00002", "2025-10-19T11:00:00Z", "arxiv")
+        ]
+        
+        unique_items = collector._deduplicate_items(items)
+        
+        assert [item.title for item in unique_items] == ["Agents that plan", "Unrelated"]
+    
+    def test_deduplicate_keeps_original_links(self):
+        """Test that links are only normalized for comparison, never rewritten."""
+        collector = NewsCollector(data_dir="test_data")
+        
+        items = [
+            NewsItem("Release notes", "Summary", "http://example.com/notes?ref=main", "2025-10-19T10:00:00Z", "a"),
+            NewsItem("Release notes (mirror)", "Summary", "https://example.com/notes?ref=main#top", "2025-10-19T11:00:00Z", "b"),
+        ]
+        
+        unique_items = collector._deduplicate_items(items)
+        
+        assert [item.link for item in unique_items] == ["http://example.com/notes?ref=main"]
+    
     def test_deduplicate_maintains_source_attribution(self):
         """Test that deduplication maintains source information."""
         collector = NewsCollector(data_dir="test_data")
@@ -149,3 +177,84 @@ class TestDeduplication:
         assert len(unique_items) == 2
         assert unique_items[0].source == "source1"
         assert unique_items[1].source == "source2"
+
+
+class TestNearDuplicates:
+    """Test cases for MinHash/LSH near-duplicate clustering."""
+    
+    def make_result(self):
+        result = CollectionResult(date="2025-10-19", last_updated="2025-10-19T10:00:00Z")
+        result.add_source_items("ai_news", [
+            NewsItem("OpenAI releases GPT-5 with better reasoning", "S", "https://a.com/1", "2025-10-19T10:00:00Z", "ai_news"),
+            NewsItem("Google unveils Gemini 3", "S", "https://a.com/2", "2025-10-19T10:00:00Z", "ai_news")
+        ])
+        result.add_source_items("reddit", [
+            NewsItem("[r/singularity] OpenAI releases GPT-5 with better reasoning!", "S", "https://r.com/1", "2025-10-19T10:00:00Z", "reddit"),
+            NewsItem("[r/LocalLLaMA] Running Llama on a phone", "S", "https://r.com/2", "2025-10-19T10:00:00Z", "reddit")
+        ])
+        result.add_source_items("crescendo", [
+            NewsItem("OpenAI's GPT-5 release brings better reasoning", "S", "https://c.com/1", "2025-10-19T10:00:00Z", "crescendo")
+        ])
+        result.collection_status = {'total_items': 5}
+        return result
+    
+    def test_normalize_title_strips_subreddit_prefix(self):
+        """Test that Reddit prefixes and punctuation do not affect similarity."""
+        assert normalize_title("[r/MachineLearning] New  Model, Released!") == "new model released"
+    
+    def test_clusters_keep_first_item_as_canonical(self):
+        """Test that the same story from several sources forms one cluster."""
+        collector = NewsCollector(data_dir="test_data")
+        
+        clusters = collector.find_near_duplicates(self.make_result())
+        
+        assert len(clusters) == 3
+        assert clusters[0].canonical.source == "ai_news"
+        assert clusters[0].sources == ["ai_news", "reddit", "crescendo"]
+    
+    def test_fuzzy_cross_source_dedup(self):
+        """Test that fuzzy deduplication drops alternates and updates the status."""
+        collector = NewsCollector(data_dir="test_data")
+        
+        result = collector.deduplicate_across_sources(self.make_result(), fuzzy=True)
+        
+        assert result.get_total_items() == 3
+        assert result.sources["crescendo"] == []
+        assert [item.link for item in result.sources["reddit"]] == ["https://r.com/2"]
+        # The Reddit copy is an exact hit once its prefix is stripped
+        assert result.collection_status['near_duplicates_removed'] == 1
+        assert result.collection_status['total_items'] == 3
+    
+    def test_unrelated_titles_stay_apart(self):
+        """Test that distinct stories, even with shared words, are not merged."""
+        detector = NearDuplicateDetector()
+        titles = [
+            "OpenAI releases GPT-5 with better reasoning",
+            "OpenAI hires new chief financial officer",
+            "Anthropic releases Claude with better coding",
+            "Meta open-sources a new Llama model",
+            "Nvidia reports record data center revenue"
+        ]
+        items = [NewsItem(title, "S", f"https://x.com/{i}", "2025-10-19T10:00:00Z", "s")
+                 for i, title in enumerate(titles)]
+        
+        clusters = detector.cluster(items)
+        
+        assert [cluster.canonical.title for cluster in clusters] == titles
+        assert all(cluster.alternates == [] for cluster in clusters)
+    
+    @pytest.mark.parametrize("first, second", [
+        ("OpenAI releases GPT-5", "OpenAI releases GPT-4o"),
+        ("Meta releases Llama 3", "Meta releases Llama 4"),
+        ("Google launches Gemini 2.0", "Google launches Gemini 2.5 Pro"),
+        ("A Survey on Large Language Models for Code Generation",
+         "A Survey on Large Language Models for Code Review"),
+    ])
+    def test_different_stories_with_similar_titles_stay_apart(self, first, second):
+        """Test that titles differing in a version or a key word are not merged."""
+        items = [NewsItem(title, "S", f"https://x.com/{i}", "2025-10-19T10:00:00Z", "s")
+                 for i, title in enumerate([first, second])]
+        
+        clusters = NearDuplicateDetector().cluster(items)
+        
+        assert [cluster.canonical.title for cluster in clusters] == [first, second]
@@ -0,0 +1,43 @@
+"""
+Unit tests for content fingerprints.
+"""
+
+from collector.fingerprint import result_fingerprint, source_fingerprint
+from collector.models import CollectionResult, ItemBatch, NewsItem
+
+
+def make_item(title, link, published="2025-10-19T10:00:00+00:00", summary="Summary"):
+    return NewsItem(title, summary, link, published, "src")
+
+
+class TestFingerprints:
+    """Test cases for source and result fingerprints."""
+    
+    def test_volatile_fields_ignored(self):
+        """Test that published times and link tracking do not affect the fingerprint."""
+        morning = [make_item("Title", "https://example.com/a", "2025-10-19T05:00:00+00:00")]
+        evening = [make_item(" Title ", "http://example.com/a?utm_source=rss", "2025-10-19T17:00:00+00:00")]
+        
+        assert source_fingerprint(morning) == source_fingerprint(evening)
+        assert source_fingerprint(morning) == source_fingerprint(ItemBatch.from_items(evening))
+    
+    def test_material_changes_detected(self):
+        """Test that content and order changes produce a new fingerprint."""
+        items = [make_item("A", "https://example.com/a"), make_item("B", "https://example.com/b")]
+        
+        assert source_fingerprint(items) != source_fingerprint(items[::-1])
+        assert source_fingerprint(items) != source_fingerprint(
+            [items[0], make_item("B", "https://example.com/b", summary="Updated")]
+        )
+    
+    def test_result_fingerprint_ignores_last_updated(self):
+        """Test that results differing only in last_updated match."""
+        def make_result(timestamp, status):
+            result = CollectionResult(date="2025-10-19", last_updated=timestamp, collection_status=status)
+            result.add_source_items("src", [make_item("A", "https://example.com/a")])
+            return result
+        
+        first = make_result("2025-10-19T05:00:00Z", {'total_items': 1})
+        
+        assert result_fingerprint(first) == result_fingerprint(make_result("2025-10-19T17:00:00Z", {'total_items': 1}))
+        assert result_fingerprint(first) != result_fingerprint(make_result("2025-10-19T17:00:00Z", {'total_items': 2}))
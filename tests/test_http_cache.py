@@ -0,0 +1,183 @@
+"""
+Unit tests for the conditional GET validator cache.
+"""
+
+import asyncio
+
+import pytest
+
+from collector.models import NewsItem
+from collector.fetchers import SourceFetcher
+from collector.sources import ArxivFetcher, AsyncFeedFetcher
+from collector.http_cache import HTTPValidatorCache
+from tests.helpers import FakeAsyncResponse, FakeAsyncSession, FakeResponse, FakeSession
+
+
+class PageFetcher(SourceFetcher):
+    """Fetcher parsing one title per line of the page body."""
+    
+    URL = "https://example.com/news"
+    
+    def __init__(self):
+        super().__init__("page")
+        self.parse_calls = 0
+    
+    def fetch(self):
+        return self.fetch_cached(self.URL, self.parse)
+    
+    def parse(self, raw_content):
+        self.parse_calls += 1
+        return [
+            NewsItem(line, line, f"https://example.com/{i}", "2025-10-19T10:00:00Z", self.source_name)
+            for i, line in enumerate(raw_content.decode().splitlines())
+        ]
+
+
+class TestHTTPValidatorCache:
+    """Test cases for HTTPValidatorCache."""
+    
+    def test_store_and_reload(self, tmp_path):
+        """Test that validators and items survive a save/load cycle."""
+        path = tmp_path / "http_cache.json"
+        cache = HTTPValidatorCache(path)
+        item = NewsItem("Title", "Summary", "https://example.com", "2025-10-19T10:00:00Z", "src")
+        cache.store("https://example.com/feed", '"abc"', "Sun, 19 Oct 2025 10:00:00 GMT", [item])
+        cache.save()
+        
+        reloaded = HTTPValidatorCache(path)
+        
+        assert reloaded.conditional_headers("https://example.com/feed") == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': "Sun, 19 Oct 2025 10:00:00 GMT"
+        }
+        items = reloaded.get_items("https://example.com/feed")
+        assert items[0].title == "Title"
+        assert items[0].source == "src"
+    
+    def test_no_validators_means_no_entry(self, tmp_path):
+        """Test that responses without validators are not cached."""
+        cache = HTTPValidatorCache(tmp_path / "http_cache.json")
+        item = NewsItem("Title", "Summary", "https://example.com", "2025-10-19T10:00:00Z", "src")
+        cache.store("https://example.com/feed", None, None, [item])
+        
+        assert cache.conditional_headers("https://example.com/feed") == {}
+        assert cache.get_items("https://example.com/feed") is None
+    
+    def test_not_modified_reuses_items(self, tmp_path):
+        """Test that a 304 response returns cached items without parsing."""
+        fetcher = PageFetcher()
+        fetcher.http_cache = HTTPValidatorCache(tmp_path / "http_cache.json")
+        fetcher.session = FakeSession(
+            FakeResponse(200, b"First story\nSecond story", {'ETag': '"v1"'}),
+            FakeResponse(304)
+        )
+        
+        first = fetcher.fetch()
+        second = fetcher.fetch()
+        
+        assert [item.title for item in second] == [item.title for item in first]
+        assert fetcher.parse_calls == 1
+        assert fetcher.session.sent_headers[0] == {}
+        assert fetcher.session.sent_headers[1] == {'If-None-Match': '"v1"'}
+    
+    def test_not_modified_run_leaves_file_untouched(self, tmp_path):
+        """Test that a later run answered with 304 does not rewrite the cache file."""
+        path = tmp_path / "http_cache.json"
+        fetcher = PageFetcher()
+        fetcher.http_cache = HTTPValidatorCache(path)
+        fetcher.session = FakeSession(FakeResponse(200, b"Story", {'ETag': '"v1"'}))
+        fetcher.fetch()
+        fetcher.http_cache.save()
+        content = path.read_bytes()
+        
+        later = PageFetcher()
+        later.http_cache = HTTPValidatorCache(path)
+        later.session = FakeSession(FakeResponse(304))
+        later.fetch()
+        later.http_cache.save()
+        
+        assert path.read_bytes() == content
+    
+    def test_without_cache_plain_get(self):
+        """Test that fetchers work unchanged when no cache is attached."""
+        fetcher = PageFetcher()
+        fetcher.session = FakeSession(FakeResponse(200, b"Only story", {'ETag': '"v1"'}))
+        
+        items = fetcher.fetch()
+        
+        assert len(items) == 1
+        assert fetcher.session.sent_headers[0] == {}
+
+
+class TestSessionDownloads:
+    """Test cases for downloads through the pooled session."""
+    
+    FEED = b"""<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>cs.AI</title>
+      <item>
+        <title>Agents that plan</title>
+        <link>https://arxiv.org/abs/2510.00001</link>
+        <description>We study planning agents.</description>
+      </item>
+    </channel></rss>"""
+    
+    def test_feed_is_downloaded_through_session(self, tmp_path):
+        """Test that feeds are fetched with the session and parsed from bytes."""
+        fetcher = ArxivFetcher()
+        fetcher.http_cache = HTTPValidatorCache(tmp_path / "http_cache.json")
+        fetcher.session = FakeSession(
+            FakeResponse(200, self.FEED, {'Last-Modified': "Sun, 19 Oct 2025 10:00:00 GMT"}),
+            FakeResponse(304)
+        )
+        
+        first = fetcher.fetch()
+        second = fetcher.fetch()
+        
+        assert [item.title for item in first] == ["Agents that plan"]
+        assert [item.link for item in second] == ["https://arxiv.org/abs/2510.00001"]
+        assert fetcher.session.sent_headers[1] == {
+            'If-Modified-Since': "Sun, 19 Oct 2025 10:00:00 GMT"
+        }
+    
+    def test_oversized_response_is_rejected(self):
+        """Test that bodies beyond the size cap raise instead of buffering."""
+        fetcher = PageFetcher()
+        fetcher.MAX_CONTENT_BYTES = 10
+        fetcher.session = FakeSession(FakeResponse(200, b"x" * 100))
+        
+        with pytest.raises(ValueError):
+            fetcher.fetch()
+
+
+class TestAsyncDownloads:
+    """Test cases for downloads through the shared async session."""
+    
+    FEED = TestSessionDownloads.FEED
+    
+    def test_not_modified_reuses_items(self, tmp_path):
+        """Test that async feeds send validators and reuse items on 304."""
+        fetcher = AsyncFeedFetcher("feed", "https://example.com/rss")
+        fetcher.http_cache = HTTPValidatorCache(tmp_path / "http_cache.json")
+        fetcher.http_session = FakeAsyncSession(
+            FakeAsyncResponse(200, self.FEED, {'ETag': '"v1"'}),
+            FakeAsyncResponse(304)
+        )
+        
+        first = asyncio.run(fetcher.fetch())
+        second = asyncio.run(fetcher.fetch())
+        
+        assert [item.title for item in first] == ["Agents that plan"]
+        assert [item.link for item in second] == ["https://arxiv.org/abs/2510.00001"]
+        assert fetcher.http_session.sent_headers == [{}, {'If-None-Match': '"v1"'}]
+    
+    def test_oversized_response_is_rejected(self):
+        """Test that async reads stop at the size cap instead of buffering the body."""
+        fetcher = AsyncFeedFetcher("feed", "https://example.com/rss")
+        fetcher.MAX_CONTENT_BYTES = 10
+        fetcher.CHUNK_SIZE = 4
+        response = FakeAsyncResponse(200, b"x" * 100)
+        fetcher.http_session = FakeAsyncSession(response)
+        
+        with pytest.raises(ValueError):
+            asyncio.run(fetcher.fetch())
+        assert response.content.bytes_read == 12
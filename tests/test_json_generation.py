@@ -4,6 +4,7 @@ Tests use real data from actual fetchers.
 """
 
 import pytest
+import hashlib
 import json
 import tempfile
 import shutil
@@ -237,3 +238,315 @@ class TestJSONGeneration:
         assert '  "date"' in content or '\t"date"' in content
         # Should be multi-line
         assert content.count('\n') > 5
+
+
+class TestIndexManifest:
+    """Test cases for the per-day manifest in index.json."""
+    
+    @pytest.fixture
+    def collector(self, tmp_path):
+        """Create a NewsCollector with temporary data directory."""
+        return NewsCollector(data_dir=str(tmp_path), use_seen_store=False)
+    
+    def write_day(self, collector, date, counts):
+        result = CollectionResult(date=date, last_updated=f"{date}T05:00:00Z")
+        for source, count in counts.items():
+            result.add_source_items(source, [
+                NewsItem(f"{source} {i}", "Summary", f"https://example.com/{source}/{i}", f"{date}T05:00:00Z", source)
+                for i in range(count)
+            ])
+        return Path(collector.generate_json(result, f"{date}.json"))
+    
+    def read_index(self, collector):
+        with open(collector.data_dir / "index.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def test_manifest_describes_day_files(self, collector):
+        """Test that each date lists its counts, hash and size."""
+        filepath = self.write_day(collector, "2025-10-19", {"arxiv": 2, "reddit": 1, "empty": 0})
+        
+        collector.update_index(["2025-10-19", "2025-10-18"])
+        data = self.read_index(collector)
+        content = filepath.read_bytes()
+        
+        assert data['total_items'] == 3
+        assert list(data['dates']) == ["2025-10-19"]
+        assert data['dates']["2025-10-19"] == {
+            'items': 3,
+            'sources': {"arxiv": 2, "reddit": 1, "empty": 0},
+            'sha256': hashlib.sha256(content).hexdigest(),
+            'bytes': len(content)
+        }
+    
+    def test_entries_reused_until_file_changes(self, collector, tmp_path):
+        """Test that a later run reuses entries whose hash matches and rescans changed files."""
+        filepath = self.write_day(collector, "2025-10-19", {"arxiv": 2})
+        collector.update_index(["2025-10-19"])
+        
+        index_path = tmp_path / "index.json"
+        data = self.read_index(collector)
+        data['dates']["2025-10-19"]['items'] = 99
+        index_path.write_text(json.dumps(data), encoding='utf-8')
+        
+        later = NewsCollector(data_dir=str(tmp_path), use_seen_store=False)
+        later.update_index(["2025-10-19"])
+        assert self.read_index(later)['dates']["2025-10-19"]['items'] == 99
+        
+        # An edit that keeps the size must not leave the old hash behind
+        content = filepath.read_bytes()
+        edited = content.replace(b"T05:00:00Z", b"T06:00:00Z")
+        assert len(edited) == len(content) and edited != content
+        filepath.write_bytes(edited)
+        later.update_index(["2025-10-19"])
+        entry = self.read_index(later)['dates']["2025-10-19"]
+        assert entry['items'] == 2
+        assert entry['sha256'] == hashlib.sha256(edited).hexdigest()
+    
+    def test_index_sharded_by_month(self, collector, tmp_path):
+        """Test that long histories move day entries into monthly shards."""
+        dates = ["2025-09-30", "2025-10-01", "2025-10-02"]
+        for date in dates:
+            self.write_day(collector, date, {"arxiv": 1})
+        collector.INDEX_SHARD_THRESHOLD = 2
+        
+        collector.update_index(dates)
+        data = self.read_index(collector)
+        
+        assert 'dates' not in data
+        assert data['total_items'] == 3
+        assert data['months']["2025-10"]['file'] == "index/2025-10.json"
+        assert data['months']["2025-10"]['days'] == 2
+        shard = (tmp_path / "index" / "2025-10.json").read_bytes()
+        assert data['months']["2025-10"]['sha256'] == hashlib.sha256(shard).hexdigest()
+        assert list(json.loads(shard)['dates']) == ["2025-10-02", "2025-10-01"]
+        
+        collector.INDEX_SHARD_THRESHOLD = 31
+        collector.update_index(dates)
+        
+        assert list(self.read_index(collector)['dates']) == ["2025-10-02", "2025-10-01", "2025-09-30"]
+        assert list((tmp_path / "index").iterdir()) == []
+
+
+class TestSourceFiles:
+    """Test cases for per-source split output."""
+    
+    @pytest.fixture
+    def collector(self, tmp_path):
+        """Create a NewsCollector that splits day files by source."""
+        return NewsCollector(data_dir=str(tmp_path), use_seen_store=False, split_sources=True)
+    
+    def make_result(self, date, sources):
+        result = CollectionResult(date=date, last_updated=f"{date}T05:00:00Z")
+        for source, titles in sources.items():
+            result.add_source_items(source, [
+                NewsItem(title, "Summary", f"https://example.com/{title}", f"{date}T05:00:00Z", source)
+                for title in titles
+            ])
+        result.collection_status = {'total_items': result.get_total_items()}
+        return result
+    
+    def test_source_files_match_day_file(self, collector, tmp_path):
+        """Test that the per-source files and header reassemble the day file."""
+        filepath = collector.generate_json(
+            self.make_result("2025-10-19", {"arxiv": ["a", "b"], "reddit": ["c"], "empty": []}),
+            "2025-10-19.json", update_today=True
+        )
+        with open(filepath, 'r', encoding='utf-8') as f:
+            day = json.load(f)
+        
+        header = json.loads((tmp_path / "2025-10-19" / "header.json").read_text(encoding='utf-8'))
+        
+        assert header['last_updated'] == day['last_updated']
+        assert header['collection_status'] == day['collection_status']
+        assert list(header['sources']) == ["arxiv", "reddit", "empty"]
+        for source, entry in header['sources'].items():
+            content = (tmp_path / entry['file']).read_bytes()
+            assert json.loads(content) == day['sources'][source]
+            assert entry['items'] == len(day['sources'][source])
+            assert entry['sha256'] == hashlib.sha256(content).hexdigest()
+            assert entry['bytes'] == len(content)
+        
+        today_header = tmp_path / "today.header.json"
+        assert today_header.read_bytes() == (tmp_path / "2025-10-19" / "header.json").read_bytes()
+    
+    def test_removed_sources_and_old_days_cleaned_up(self, collector, tmp_path):
+        """Test that stale source files and directories of deleted days are removed."""
+        collector.generate_json(self.make_result("2025-10-18", {"arxiv": ["a"]}), "2025-10-18.json")
+        collector.generate_json(self.make_result("2025-10-19", {"arxiv": ["a"], "reddit": ["b"]}), "2025-10-19.json")
+        collector.generate_json(self.make_result("2025-10-19", {"arxiv": ["c"]}), "2025-10-19.json")
+        
+        assert sorted(p.name for p in (tmp_path / "2025-10-19").iterdir()) == ["arxiv.json", "header.json"]
+        
+        collector.cleanup_old_files(retention_days=1)
+        
+        assert not (tmp_path / "2025-10-18").exists()
+        assert (tmp_path / "2025-10-19" / "arxiv.json").exists()
+    
+    def test_split_output_removed_when_switched_off(self, collector, tmp_path):
+        """Test that a normal run does not leave a today header pointing at deleted source files."""
+        collector.generate_json(self.make_result("2025-10-19", {"a": ["x"]}), "2025-10-19.json", update_today=True)
+        index = json.loads(Path(collector.update_index(["2025-10-19"])).read_text(encoding='utf-8'))
+        assert index['split_sources'] is True
+        
+        plain = NewsCollector(data_dir=str(tmp_path), use_seen_store=False)
+        plain.generate_json(self.make_result("2025-10-20", {"a": ["y"]}), "2025-10-20.json", update_today=True)
+        assert not (tmp_path / "today.header.json").exists()
+        
+        plain.cleanup_old_files(retention_days=7)
+        index = json.loads(Path(plain.update_index(plain.get_available_dates())).read_text(encoding='utf-8'))
+        
+        assert not (tmp_path / "2025-10-19").exists()
+        assert (tmp_path / "2025-10-19.json").exists()
+        assert index['split_sources'] is False
+    
+    def test_source_names_are_escaped(self, collector, tmp_path):
+        """Test that source names cannot overwrite the header or leave the day directory."""
+        collector.generate_json(
+            self.make_result("2025-10-19", {"header": ["a"], "../escape": ["b"], "r/ai news": ["c"]}),
+            "2025-10-19.json"
+        )
+        header = json.loads((tmp_path / "2025-10-19" / "header.json").read_text(encoding='utf-8'))
+        
+        assert list(header['sources']) == ["header", "../escape", "r/ai news"]
+        assert sorted(p.name for p in (tmp_path / "2025-10-19").iterdir()) == [
+            "header.json", "r~2fai~20news.json", "~2e~2e~2fescape.json", "~68eader.json"
+        ]
+        assert not (tmp_path / "escape.json").exists()
+        for entry in header['sources'].values():
+            assert json.loads((tmp_path / entry['file']).read_text(encoding='utf-8'))
+
+
+class TestIncrementalMerge:
+    """Test cases for merging a later run into an existing day file."""
+    
+    @pytest.fixture
+    def collector(self, tmp_path):
+        """Create a NewsCollector with temporary data directory."""
+        return NewsCollector(data_dir=str(tmp_path), use_seen_store=False)
+    
+    def make_result(self, timestamp, titles):
+        result = CollectionResult(date="2025-10-19", last_updated=timestamp)
+        result.add_source_items("src", [
+            NewsItem(title, "Summary", f"https://example.com/{title}", "2025-10-19T05:00:00Z", "src")
+            for title in titles
+        ])
+        result.collection_status = {'total_items': len(titles)}
+        return result
+    
+    def test_merge_keeps_items_that_dropped_off(self, collector):
+        """Test that the evening run adds new items without losing morning ones."""
+        collector.generate_json(self.make_result("2025-10-19T05:00:00Z", ["a", "b"]), "2025-10-19.json")
+        filepath = collector.generate_json(
+            self.make_result("2025-10-19T17:00:00Z", ["c", "a"]), "2025-10-19.json", merge=True
+        )
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        assert [item['title'] for item in data['sources']['src']] == ["c", "a", "b"]
+        assert data['collection_status']['total_items'] == 3
+        assert data['last_updated'] == "2025-10-19T17:00:00Z"
+    
+    def test_merge_recomputes_source_status(self, collector):
+        """Test that a source failing in a later run is not reported failed once merged."""
+        morning = self.make_result("2025-10-19T05:00:00Z", ["a"])
+        morning.add_source_items("other", [
+            NewsItem("x", "Summary", "https://example.com/x", "2025-10-19T05:00:00Z", "other")
+        ])
+        collector.generate_json(morning, "2025-10-19.json")
+        
+        evening = self.make_result("2025-10-19T17:00:00Z", ["b"])
+        evening.add_source_items("other", [])
+        evening.collection_status = {
+            'total_sources': 2, 'successful': 1, 'failed': 1,
+            'failed_sources': ["other"], 'total_items': 1
+        }
+        merged = collector.merge_with_existing(evening, "2025-10-19.json")
+        
+        assert merged.collection_status == {
+            'total_sources': 2, 'successful': 2, 'failed': 0,
+            'failed_sources': [], 'total_items': 3
+        }
+    
+    def test_unchanged_merge_is_byte_stable(self, collector):
+        """Test that a run without new items leaves the file untouched."""
+        filepath = Path(collector.generate_json(
+            self.make_result("2025-10-19T05:00:00Z", ["a", "b"]), "2025-10-19.json"
+        ))
+        before = filepath.read_bytes()
+        mtime = filepath.stat().st_mtime_ns
+        
+        collector.generate_json(self.make_result("2025-10-19T17:00:00Z", ["b"]), "2025-10-19.json", merge=True)
+        
+        assert filepath.read_bytes() == before
+        assert filepath.stat().st_mtime_ns == mtime
+    
+    def test_timestamp_only_run_is_not_rewritten(self, collector):
+        """Test that a replacing run with only fresh timestamps leaves the files untouched."""
+        first = self.make_result("2025-10-19T05:00:00Z", ["a", "b"])
+        filepath = Path(collector.generate_json(first, "2025-10-19.json", update_today=True))
+        before = filepath.read_bytes()
+        mtime = filepath.stat().st_mtime_ns
+        
+        later = self.make_result("2025-10-19T17:00:00Z", ["a", "b"])
+        for item in later.sources["src"]:
+            item.published = "2025-10-19T17:00:00Z"
+        collector.generate_json(later, "2025-10-19.json", update_today=True)
+        
+        assert filepath.read_bytes() == before
+        assert filepath.stat().st_mtime_ns == mtime
+        assert (collector.data_dir / "today.json").read_bytes() == before
+    
+    def test_unchanged_sources_keep_stored_items(self, collector):
+        """Test that only materially changed sources are replaced."""
+        first = self.make_result("2025-10-19T05:00:00Z", ["a"])
+        first.add_source_items("other", [NewsItem("x", "Summary", "https://example.com/x", "2025-10-19T05:00:00Z", "other")])
+        collector.generate_json(first, "2025-10-19.json")
+        
+        later = self.make_result("2025-10-19T17:00:00Z", ["b"])
+        later.add_source_items("other", [NewsItem("x", "Summary", "https://example.com/x", "2025-10-19T17:00:00Z", "other")])
+        collector.generate_json(later, "2025-10-19.json")
+        
+        stored = collector.load_result("2025-10-19.json")
+        assert stored.last_updated == "2025-10-19T17:00:00Z"
+        assert stored.sources["src"][0].title == "b"
+        assert stored.sources["other"][0].published == "2025-10-19T05:00:00Z"
+    
+    @pytest.mark.parametrize("merge", [False, True])
+    def test_resolved_date_replaces_stamp(self, collector, merge):
+        """Test that a date resolved in a later run reaches the stored item."""
+        first = self.make_result("2025-10-19T05:00:00Z", ["a", "b"])
+        collector.generate_json(first, "2025-10-19.json")
+        
+        later = self.make_result("2025-10-19T17:00:00Z", ["a", "b"])
+        later.sources["src"][0].published = "2025-10-18T09:30:00+00:00"
+        later.sources["src"][1].published = "2025-10-19T17:00:00Z"
+        collector.generate_json(later, "2025-10-19.json", merge=merge)
+        
+        stored = collector.load_result("2025-10-19.json")
+        assert [item.published for item in stored.sources["src"]] == [
+            "2025-10-18T09:30:00+00:00", "2025-10-19T05:00:00Z"
+        ]
+        assert stored.last_updated == "2025-10-19T17:00:00Z"
+    
+    def test_unchanged_index_is_not_rewritten(self, collector):
+        """Test that index.json keeps its timestamp when nothing else changed."""
+        collector.generate_json(self.make_result("2025-10-19T05:00:00Z", ["a"]), "2025-10-19.json")
+        index_path = Path(collector.update_index(["2025-10-19"]))
+        before = index_path.read_bytes()
+        
+        collector.update_index(["2025-10-19"])
+        assert index_path.read_bytes() == before
+        
+        collector.generate_json(self.make_result("2025-10-19T17:00:00Z", ["a", "b"]), "2025-10-19.json")
+        collector.update_index(["2025-10-19"])
+        assert json.loads(index_path.read_text(encoding='utf-8'))['total_items'] == 2
+    
+    def test_merge_without_existing_file(self, collector):
+        """Test that merging into a missing file writes the result as is."""
+        filepath = collector.generate_json(
+            self.make_result("2025-10-19T05:00:00Z", ["a"]), "2025-10-20.json", merge=True
+        )
+        
+        assert collector.load_result("2025-10-20.json").sources["src"][0].title == "a"
+        assert Path(filepath).exists()
@@ -0,0 +1,50 @@
+"""
+Unit tests for the precompiled keyword classifier.
+"""
+
+import pytest
+
+from collector.keywords import KeywordClassifier, AI_CLASSIFIER
+from collector.sources import ArxivFetcher
+
+
+class TestKeywordClassifier:
+    """Test cases for KeywordClassifier."""
+    
+    def test_word_boundaries(self):
+        """Test that short keywords no longer match inside other words."""
+        assert not AI_CLASSIFIER.is_match("The mayor said the HTML email was fine")
+        assert AI_CLASSIFIER.is_match("AI-powered search arrives")
+        assert AI_CLASSIFIER.is_match("Running LLMs on a laptop")
+    
+    def test_multi_word_keywords(self):
+        """Test that multi-word keywords allow any whitespace or hyphens."""
+        assert AI_CLASSIFIER.matches("Advances in machine-learning and deep\nlearning") == {
+            'machine learning', 'deep learning'
+        }
+    
+    def test_weak_keywords_need_company(self):
+        """Test that generic terms only match together with another signal."""
+        assert not AI_CLASSIFIER.is_match("New running model for marathon runners")
+        assert AI_CLASSIFIER.is_match("Diffusion model training tricks")
+        assert AI_CLASSIFIER.score("Diffusion model training tricks") == 1.5
+    
+    def test_plain_keyword_list(self):
+        """Test that a list of keywords gets unit weights."""
+        classifier = KeywordClassifier(["rust", "wasm"], threshold=2)
+        
+        assert classifier.score("Rust and WASM") == 2.0
+        assert classifier.is_match("Rust and WASM")
+        assert not classifier.is_match("Rust, rust and more rust")
+    
+    def test_empty_keywords_rejected(self):
+        """Test that an empty keyword set is an error."""
+        with pytest.raises(ValueError):
+            KeywordClassifier([])
+    
+    def test_fetcher_uses_classifier(self):
+        """Test that fetchers delegate is_ai_related to the classifier."""
+        fetcher = ArxivFetcher()
+        
+        assert fetcher.is_ai_related("OpenAI ships a new API")
+        assert not fetcher.is_ai_related("Said the mail")
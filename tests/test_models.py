@@ -1,12 +1,15 @@
 """
-Unit tests for data models (NewsItem and CollectionResult).
+Unit tests for data models (NewsItem, ItemBatch and CollectionResult).
 """
 
 import pytest
+import dataclasses
 import json
+import pickle
 from datetime import datetime, timezone
 
-from collector.models import NewsItem, CollectionResult
+from collector.dedup import ExactDuplicateIndex
+from collector.models import NewsItem, CollectionResult, ItemBatch, get_serializer
 
 
 class TestNewsItem:
@@ -131,6 +134,40 @@ class TestNewsItem:
         )
         
         assert item1 == item2
+    
+    def test_newsitem_is_slotted(self):
+        """Test that NewsItem carries no per-instance __dict__."""
+        item = NewsItem("Title", "Summary", "https://link.com", "2025-10-19T10:00:00Z", "source")
+        
+        assert not hasattr(item, '__dict__')
+        with pytest.raises(AttributeError):
+            item.extra = "value"
+    
+    def test_newsitem_hash_follows_title_changes(self):
+        """Test that the cached dedup key is refreshed when the title changes."""
+        item = NewsItem("Old Title", "Summary", "https://link.com", "2025-10-19T10:00:00Z", "source")
+        other = NewsItem("  new title ", "Summary", "https://other.com", "2025-10-19T10:00:00Z", "source")
+        
+        item.title = "New Title"
+        item.link = "https://changed.com"
+        
+        assert item.title_key == "new title"
+        assert item.title_key is item.title_key  # stored once, not re-normalized per access
+        assert item.link_key == "changed.com"
+        assert hash(item) == hash(other)
+        assert item == other
+        assert len({item, other}) == 1
+    
+    def test_newsitem_copies_keep_key(self):
+        """Test that copied and unpickled items keep a working dedup key."""
+        item = NewsItem("Test Title", "Summary", "https://link.com", "2025-10-19T10:00:00Z", "source")
+        
+        restored = pickle.loads(pickle.dumps(item))
+        replaced = dataclasses.replace(item, summary="Other summary")
+        
+        assert restored == item and hash(restored) == hash(item)
+        assert replaced == item and replaced.summary == "Other summary"
+        assert NewsItem.from_dict(item.to_dict(), "source") == item
 
 
 class TestCollectionResult:
@@ -258,3 +295,178 @@ class TestCollectionResult:
         parsed = json.loads(json_str)
         assert parsed['date'] == "2025-10-19"
         assert 'sources' in parsed
+
+
+class TestSerializers:
+    """Test cases for the pluggable JSON serializers."""
+    
+    def make_result(self):
+        result = CollectionResult(
+            date="2025-10-19",
+            last_updated="2025-10-19T10:00:00Z",
+            collection_status={'total_items': 2, 'failed_sources': []}
+        )
+        result.add_source_items("arxiv", [
+            NewsItem("Ünïcode — “quotes”", "Line\nbreak \\ \"q\"", "https://a.com/1", "2025-10-19T10:00:00Z", "arxiv"),
+            NewsItem("Emoji 🤖", "Summary", "https://a.com/2", "2025-10-19T10:00:00Z", "arxiv")
+        ])
+        result.add_source_items("empty", [])
+        return result
+    
+    @pytest.mark.parametrize("name", ["json", "orjson"])
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_output_matches_stdlib(self, name, indent):
+        """Test that every backend produces exactly the stdlib encoding."""
+        if name == "orjson":
+            pytest.importorskip("orjson")
+        result = self.make_result()
+        
+        if indent is None:
+            expected = json.dumps(result.to_dict(), separators=(',', ':'), ensure_ascii=False)
+        else:
+            expected = json.dumps(result.to_dict(), indent=indent, ensure_ascii=False)
+        
+        assert result.to_json(indent, serializer=get_serializer(name)) == expected
+    
+    def test_orjson_falls_back_on_unsupported_values(self):
+        """Test that values orjson rejects are encoded by the stdlib instead."""
+        pytest.importorskip("orjson")
+        serializer = get_serializer("orjson")
+        value = {'big': 2 ** 70, 'text': "lone \ud800"}
+        
+        assert serializer.encode(value) == json.dumps(value, indent=2, ensure_ascii=False)
+    
+    def test_empty_result(self):
+        """Test that a result without sources still encodes like the stdlib."""
+        result = CollectionResult(date="2025-10-19", last_updated="2025-10-19T10:00:00Z")
+        
+        assert result.to_json() == json.dumps(result.to_dict(), indent=2, ensure_ascii=False)
+    
+    def test_unknown_serializer_rejected(self):
+        """Test that an unknown backend name is an error."""
+        with pytest.raises(ValueError):
+            get_serializer("yaml")
+
+
+class TestItemBatch:
+    """Test cases for the columnar ItemBatch container."""
+    
+    def make_items(self):
+        """Items with mixed sources, a duplicate title and irregular timestamps."""
+        return [
+            NewsItem("Model B released", "Summary 1", "https://a.com/1", "2025-10-19T10:00:00.123456+00:00", "arxiv"),
+            NewsItem("Model A released", "Summary 2", "https://b.com/2", "2025-10-18T09:00:00+00:00", "reddit"),
+            NewsItem(" model b RELEASED ", "Summary 3", "https://c.com/3", "2025-10-20T08:00:00Z", "reddit"),
+            NewsItem("Model C released", "Summary 4", "https://d.com/4", "", "arxiv"),
+        ]
+    
+    def test_round_trip_preserves_items(self):
+        """Test that rows materialize back to identical items and dicts."""
+        items = self.make_items()
+        batch = ItemBatch.from_items(items)
+        
+        assert len(batch) == 4
+        assert batch.source_names == ["arxiv", "reddit"]
+        assert [dataclasses.astuple(item) for item in batch] == [dataclasses.astuple(item) for item in items]
+        assert batch.to_dicts() == [item.to_dict() for item in items]
+        assert dataclasses.astuple(batch[-1]) == dataclasses.astuple(items[-1])
+    
+    def test_filter_and_dedup_mask(self):
+        """Test that dedup_mask keeps the first row of each normalized title."""
+        batch = ItemBatch.from_items(self.make_items())
+        
+        mask = batch.dedup_mask()
+        unique = batch.filter(mask)
+        
+        assert mask == [True, True, False, True]
+        assert unique.to_items() == list(dict.fromkeys(self.make_items()))
+        with pytest.raises(ValueError):
+            batch.filter([True])
+    
+    def test_dedup_mask_matches_duplicate_index(self):
+        """Test that dedup_mask keeps the same rows as ExactDuplicateIndex, links included."""
+        items = self.make_items() + [
+            NewsItem("Model B released!", "Summary 5", "https://e.com/5", "", "arxiv"),
+            NewsItem("Different title", "Summary 6", "http://www.a.com/1?utm_source=rss", "", "reddit"),
+            NewsItem("New title", "Summary 7", "https://f.com/7", "", "reddit"),
+        ]
+        batch = ItemBatch.from_items(items)
+        
+        mask = batch.dedup_mask()
+        
+        assert mask == [True, True, False, True, False, False, True]
+        assert batch.filter(mask).to_items() == ExactDuplicateIndex().unique(items)
+    
+    def test_sort_and_slice(self):
+        """Test sorting by column and slicing into new batches."""
+        batch = ItemBatch.from_items(self.make_items())
+        
+        newest = batch.sort(reverse=True)
+        by_title = batch.sort(by="title")
+        
+        assert [item.link for item in newest] == [
+            "https://c.com/3", "https://a.com/1", "https://b.com/2", "https://d.com/4"
+        ]
+        assert by_title[0].title == " model b RELEASED "
+        assert newest[:2].to_dicts() == [item.to_dict() for item in newest.to_items()[:2]]
+        assert newest[1:3][1].published == "2025-10-18T09:00:00+00:00"
+        with pytest.raises(ValueError):
+            batch.sort(by="summary")
+    
+    def test_masks_and_split(self):
+        """Test time window and source masks and splitting per source."""
+        batch = ItemBatch.from_items(self.make_items())
+        
+        since = datetime(2025, 10, 19, tzinfo=timezone.utc)
+        assert batch.published_mask(since=since) == [True, False, True, False]
+        assert batch.published_mask(until=since) == [False, True, False, True]
+        assert batch.source_mask("reddit", "unknown") == [False, True, True, False]
+        
+        parts = batch.split_by_source()
+        assert list(parts) == ["arxiv", "reddit"]
+        assert [item.link for item in parts["reddit"]] == ["https://b.com/2", "https://c.com/3"]
+    
+    def test_collection_result_holds_batches(self):
+        """Test that results with batches encode exactly like results with lists."""
+        data = {
+            "date": "2025-10-19",
+            "last_updated": "2025-10-19T10:00:00Z",
+            "collection_status": {"total_items": 4},
+            "sources": {"arxiv": [item.to_dict() for item in self.make_items()], "empty": []},
+        }
+        listed = CollectionResult.from_dict(data)
+        columnar = CollectionResult.from_dict(data, columnar=True)
+        
+        assert isinstance(columnar.sources["arxiv"], ItemBatch)
+        assert columnar.get_total_items() == 4
+        assert columnar.get_failed_sources() == ["empty"]
+        assert columnar.to_dict() == listed.to_dict()
+        assert columnar.to_json() == listed.to_json()
+        assert columnar.to_batch().to_items() == listed.to_batch().to_items()
+    
+    def test_add_batch(self):
+        """Test adding a multi-source batch to a result."""
+        result = CollectionResult(date="2025-10-19", last_updated="2025-10-19T10:00:00Z")
+        result.add_source_items("hn", [NewsItem("Other", "S", "https://e.com", "", "hn")])
+        
+        result.add_batch(ItemBatch.from_items(self.make_items()))
+        
+        assert list(result.sources) == ["hn", "arxiv", "reddit"]
+        assert result.get_total_items() == 5
+        assert len(result.to_batch()) == 5
+    
+    def test_add_batch_appends_to_existing_source(self):
+        """Test that a second batch for a source keeps the earlier items."""
+        items = self.make_items()
+        result = CollectionResult(date="2025-10-19", last_updated="2025-10-19T10:00:00Z")
+        earlier = [NewsItem("Earlier", "S", "https://e.com", "", "arxiv")]
+        result.add_source_items("arxiv", earlier)
+        
+        result.add_batch(ItemBatch.from_items(items))
+        result.add_batch(ItemBatch.from_items(items))
+        
+        arxiv = [item for item in items if item.source == "arxiv"]
+        reddit = [item for item in items if item.source == "reddit"]
+        assert list(result.sources["arxiv"]) == earlier + arxiv + arxiv
+        assert list(result.sources["reddit"]) == reddit + reddit
+        assert len(earlier) == 1
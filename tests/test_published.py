@@ -0,0 +1,91 @@
+"""
+Unit tests for publication time resolution.
+"""
+
+from datetime import datetime, timezone
+
+from bs4 import BeautifulSoup
+
+from collector.models import NewsItem
+from collector.published import (
+    element_published,
+    fill_missing_published,
+    page_published_times,
+    parse_published,
+)
+from collector.urls import url_key
+
+
+class TestParsePublished:
+    """Test cases for parse_published."""
+    
+    def test_formats(self):
+        """Test that ISO 8601 and RFC 2822 dates are normalized to UTC."""
+        assert parse_published("2025-10-19T10:00:00Z") == "2025-10-19T10:00:00+00:00"
+        assert parse_published("2025-10-19T12:00:00+02:00") == "2025-10-19T10:00:00+00:00"
+        assert parse_published("2025-10-19") == "2025-10-19T00:00:00+00:00"
+        assert parse_published("Sun, 19 Oct 2025 10:00:00 GMT") == "2025-10-19T10:00:00+00:00"
+    
+    def test_not_a_date(self):
+        """Test that text that is not a date yields an empty string."""
+        assert parse_published("") == ""
+        assert parse_published(None) == ""
+        assert parse_published("2 hours ago") == ""
+    
+    def test_element(self):
+        """Test that the datetime attribute wins over the element text."""
+        soup = BeautifulSoup('<time datetime="2025-10-19T10:00:00Z">Yesterday</time>'
+                             '<span itemprop="datePublished">2025-10-18</span>', 'html.parser')
+        
+        assert element_published(soup.time) == "2025-10-19T10:00:00+00:00"
+        assert element_published(soup.span) == "2025-10-18T00:00:00+00:00"
+        assert element_published(None) == ""
+
+
+class TestPagePublishedTimes:
+    """Test cases for page-level date metadata."""
+    
+    def test_jsonld_item_list(self):
+        """Test that ItemList and @graph members are mapped by canonical URL."""
+        page = b"""<html><head><script type="application/ld+json">
+        {"@context": "https://schema.org", "@graph": [
+          {"@type": "ItemList", "itemListElement": [
+            {"@type": "ListItem", "item": {"url": "/a?utm_source=x", "datePublished": "2025-10-19T10:00:00Z"}},
+            {"@type": "ListItem", "item": {"@id": "https://example.com/b", "dateCreated": "2025-10-18"}}
+          ]}
+        ]}</script><script type="application/ld+json">not json</script></head></html>"""
+        times = page_published_times(page, "https://example.com/")
+        
+        assert times == {
+            url_key("https://example.com/a"): "2025-10-19T10:00:00+00:00",
+            url_key("https://example.com/b"): "2025-10-18T00:00:00+00:00",
+        }
+    
+    def test_opengraph(self):
+        """Test that an article page's OpenGraph time applies to its own URL."""
+        page = ('<html><head><meta property="og:url" content="https://example.com/story">'
+                '<meta property="article:published_time" content="2025-10-19T10:00:00Z"></head></html>')
+        
+        assert page_published_times(page) == {url_key("https://example.com/story"): "2025-10-19T10:00:00+00:00"}
+    
+    def test_page_without_metadata(self):
+        """Test that pages without date metadata are skipped."""
+        assert page_published_times(b"<html><body><p>News</p></body></html>") == {}
+
+
+class TestFillMissingPublished:
+    """Test cases for fill_missing_published."""
+    
+    def test_only_undated_items_are_stamped(self):
+        """Test that items with a date keep it and the rest share one run time."""
+        now = datetime(2025, 10, 19, 17, 0, tzinfo=timezone.utc)
+        items = [
+            NewsItem("Dated", "", "https://example.com/a", "2025-10-19T10:00:00+00:00", "src"),
+            NewsItem("Undated", "", "https://example.com/b", "", "src"),
+            NewsItem("Also undated", "", "https://example.com/c", "", "src"),
+        ]
+        fill_missing_published(items, now=now)
+        
+        assert [item.published for item in items] == [
+            "2025-10-19T10:00:00+00:00", now.isoformat(), now.isoformat()
+        ]
@@ -0,0 +1,114 @@
+"""
+Unit tests for the configurable source registry.
+"""
+
+from datetime import datetime, timezone
+import json
+
+import pytest
+
+from collector.registry import SourceConfig, SourceRegistry, build_fetcher
+from collector.scraper import SelectorFetcher
+from collector.sources import ArxivFetcher, AsyncFeedFetcher, FeedFetcher, RedditFetcher
+
+
+def write_config(tmp_path, sources):
+    path = tmp_path / "sources.json"
+    path.write_text(json.dumps({"sources": sources}), encoding="utf-8")
+    return path
+
+
+class TestSourceConfig:
+    """Test cases for SourceConfig validation and scheduling."""
+    
+    def test_invalid_entries_are_rejected(self):
+        """Test that typos in the configuration fail at load time."""
+        with pytest.raises(ValueError):
+            SourceConfig.from_dict({"name": "a", "type": "arxiv", "urls": "x"})
+        with pytest.raises(ValueError):
+            SourceConfig.from_dict({"name": "a", "type": "rss"})
+        with pytest.raises(ValueError):
+            SourceConfig.from_dict({"type": "arxiv"})
+        with pytest.raises(ValueError):
+            SourceConfig.from_dict({"name": "a", "type": "arxiv", "schedule": [24]})
+    
+    def test_schedule(self):
+        """Test that scheduled sources are only due in their UTC hours."""
+        config = SourceConfig.from_dict({"name": "a", "type": "arxiv", "schedule": [5]})
+        
+        assert config.is_due(datetime(2025, 10, 19, 5, 30, tzinfo=timezone.utc))
+        assert not config.is_due(datetime(2025, 10, 19, 17, 0, tzinfo=timezone.utc))
+        assert SourceConfig("a", "arxiv").is_due()
+        assert not SourceConfig("a", "arxiv", enabled=False).is_due()
+
+
+class TestSourceRegistry:
+    """Test cases for SourceRegistry."""
+    
+    def test_bundled_config_matches_builtin_sources(self):
+        """Test that the default configuration builds the built-in fetchers."""
+        fetchers = SourceRegistry.from_file().build()
+        
+        assert [fetcher.source_name for fetcher in fetchers] == [
+            "arxiv", "huggingface", "producthunt", "reddit", "ai_news", "crescendo"
+        ]
+        assert fetchers[0].url == ArxivFetcher.RSS_URL
+    
+    def test_due_sources_by_priority(self, tmp_path):
+        """Test that only enabled, due sources are built, highest priority first."""
+        path = write_config(tmp_path, [
+            {"name": "papers", "type": "arxiv", "url": "https://example.com/rss", "limit": 5},
+            {"name": "forum", "type": "reddit", "priority": 10, "options": {"subreddits": ["LocalLLaMA"]}},
+            {"name": "evening", "type": "arxiv", "schedule": [17]},
+            {"name": "off", "type": "arxiv", "enabled": False},
+        ])
+        registry = SourceRegistry.from_file(path)
+        fetchers = registry.build(now=datetime(2025, 10, 19, 5, 0, tzinfo=timezone.utc))
+        
+        assert len(registry) == 4
+        assert [fetcher.source_name for fetcher in fetchers] == ["forum", "papers"]
+        assert isinstance(fetchers[0], RedditFetcher)
+        assert list(fetchers[0].subreddits) == ["localllama"]
+        assert (fetchers[1].url, fetchers[1].limit) == ("https://example.com/rss", 5)
+    
+    def test_modules_are_imported_lazily(self):
+        """Test that disabled plugins are never imported and broken ones are skipped."""
+        registry = SourceRegistry([
+            SourceConfig("disabled", "collector.no_such_module:Fetcher", enabled=False),
+            SourceConfig("papers", "arxiv"),
+        ])
+        assert [fetcher.source_name for fetcher in registry.build()] == ["papers"]
+        
+        registry.add(SourceConfig("broken", "collector.no_such_module:Fetcher"))
+        assert [fetcher.source_name for fetcher in registry.build()] == ["papers"]
+        
+        with pytest.raises(ValueError):
+            registry.add(SourceConfig("papers", "arxiv"))
+    
+    def test_feed_and_scraper_types(self):
+        """Test that feeds and scrapers are fully described by configuration."""
+        feed = build_fetcher(SourceConfig("blog", "feed", url="https://example.com/rss", limit=3))
+        async_feed = build_fetcher(SourceConfig("news", "async_feed", url="https://example.com/atom", limit=5))
+        scraper = build_fetcher(SourceConfig.from_dict({
+            "name": "example",
+            "type": "scraper",
+            "url": "https://example.com/news/",
+            "selectors": {
+                "containers": [{"tags": ["li"], "attrs": {"class": "story"}}],
+                "title": "h3",
+                "summary": ["p.dek", "p"],
+            },
+        }))
+        page = b"""<ul><li class="story"><h3>Robots learn to plan</h3>
+          <a href="/stories/1">Link</a><p class="dek">Planning agents.</p></li></ul>"""
+        items = scraper.parse(page)
+        
+        assert isinstance(feed, FeedFetcher)
+        assert (feed.source_name, feed.url, feed.limit) == ("blog", "https://example.com/rss", 3)
+        assert isinstance(async_feed, AsyncFeedFetcher)
+        assert (async_feed.source_name, async_feed.feed_url, async_feed.limit) == ("news", "https://example.com/atom", 5)
+        assert isinstance(scraper, SelectorFetcher)
+        assert [(item.title, item.link, item.summary) for item in items] == [
+            ("Robots learn to plan", "https://example.com/stories/1", "Planning agents.")
+        ]
+        assert items[0].source == "example"
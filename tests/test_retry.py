@@ -0,0 +1,130 @@
+"""
+Unit tests for the unified retry policy.
+"""
+
+import time
+import pytest
+import requests
+
+from collector.models import NewsItem
+from collector.fetchers import SourceFetcher
+from collector.retry import RetryPolicy
+
+
+def http_error(status, headers=None):
+    """Build a requests HTTPError carrying a response with the given status."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.exceptions.HTTPError(f"HTTP {status}", response=response)
+
+
+class FlakyFetcher(SourceFetcher):
+    """Fetcher raising queued errors before succeeding."""
+    
+    BACKOFF_FACTOR = 0.01
+    
+    def __init__(self, *errors):
+        super().__init__("flaky")
+        self.errors = list(errors)
+        self.calls = 0
+    
+    def fetch(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return [NewsItem("Title", "Summary", "https://example.com", "2025-10-19T10:00:00Z", "flaky")]
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy."""
+    
+    @pytest.mark.parametrize("error, expected", [
+        (requests.exceptions.ConnectTimeout("slow"), True),
+        (requests.exceptions.ConnectionError("refused"), True),
+        (http_error(503), True),
+        (http_error(429), True),
+        (http_error(404), False),
+        (http_error(403), False),
+        (requests.exceptions.InvalidURL("bad"), False),
+        (ValueError("unparseable"), False),
+        (TimeoutError(), True),
+    ])
+    def test_error_classification(self, error, expected):
+        """Test that transient and fatal errors are told apart."""
+        assert RetryPolicy().is_retryable(error) is expected
+    
+    def test_retry_after_is_honored(self):
+        """Test that a numeric Retry-After header sets the delay."""
+        policy = RetryPolicy(deadline=60)
+        delay = policy.next_delay(1, http_error(429, {'Retry-After': '7'}), policy.start())
+        
+        assert delay == 7
+    
+    def test_retry_after_beyond_deadline_gives_up(self):
+        """Test that waiting past the deadline is not attempted."""
+        policy = RetryPolicy(deadline=5)
+        
+        assert policy.next_delay(1, http_error(503, {'Retry-After': '120'}), policy.start()) is None
+    
+    def test_backoff_is_jittered_and_capped(self):
+        """Test that backoff stays within the exponential ceiling."""
+        policy = RetryPolicy(base_delay=2, max_delay=5)
+        
+        for attempt in range(1, 6):
+            assert 0 <= policy.backoff(attempt) <= min(5, 2 * 2 ** (attempt - 1))
+    
+    def test_attempt_limit(self):
+        """Test that no delay is returned after the last attempt."""
+        policy = RetryPolicy(max_attempts=2)
+        
+        assert policy.next_delay(2, TimeoutError(), policy.start()) is None
+
+
+class TestFetchWithRetry:
+    """Test cases for SourceFetcher.fetch_with_retry."""
+    
+    def test_transient_error_is_retried(self):
+        """Test that a transient failure is followed by a successful retry."""
+        fetcher = FlakyFetcher(requests.exceptions.ConnectionError("reset"))
+        
+        items = fetcher.fetch_with_retry()
+        
+        assert len(items) == 1
+        assert fetcher.calls == 2
+    
+    def test_fatal_error_is_not_retried(self):
+        """Test that a 404 gives up after a single attempt."""
+        fetcher = FlakyFetcher(http_error(404), http_error(404), http_error(404))
+        
+        assert fetcher.fetch_with_retry() == []
+        assert fetcher.calls == 1
+    
+    def test_probe_uses_single_attempt(self):
+        """Test that max_attempts overrides the policy."""
+        fetcher = FlakyFetcher(TimeoutError(), TimeoutError())
+        
+        assert fetcher.fetch_with_retry(max_attempts=1) == []
+        assert fetcher.calls == 1
+    
+    def test_deadline_bounds_total_time(self):
+        """Test that a dead source cannot exceed its time budget."""
+        fetcher = FlakyFetcher(*[http_error(503, {'Retry-After': '1'}) for _ in range(10)])
+        fetcher.retry_policy = RetryPolicy(max_attempts=10, deadline=1.5)
+        
+        start = time.monotonic()
+        assert fetcher.fetch_with_retry() == []
+        
+        assert time.monotonic() - start < 1.5
+        assert fetcher.calls == 2
+    
+    def test_request_timeout_respects_deadline(self):
+        """Test that per-request timeouts shrink as the deadline approaches."""
+        fetcher = FlakyFetcher()
+        fetcher._deadline = time.monotonic() + 2
+        
+        assert fetcher.request_timeout() <= 2
+        
+        fetcher._deadline = time.monotonic() - 1
+        with pytest.raises(requests.exceptions.Timeout):
+            fetcher.request_timeout()
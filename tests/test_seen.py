@@ -0,0 +1,89 @@
+"""
+Unit tests for the persistent seen-items store.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from collector.models import NewsItem
+from collector.seen import SeenItemsStore, item_key
+
+
+def make_item(title, link, published="2025-10-19T10:00:00Z"):
+    return NewsItem(title, "Summary", link, published, "src")
+
+
+class TestSeenItemsStore:
+    """Test cases for SeenItemsStore."""
+    
+    def test_first_sighting_is_new(self, tmp_path):
+        """Test that only the first sighting of an item counts as new."""
+        store = SeenItemsStore(tmp_path / "seen_items.json")
+        
+        assert store.observe(make_item("Title", "https://example.com/a"))
+        assert not store.observe(make_item("Title", "https://example.com/a"))
+        assert len(store) == 1
+    
+    def test_published_time_is_stable(self, tmp_path):
+        """Test that a re-fetched item without a date keeps the published time of its first run."""
+        path = tmp_path / "seen_items.json"
+        store = SeenItemsStore(path)
+        store.observe(make_item("Title", "https://example.com/a", "2025-10-19T05:00:00Z"))
+        store.save()
+        
+        later = make_item("Title", "http://example.com/a?utm_source=x", "")
+        assert not SeenItemsStore(path).observe(later)
+        assert later.published == "2025-10-19T05:00:00Z"
+    
+    def test_resolved_date_replaces_stored_time(self, tmp_path):
+        """Test that a date resolved in a later run wins over the first-seen stamp."""
+        path = tmp_path / "seen_items.json"
+        first = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(days=1)
+        store = SeenItemsStore(path)
+        store.observe(make_item("Title", "https://example.com/a", ""), now=first)
+        store.save()
+        
+        store = SeenItemsStore(path)
+        dated = make_item("Title", "https://example.com/a", "2025-10-18T09:30:00+00:00")
+        assert not store.observe(dated, now=first + timedelta(hours=12))
+        store.save()
+        
+        again = make_item("Title", "https://example.com/a", "")
+        SeenItemsStore(path).observe(again)
+        
+        assert dated.published == "2025-10-18T09:30:00+00:00"
+        assert again.published == "2025-10-18T09:30:00+00:00"
+    
+    def test_undated_item_gets_first_seen_time(self, tmp_path):
+        """Test that an item without a date is stamped once, when first seen."""
+        path = tmp_path / "seen_items.json"
+        first = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(days=1)
+        store = SeenItemsStore(path)
+        item = make_item("Title", "https://example.com/a", "")
+        store.observe(item, now=first)
+        store.save()
+        
+        again = make_item("Title", "https://example.com/a", "")
+        SeenItemsStore(path).observe(again, now=first + timedelta(hours=12))
+        
+        assert item.published == first.isoformat()
+        assert again.published == item.published
+    
+    def test_key_falls_back_to_title(self):
+        """Test that items without a link are identified by their title."""
+        assert item_key(make_item("Same story", "")) == item_key(make_item("[r/ai] Same story!", ""))
+        assert item_key(make_item("Same story", "")) != item_key(make_item("Other story", ""))
+    
+    def test_stale_entries_dropped_on_save(self, tmp_path):
+        """Test that items not seen within the retention window are forgotten."""
+        path = tmp_path / "seen_items.json"
+        store = SeenItemsStore(path)
+        old = datetime.now(timezone.utc) - timedelta(days=SeenItemsStore.MAX_AGE_DAYS + 1)
+        store.observe(make_item("Old", "https://example.com/old"), now=old)
+        store.observe(make_item("Fresh", "https://example.com/fresh"))
+        store.save()
+        
+        reloaded = SeenItemsStore(path)
+        
+        assert len(reloaded) == 1
+        assert reloaded.first_seen(make_item("Fresh", "https://example.com/fresh")) is not None
+        assert reloaded.first_seen(make_item("Old", "https://example.com/old")) is None
@@ -0,0 +1,254 @@
+"""
+Offline unit tests for source fetchers using canned responses.
+Complements the live integration tests in test_fetchers.py.
+"""
+
+import threading
+import time
+import pytest
+from bs4 import BeautifulSoup
+
+from collector.sources import RedditFetcher, HuggingFaceFetcher, AINewsFetcher
+from collector.scraper import ContainerRule, ScraperSpec, SelectorFetcher
+from tests.helpers import FakeResponse
+
+
+class URLSession:
+    """Session serving canned bodies per URL, tracking request concurrency.
+    
+    With a barrier every request waits until enough requests are in flight
+    together, which fails (instead of passing slowly) if they run serially.
+    """
+    
+    def __init__(self, pages, delay=0.0, barrier=None):
+        self.pages = pages
+        self.delay = delay
+        self.barrier = barrier
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+    
+    def get(self, url, timeout=None, headers=None, stream=False, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.barrier is not None:
+                self.barrier.wait(timeout=5)
+            if url not in self.pages:
+                return FakeResponse(404)
+            return FakeResponse(200, self.pages[url])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def subreddit_feed(name, count=2):
+    """Build a small Atom feed like Reddit's RSS endpoint."""
+    entries = ''.join(
+        f"""<entry>
+          <title>{name} post {i}</title>
+          <link href="https://www.reddit.com/r/{name}/comments/{i}/"/>
+          <content type="html">&lt;p&gt;Body &amp;amp; more {i}&lt;/p&gt;</content>
+          <published>2025-10-19T10:0{i}:00+00:00</published>
+        </entry>"""
+        for i in range(count)
+    )
+    return f"""<?xml version="1.0"?>
+    <feed xmlns="http://www.w3.org/2005/Atom"><title>r/{name}</title>{entries}</feed>""".encode()
+
+
+class TestRedditFetcher:
+    """Test cases for concurrent subreddit fetching."""
+    
+    def test_subreddit_list_is_configurable(self):
+        """Test that plain subreddit names are expanded to RSS URLs."""
+        fetcher = RedditFetcher(subreddits=["LocalLLaMA", "MachineLearning"])
+        
+        assert fetcher.subreddits == {
+            'localllama': 'https://www.reddit.com/r/LocalLLaMA/.rss',
+            'machinelearning': 'https://www.reddit.com/r/MachineLearning/.rss'
+        }
+    
+    def test_merge_order_is_deterministic(self):
+        """Test that items follow the configured subreddit order."""
+        names = [f"sub{i}" for i in range(6)]
+        fetcher = RedditFetcher(subreddits=names, max_concurrency=3)
+        fetcher.session = URLSession(
+            {RedditFetcher.SUBREDDIT_URL.format(name=name): subreddit_feed(name) for name in names},
+            delay=0.05
+        )
+        
+        items = fetcher.fetch()
+        
+        assert [item.title for item in items][:4] == [
+            "[r/sub0] sub0 post 0", "[r/sub0] sub0 post 1",
+            "[r/sub1] sub1 post 0", "[r/sub1] sub1 post 1"
+        ]
+        assert len(items) == 12
+        assert items[0].summary == "Body & more 0"
+    
+    def test_concurrency_is_bounded(self):
+        """Test that requests run in parallel but never above the limit."""
+        names = [f"sub{i}" for i in range(9)]
+        fetcher = RedditFetcher(subreddits=names, max_concurrency=3)
+        session = URLSession(
+            {RedditFetcher.SUBREDDIT_URL.format(name=name): subreddit_feed(name) for name in names},
+            barrier=threading.Barrier(3)
+        )
+        fetcher.session = session
+        
+        items = fetcher.fetch()
+        
+        assert len(items) == 18
+        assert session.max_active == 3
+    
+    def test_failed_subreddit_is_skipped(self):
+        """Test that one failing subreddit does not drop the others."""
+        fetcher = RedditFetcher(subreddits=["ok", "missing"])
+        fetcher.session = URLSession({
+            RedditFetcher.SUBREDDIT_URL.format(name="ok"): subreddit_feed("ok", count=1)
+        })
+        
+        items = fetcher.fetch()
+        
+        assert [item.title for item in items] == ["[r/ok] ok post 0"]
+
+
+
+HF_BLOG_PAGE = b"""<html><head><title>Blog</title><script>var big = 1;</script></head>
+<body><nav><a href="/models">Models</a></nav>
+<article><a href="/blog/first-post"><h4>First post</h4><p>About diffusion models.</p></a></article>
+<article><a href="/blog/second-post"><h4>Second post</h4></a></article>
+<footer><p>Footer text</p></footer></body></html>"""
+
+AI_NEWS_PAGE = b"""<html><body><div class="sidebar"><h3>Popular</h3></div>
+<div class="post-item"><h3 class="entry-title"><a href="/news/robots/">Robots learn to plan</a></h3>
+<div class="excerpt">Planning agents get better.</div></div>
+<article class="article-card"><h2><a href="https://www.artificialintelligence-news.com/news/chips/">New chips</a></h2>
+<p>Faster inference.</p></article></body></html>"""
+
+
+class TestHTMLParsing:
+    """Test cases for strained lxml parsing of HTML sources."""
+    
+    def test_strainer_keeps_only_containers(self):
+        """Test that parse_html drops everything outside the candidate containers."""
+        from bs4 import SoupStrainer
+        
+        soup = HuggingFaceFetcher().parse_html(HF_BLOG_PAGE, SoupStrainer('article'))
+        
+        assert len(soup.find_all('article')) == 2
+        assert soup.find('nav') is None
+        assert soup.find('footer') is None
+    
+    def test_huggingface_parse(self):
+        """Test that Hugging Face articles are extracted with absolute links."""
+        items = HuggingFaceFetcher().parse(HF_BLOG_PAGE)
+        
+        assert [item.title for item in items] == ["First post", "Second post"]
+        assert items[0].link == "https://huggingface.co/blog/first-post"
+        assert items[0].summary == "About diffusion models."
+        assert items[1].summary == "Second post"
+    
+    def test_ai_news_parse(self):
+        """Test that AI News posts are extracted from class-matched containers."""
+        items = AINewsFetcher().parse(AI_NEWS_PAGE)
+        
+        assert [item.title for item in items] == ["Robots learn to plan", "New chips"]
+        assert items[0].link == "https://www.artificialintelligence-news.com/news/robots/"
+        assert items[0].summary == "Planning agents get better."
+        assert items[1].summary == "Faster inference."
+
+
+class TestSelectorFetcher:
+    """Test cases for spec-driven scraping."""
+    
+    PAGE = b"""<html><body>
+    <ul><li class="story"><span class="kicker">Breaking</span>
+      <a class="more" href="/read/1">Read more</a>
+      <h3 class="headline"><a href="/stories/1">Robots learn to plan</a></h3>
+      <p class="dek">AI agents get better at planning.</p></li>
+    <li class="story"><h3>Cooking tips</h3><a href="/stories/2">Link</a></li>
+    <li class="ad">Sponsored</li></ul></body></html>"""
+    
+    def make_spec(self, **overrides):
+        options = dict(
+            source_name="example",
+            url="https://example.com/news/",
+            containers=(ContainerRule(tags=('li',), attrs={'class': r'story'}),),
+            title=('h3',),
+            summary=('p.dek',),
+        )
+        options.update(overrides)
+        return ScraperSpec(**options)
+    
+    def test_spec_drives_extraction(self):
+        """Test that a spec alone is enough to scrape a new source."""
+        items = SelectorFetcher(self.make_spec(link_in_title=True)).parse(self.PAGE)
+        
+        assert [item.title for item in items] == ["Robots learn to plan", "Cooking tips"]
+        assert items[0].link == "https://example.com/stories/1"
+        assert items[0].summary == "AI agents get better at planning."
+        assert items[1].link == "https://example.com/stories/2"
+        assert items[1].summary == "Cooking tips"
+        assert items[0].source == "example"
+    
+    def test_selector_priority_and_filters(self):
+        """Test that earlier selectors win and the AI filter drops off-topic items."""
+        spec = self.make_spec(
+            link=('a.more', 'a[href]'),
+            fallback_summary="Story: {title}",
+            require_ai_related=True,
+        )
+        items = SelectorFetcher(spec).parse(self.PAGE)
+        
+        assert [item.link for item in items] == ["https://example.com/read/1"]
+    
+    def test_published_time_from_page(self):
+        """Test that dates come from <time> elements or JSON-LD, never from the clock."""
+        page = b"""<html><head><script type="application/ld+json">
+        {"@type": "NewsArticle", "url": "/stories/2", "datePublished": "2025-10-18T08:00:00Z"}
+        </script></head><body><ul>
+        <li class="story"><h3>Robots learn to plan</h3><a href="/stories/1">Link</a>
+          <time datetime="2025-10-19T09:30:00+02:00">Sunday</time></li>
+        <li class="story"><h3>Agents</h3><a href="/stories/2">Link</a></li>
+        <li class="story"><h3>Undated</h3><a href="/stories/3">Link</a></li>
+        </ul></body></html>"""
+        items = SelectorFetcher(self.make_spec()).parse(page)
+        
+        assert [item.published for item in items] == [
+            "2025-10-19T07:30:00+00:00", "2025-10-18T08:00:00+00:00", ""
+        ]
+    
+    def test_page_metadata_read_in_container_parse(self, monkeypatch):
+        """Test that JSON-LD and OpenGraph dates come from the same parse as the containers."""
+        page = b"""<html><head>
+        <meta property="og:url" content="https://example.com/stories/3">
+        <meta property="article:published_time" content="2025-10-17T12:00:00Z">
+        <script type="application/ld+json">
+        {"@type": "NewsArticle", "url": "/stories/2", "datePublished": "2025-10-18T08:00:00Z"}
+        </script></head><body><ul>
+        <li class="story"><h3>Agents</h3><a href="/stories/2">Link</a></li>
+        <li class="story"><h3>Article</h3><a href="/stories/3">Link</a></li>
+        </ul></body></html>"""
+        parses = []
+        original_init = BeautifulSoup.__init__
+        
+        def counting_init(soup, *args, **kwargs):
+            parses.append(kwargs.get('parse_only'))
+            original_init(soup, *args, **kwargs)
+        
+        monkeypatch.setattr(BeautifulSoup, '__init__', counting_init)
+        items = SelectorFetcher(self.make_spec()).parse(page)
+        
+        assert [item.published for item in items] == [
+            "2025-10-18T08:00:00+00:00", "2025-10-17T12:00:00+00:00"
+        ]
+        assert len(parses) == 1
+    
+    def test_missing_spec_is_rejected(self):
+        """Test that SelectorFetcher cannot be built without a spec."""
+        with pytest.raises(ValueError):
+            SelectorFetcher()
@@ -0,0 +1,62 @@
+"""
+Unit tests for the shared JSON state file base class.
+"""
+
+import json
+
+import pytest
+
+from collector.seen import SeenItemsStore
+from collector.state import JSONStateFile
+
+
+class SettingsFile(JSONStateFile):
+    """State file of named values."""
+    
+    DESCRIPTION = 'settings file'
+    
+    def set(self, name, value):
+        with self._lock:
+            self._load()[name] = value
+            self._dirty = True
+
+
+class TestJSONStateFile:
+    """Test cases for JSONStateFile."""
+    
+    def test_round_trip_and_clean_save(self, tmp_path):
+        """Test that changes are written and an unchanged file is not rewritten."""
+        path = tmp_path / "settings.json"
+        settings = SettingsFile(path)
+        settings.save()
+        assert not path.exists()
+        
+        settings.set("runs", 1)
+        settings.save()
+        mtime = path.stat().st_mtime_ns
+        settings.save()
+        
+        assert json.loads(path.read_text(encoding='utf-8')) == {"runs": 1}
+        assert path.stat().st_mtime_ns == mtime
+    
+    def test_failed_save_keeps_previous_file(self, tmp_path):
+        """Test that a write interrupted midway leaves the old file intact."""
+        path = tmp_path / "settings.json"
+        settings = SettingsFile(path)
+        settings.set("runs", 1)
+        settings.save()
+        before = path.read_bytes()
+        
+        settings.set("zzz", object())  # not serializable, fails after "runs" is written
+        with pytest.raises(TypeError):
+            settings.save()
+        
+        assert path.read_bytes() == before
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["settings.json"]
+    
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        """Test that a corrupt file starts an empty store instead of failing."""
+        path = tmp_path / "seen_items.json"
+        path.write_text('{"truncated', encoding='utf-8')
+        
+        assert len(SeenItemsStore(path)) == 0
@@ -0,0 +1,41 @@
+"""
+Unit tests for URL canonicalization.
+"""
+
+import pytest
+
+from collector.urls import canonicalize_url, url_key
+
+
+class TestCanonicalizeURL:
+    """Test cases for canonicalize_url and url_key."""
+    
+    @pytest.mark.parametrize("url, expected", [
+        ("http://Example.com/a?utm_source=x&b=2&a=1#top", "https://example.com/a?a=1&b=2"),
+        ("https://example.com:443/a?fbclid=abc", "https://example.com/a"),
+        ("https://example.com:8080/a", "https://example.com:8080/a"),
+        ("https://arxiv.org/pdf/2510.00001v2", "https://arxiv.org/abs/2510.00001"),
+        ("http://export.arxiv.org/abs/2510.00001v3", "https://arxiv.org/abs/2510.00001"),
+        ("https://arxiv.org/pdf/cs/0112017v1.pdf", "https://arxiv.org/abs/cs/0112017"),
+        ("https://old.reddit.com/r/x/comments/1/", "https://www.reddit.com/r/x/comments/1/"),
+        ("//cdn.example.com/story", "https://cdn.example.com/story"),
+    ])
+    def test_canonical_form(self, url, expected):
+        """Test that common link variants are rewritten to one form."""
+        assert canonicalize_url(url) == expected
+    
+    def test_non_http_links_unchanged(self):
+        """Test that links the canonicalizer does not understand pass through."""
+        assert canonicalize_url(" mailto:news@example.com ") == "mailto:news@example.com"
+        assert canonicalize_url("/relative/path") == "/relative/path"
+        assert canonicalize_url("") == ""
+    
+    def test_url_key_ignores_www_and_trailing_slash(self):
+        """Test that the dedup key folds variants that are kept in published links."""
+        assert url_key("https://www.example.com/story/") == url_key("http://example.com/story")
+        assert url_key("https://example.com/story?id=1") != url_key("https://example.com/story?id=2")
+    
+    def test_meaningful_params_are_kept(self):
+        """Test that parameters selecting content, such as a branch, stay part of the key."""
+        assert url_key("https://github.com/x/y?ref=main") != url_key("https://github.com/x/y")
+        assert url_key("https://example.com/a?utm_source=x") == url_key("https://example.com/a")
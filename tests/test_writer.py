@@ -0,0 +1,139 @@
+"""
+Unit tests for atomic output writing.
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from collector.models import NewsItem, CollectionResult
+from collector.collector import NewsCollector
+from collector.writer import compressed_siblings, link_atomic, supported_encodings, write_atomic
+
+
+class TestAtomicWriter:
+    """Test cases for write_atomic and link_atomic."""
+    
+    def test_streams_chunks_into_place(self, tmp_path):
+        """Test that chunks end up in the target and no temp file is left behind."""
+        path = tmp_path / "out.json"
+        
+        assert write_atomic(path, iter(['{"a": ', '1}']))
+        
+        assert path.read_text(encoding='utf-8') == '{"a": 1}'
+        assert os.listdir(tmp_path) == ["out.json"]
+    
+    def test_unchanged_content_is_not_rewritten(self, tmp_path):
+        """Test that identical content leaves the file untouched."""
+        path = tmp_path / "out.json"
+        write_atomic(path, ['same'])
+        inode = path.stat().st_ino
+        
+        assert not write_atomic(path, ['same'])
+        assert path.stat().st_ino == inode
+        assert write_atomic(path, ['different'])
+    
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """Test that an error while streaming never exposes a partial file."""
+        path = tmp_path / "out.json"
+        write_atomic(path, ['old content'])
+        
+        def chunks():
+            yield 'partial'
+            raise RuntimeError("encoder failed")
+        
+        with pytest.raises(RuntimeError):
+            write_atomic(path, chunks())
+        
+        assert path.read_text(encoding='utf-8') == 'old content'
+        assert os.listdir(tmp_path) == ["out.json"]
+    
+    def test_link_shares_content_without_copying(self, tmp_path):
+        """Test that linked files hold the same content and survive a rewrite of the source."""
+        source, target = tmp_path / "2025-10-19.json", tmp_path / "today.json"
+        target.write_text('stale', encoding='utf-8')
+        
+        write_atomic(source, ['fresh'], links=[target])
+        
+        assert target.read_text(encoding='utf-8') == 'fresh'
+        assert os.path.samefile(source, target)
+        
+        write_atomic(source, ['newer'])
+        assert target.read_text(encoding='utf-8') == 'fresh'
+        
+        link_atomic(source, target)
+        assert target.read_text(encoding='utf-8') == 'newer'
+
+
+class TestStreamedResult:
+    """Test cases for streaming CollectionResult output."""
+    
+    def test_iter_json_matches_to_json(self):
+        """Test that the streamed encoding is identical to to_json()."""
+        result = CollectionResult(date="2025-10-19", last_updated="2025-10-19T10:00:00Z")
+        result.add_source_items("src", [
+            NewsItem("Ünïcode title", "Summary", "https://example.com/1", "2025-10-19T10:00:00Z", "src")
+        ])
+        
+        assert ''.join(result.iter_json()) == result.to_json()
+    
+    def test_generate_json_updates_today_in_same_pass(self, tmp_path):
+        """Test that generate_json can write today.json alongside the day file."""
+        collector = NewsCollector(data_dir=str(tmp_path), use_seen_store=False)
+        result = CollectionResult(date="2025-10-19", last_updated="2025-10-19T10:00:00Z")
+        result.add_source_items("src", [])
+        
+        filepath = collector.generate_json(result, "2025-10-19.json", update_today=True)
+        
+        today = json.loads((tmp_path / "today.json").read_text(encoding='utf-8'))
+        assert today['date'] == "2025-10-19"
+        assert os.path.samefile(filepath, tmp_path / "today.json")
+
+
+class TestCompressedOutput:
+    """Test cases for minified and precompressed variants."""
+    
+    def test_gzip_sibling_written_in_same_pass(self, tmp_path):
+        """Test that the .gz variant decompresses to the same bytes and is reproducible."""
+        path = tmp_path / "out.json"
+        
+        write_atomic(path, ['{"a": ', '1}'], encodings=['gzip'])
+        first = (tmp_path / "out.json.gz").read_bytes()
+        
+        assert gzip.decompress(first) == path.read_bytes()
+        
+        write_atomic(path, ['{"a": 2}'], encodings=['gzip'])
+        write_atomic(path, ['{"a": ', '1}'], encodings=['gzip'])
+        assert (tmp_path / "out.json.gz").read_bytes() == first
+    
+    def test_stale_sibling_removed(self, tmp_path):
+        """Test that a variant that is no longer produced does not go stale."""
+        path = tmp_path / "out.json"
+        write_atomic(path, ['old'], encodings=['gzip'])
+        
+        write_atomic(path, ['new'])
+        
+        assert compressed_siblings(path) == []
+    
+    def test_unknown_encoding_rejected(self):
+        """Test that typos in encoding names fail loudly."""
+        with pytest.raises(ValueError):
+            supported_encodings(['zstd'])
+    
+    def test_minified_compressed_collection(self, tmp_path):
+        """Test that the collector writes minified JSON plus variants for today.json too."""
+        collector = NewsCollector(data_dir=str(tmp_path), use_seen_store=False,
+                                  minify=True, compression=['gzip'])
+        result = CollectionResult(date="2025-10-19", last_updated="2025-10-19T10:00:00Z")
+        result.add_source_items("src", [
+            NewsItem("Title", "Summary", "https://example.com/1", "2025-10-19T10:00:00Z", "src")
+        ])
+        
+        collector.generate_json(result, "2025-10-19.json", update_today=True)
+        
+        content = (tmp_path / "2025-10-19.json").read_text(encoding='utf-8')
+        assert '\n' not in content
+        assert json.loads(content) == result.to_dict()
+        assert gzip.decompress((tmp_path / "today.json.gz").read_bytes()) == content.encode('utf-8')
@@ -21,7 +21,10 @@ const CONFIG = {
         return `${window.location.origin}${basePath}/data`;
     })(),
     CACHE_EXPIRY: 12 * 60 * 60 * 1000, // 12 hours in milliseconds
-    CACHE_PREFIX: 'eternal_'
+    CACHE_PREFIX: 'eternal_',
+    // Per-source files are only written with --split-sources; without them the full day file is used
+    TODAY_HEADER: 'today.header.json',
+    LAZY_ROOT_MARGIN: '200px' // start fetching a source shortly before it scrolls into view
 };
 
 // ===== Application State =====
@@ -30,7 +33,9 @@ const AppState = {
     currentDate: null,
     cachedData: null,
     isOnline: navigator.onLine,
-    availableDates: []
+    availableDates: [],
+    // Whether index.json lists per-source files; null until index.json was read
+    splitSources: null
 };
 
 // ===== DOM Elements =====
@@ -250,6 +255,7 @@ async function fetchAvailableDates() {
         }
         const data = await response.json();
         cacheData('index', data);
+        AppState.splitSources = data.split_sources === true;
         return data.available_dates || [];
     } catch (error) {
         console.error('Failed to fetch available dates:', error);
@@ -258,6 +264,7 @@ async function fetchAvailableDates() {
         const cached = getCachedData('index');
         if (cached) {
             console.log('Using cached index data');
+            AppState.splitSources = cached.split_sources === true;
             return cached.available_dates || [];
         }
         
@@ -265,6 +272,70 @@ async function fetchAvailableDates() {
     }
 }
 
+/**
+ * Check index.json for per-source files, so deployments without them
+ * never request a header that does not exist
+ */
+async function hasSplitSources() {
+    if (AppState.splitSources === null) {
+        try {
+            await fetchAvailableDates();
+        } catch (error) {
+            AppState.splitSources = false;
+        }
+    }
+    return AppState.splitSources;
+}
+
+/**
+ * Fetch the header of a day split into per-source files.
+ * Resolves to null when the day was not split (or the network fails),
+ * so callers can fall back to the full day file.
+ */
+async function fetchSourceHeader(path) {
+    const url = `${CONFIG.API_BASE}/${path}`;
+    
+    try {
+        const response = await fetch(url);
+        if (!response.ok) {
+            return null;
+        }
+        return await response.json();
+    } catch (error) {
+        console.warn(`No per-source header at ${url}:`, error);
+        return null;
+    }
+}
+
+/**
+ * Fetch the items of one source from its per-source file
+ */
+async function fetchSourceItems(file) {
+    const url = `${CONFIG.API_BASE}/${file}`;
+    console.log(`Fetching source items from: ${url}`);
+    
+    try {
+        const response = await fetch(url);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        const items = await response.json();
+        cacheData(`source_${file}`, items);
+        return items;
+    } catch (error) {
+        console.error(`Failed to fetch ${file}:`, error);
+        
+        // Try to use cached data
+        const cached = getCachedData(`source_${file}`);
+        if (cached) {
+            console.log(`Using cached data for ${file}`);
+            return cached;
+        }
+        
+        throw error;
+    }
+}
+
 // ===== Rendering Functions =====
 
 /**
@@ -307,9 +378,84 @@ function renderNews(data) {
 }
 
 /**
- * Render a source group with its news items
+ * Render news from a per-source header: counts and section headers
+ * appear at once, and each source's items are fetched when its section
+ * comes into view.
  */
-function renderSourceGroup(sourceName, items) {
+function renderNewsLazily(header) {
+    hideError();
+    elements.newsContainer.innerHTML = '';
+    
+    if (!header || !header.sources) {
+        showError('No news data available');
+        return;
+    }
+    
+    if (header.last_updated) {
+        updateLastUpdatedTime(header.last_updated);
+    }
+    
+    let totalItems = 0;
+    Object.values(header.sources).forEach(source => {
+        totalItems += source.items;
+    });
+    updateItemCount(totalItems);
+    
+    const pending = new Map();
+    const loadSection = (section) => {
+        const load = pending.get(section);
+        if (load) {
+            pending.delete(section);
+            load();
+        }
+    };
+    
+    const observer = 'IntersectionObserver' in window
+        ? new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    loadSection(entry.target);
+                }
+            });
+        }, { rootMargin: CONFIG.LAZY_ROOT_MARGIN })
+        : null;
+    
+    Object.keys(header.sources).sort().forEach(sourceName => {
+        const source = header.sources[sourceName];
+        if (!source.items) {
+            return;
+        }
+        
+        const { section, grid } = createSourceSection(sourceName, source.items);
+        grid.innerHTML = '<p class="text-center">Loading...</p>';
+        
+        pending.set(section, async () => {
+            try {
+                const items = await fetchSourceItems(source.file);
+                grid.innerHTML = '';
+                items.forEach(item => grid.appendChild(createNewsCard(item)));
+            } catch (error) {
+                grid.innerHTML = '<p class="text-center">Failed to load this source. Please try again.</p>';
+            }
+        });
+        
+        if (observer) {
+            observer.observe(section);
+        } else {
+            loadSection(section);
+        }
+    });
+    
+    if (totalItems === 0) {
+        elements.newsContainer.innerHTML = '<p class="text-center">No news items available for this date.</p>';
+    }
+}
+
+/**
+ * Create an (empty) section for a source and add it to the page
+ */
+function createSourceSection(sourceName, itemCount) {
     const section = document.createElement('div');
     section.className = 'source-section';
     
@@ -323,23 +469,32 @@ function renderSourceGroup(sourceName, items) {
     
     const count = document.createElement('span');
     count.className = 'source-count';
-    count.textContent = `${items.length} items`;
+    count.textContent = `${itemCount} items`;
     
     header.appendChild(title);
     header.appendChild(count);
     section.appendChild(header);
     
-    // Create grid of news cards
+    // Create grid for the news cards
     const grid = document.createElement('div');
     grid.className = 'news-grid';
     
+    section.appendChild(grid);
+    elements.newsContainer.appendChild(section);
+    
+    return { section, grid };
+}
+
+/**
+ * Render a source group with its news items
+ */
+function renderSourceGroup(sourceName, items) {
+    const { grid } = createSourceSection(sourceName, items.length);
+    
     items.forEach(item => {
         const card = createNewsCard(item);
         grid.appendChild(card);
     });
-    
-    section.appendChild(grid);
-    elements.newsContainer.appendChild(section);
 }
 
 /**
@@ -440,6 +595,13 @@ async function loadTodayNews() {
     showLoading();
     
     try {
+        const header = await hasSplitSources() ? await fetchSourceHeader(CONFIG.TODAY_HEADER) : null;
+        if (header) {
+            renderNewsLazily(header);
+            AppState.cachedData = header;
+            return;
+        }
+        
         const data = await fetchTodayNews();
         renderNews(data);
         AppState.cachedData = data;
@@ -495,6 +657,14 @@ async function loadDateNews(date) {
     showLoading();
     
     try {
+        const header = await hasSplitSources() ? await fetchSourceHeader(`${date}/header.json`) : null;
+        if (header) {
+            renderNewsLazily(header);
+            AppState.cachedData = header;
+            AppState.currentDate = date;
+            return;
+        }
+        
         const data = await fetchDateNews(date);
         renderNews(data);
         AppState.cachedData = data;